@@ -0,0 +1,34 @@
+from benchmarks.baseline import Comparison, compare, load_baseline, save_baseline
+from benchmarks.data import (
+    PARAMS_GRID,
+    SCALES,
+    Scale,
+    SyntheticConfig,
+    get_indics,
+    get_pct_returns,
+    get_returns_df,
+)
+from benchmarks.functions import BenchmarkInputs, get_functions, run_functions
+from benchmarks.pipeline import measure_pipeline, run_pipeline
+from benchmarks.timing import BenchmarkResult, measure
+
+__all__: list[str] = [
+    "BenchmarkInputs",
+    "BenchmarkResult",
+    "Comparison",
+    "PARAMS_GRID",
+    "SCALES",
+    "Scale",
+    "SyntheticConfig",
+    "compare",
+    "get_functions",
+    "get_indics",
+    "get_pct_returns",
+    "get_returns_df",
+    "load_baseline",
+    "measure",
+    "measure_pipeline",
+    "run_functions",
+    "run_pipeline",
+    "save_baseline",
+]
@@ -0,0 +1,85 @@
+import sys
+from argparse import ArgumentParser, Namespace
+from pathlib import Path
+from tempfile import TemporaryDirectory
+
+from benchmarks.baseline import Comparison, compare, load_baseline, save_baseline
+from benchmarks.data import SCALES, Scale
+from benchmarks.functions import BenchmarkInputs, run_functions
+from benchmarks.pipeline import STAGES, measure_pipeline
+from benchmarks.timing import BenchmarkResult
+
+DEFAULT_BASELINE: Path = Path(__file__).resolve().parent / "baseline.json"
+
+
+def get_parser() -> ArgumentParser:
+    parser = ArgumentParser(prog="benchmarks")
+    parser.add_argument("command", choices=["run", "compare"])
+    parser.add_argument(
+        "--scales", nargs="+", choices=list(Scale), default=[Scale.SMALL]
+    )
+    parser.add_argument("--repeat", type=int, default=5)
+    parser.add_argument("--filter", default="")
+    parser.add_argument("--no-functions", action="store_true")
+    parser.add_argument("--no-pipeline", action="store_true")
+    parser.add_argument("--baseline", type=Path, default=DEFAULT_BASELINE)
+    parser.add_argument("--output", type=Path, default=None)
+    parser.add_argument("--threshold", type=float, default=0.15)
+    return parser
+
+
+def run(arguments: Namespace) -> list[BenchmarkResult]:
+    results: list[BenchmarkResult] = []
+    for scale in arguments.scales:
+        if not arguments.no_functions:
+            with TemporaryDirectory() as directory:
+                inputs = BenchmarkInputs(
+                    config=SCALES[Scale(scale)], directory=Path(directory)
+                )
+                for result in run_functions(
+                    inputs=inputs,
+                    scale=scale,
+                    repeat=arguments.repeat,
+                    pattern=arguments.filter,
+                ):
+                    print(result, flush=True)
+                    results.append(result)
+        if not arguments.no_pipeline and any(
+            arguments.filter in f"pipeline.{stage}" for stage in STAGES
+        ):
+            for result in measure_pipeline(
+                config=SCALES[Scale(scale)], scale=scale, repeat=arguments.repeat
+            ):
+                if arguments.filter not in result.name:
+                    continue
+                print(result, flush=True)
+                results.append(result)
+    return results
+
+
+def main() -> int:
+    arguments: Namespace = get_parser().parse_args()
+    if arguments.command == "run":
+        output: Path = arguments.output or arguments.baseline
+        save_baseline(path=output, results=run(arguments=arguments))
+        print(f"Baseline saved to {output}")
+        return 0
+    baseline: list[BenchmarkResult] = load_baseline(path=arguments.baseline)
+    current: list[BenchmarkResult] = run(arguments=arguments)
+    if arguments.output is not None:
+        save_baseline(path=arguments.output, results=current)
+    comparisons: list[Comparison] = compare(
+        baseline=baseline, current=current, threshold=arguments.threshold
+    )
+    print("\nComparison against baseline:")
+    for comparison in comparisons:
+        print(comparison)
+    regressions: list[Comparison] = [
+        comparison for comparison in comparisons if comparison.regressed
+    ]
+    print(f"\n{len(regressions)} regression(s) above {arguments.threshold:.0%}")
+    return 1 if regressions else 0
+
+
+if __name__ == "__main__":
+    sys.exit(main())
@@ -0,0 +1,88 @@
+import json
+import os
+import platform
+import sys
+from pathlib import Path
+from typing import Any, NamedTuple
+
+from benchmarks.timing import BenchmarkResult
+
+BASELINE_VERSION: int = 1
+
+
+class Comparison(NamedTuple):
+    key: str
+    baseline: float
+    current: float
+    threshold: float
+
+    @property
+    def ratio(self) -> float:
+        return self.current / self.baseline if self.baseline > 0 else float("inf")
+
+    @property
+    def regressed(self) -> bool:
+        return self.ratio > 1.0 + self.threshold
+
+    @property
+    def improved(self) -> bool:
+        return self.ratio < 1.0 / (1.0 + self.threshold)
+
+    def __str__(self) -> str:
+        status: str = (
+            "REGRESSION"
+            if self.regressed
+            else "improved" if self.improved else "ok"
+        )
+        return (
+            f"{self.key:<60} {self.baseline * 1e3:>10.3f} ms -> "
+            f"{self.current * 1e3:>10.3f} ms  x{self.ratio:.2f}  {status}"
+        )
+
+
+def get_machine() -> dict[str, Any]:
+    return {
+        "python": sys.version.split()[0],
+        "platform": platform.platform(),
+        "processor": platform.processor(),
+        "cpu_count": os.cpu_count(),
+    }
+
+
+def save_baseline(path: Path, results: list[BenchmarkResult]) -> None:
+    data: dict[str, Any] = {
+        "version": BASELINE_VERSION,
+        "machine": get_machine(),
+        "results": [result._asdict() for result in results],
+    }
+    path.parent.mkdir(parents=True, exist_ok=True)
+    with open(path, "w") as file:
+        json.dump(data, file, indent=3)
+
+
+def load_baseline(path: Path) -> list[BenchmarkResult]:
+    with open(path, "r") as file:
+        data: dict[str, Any] = json.load(file)
+    if data.get("version") != BASELINE_VERSION:
+        raise ValueError(
+            f"Baseline version {data.get('version')} does not match {BASELINE_VERSION}"
+        )
+    return [BenchmarkResult(**result) for result in data["results"]]
+
+
+def compare(
+    baseline: list[BenchmarkResult],
+    current: list[BenchmarkResult],
+    threshold: float,
+) -> list[Comparison]:
+    reference: dict[str, BenchmarkResult] = {result.key: result for result in baseline}
+    return [
+        Comparison(
+            key=result.key,
+            baseline=reference[result.key].best,
+            current=result.best,
+            threshold=threshold,
+        )
+        for result in current
+        if result.key in reference
+    ]
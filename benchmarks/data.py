@@ -0,0 +1,166 @@
+from dataclasses import dataclass, field
+from datetime import date, timedelta
+from enum import StrEnum
+
+import numpy as np
+import polars as pl
+
+import numquant as nq
+import tradeframe as tf
+from outquantlab.core import IndicsConfig
+from outquantlab.indicators import INDICATOR_REGISTRY, GenericIndic
+from outquantlab.indicators.indics_normalized import (
+    CentralPriceMacd,
+    CentralPriceMacdTrend,
+    CentralPriceRatio,
+    DirectionalVolatility,
+    FixedBias,
+    MeanPriceMacd,
+    MeanPriceMacdTrend,
+    MeanPriceRatio,
+    MeanPriceRatioNormalised,
+    MeanPriceRatioNormalisedTrend,
+    MeanRateOfChange,
+    MeanRateOfChangeMacd,
+    MeanRateOfChangeMacdTrend,
+    MeanRateOfChangeNormalised,
+    MeanRateOfChangeNormalisedTrend,
+    MedianPriceMacd,
+    MedianPriceMacdTrend,
+    MedianPriceRatio,
+    MedianRateOfChange,
+    MedianRateOfChangeMacd,
+    MedianRateOfChangeMacdTrend,
+    NormalisedDirectionalVolatility,
+    NormalisedDirectionalVolatilityTrend,
+    RelativeDirectionalVolatility,
+    RelativeDirectionalVolatilityTrend,
+    RelativeSkewness,
+    RelativeSkewnessOnKurtosis,
+    RelativeSkewnessOnKurtosisTrend,
+    RelativeSkewnessTrend,
+    Skewness,
+    SkewnessOnKurtosis,
+    SkewnessOnKurtosisTrend,
+    SkewnessTrend,
+)
+
+START_DATE = date(2000, 1, 3)
+
+TREND_GRID: list[list[int]] = [[4, 8], [32, 64]]
+ACCELERATION_GRID: list[list[int]] = [[4, 8], [32, 64], [8, 16]]
+ACCELERATION_TREND_GRID: list[list[int]] = [[4, 8], [32, 64], [4, 8], [32, 64], [8]]
+SMOOTHED_GRID: list[list[int]] = [[2, 4], [16, 32, 128]]
+NORMALIZED_SMOOTHED_GRID: list[list[int]] = [[2, 4], [16, 32], [64]]
+NORMALIZED_SMOOTHED_TREND_GRID: list[list[int]] = [[2], [16, 32], [64], [4], [32]]
+SMOOTHED_TREND_GRID: list[list[int]] = [[2, 4], [16], [4, 8], [32, 64]]
+VOLATILITY_GRID: list[list[int]] = [[2, 4], [16], [32]]
+VOLATILITY_TREND_GRID: list[list[int]] = [[4], [32], [2, 4], [16], [32]]
+
+PARAMS_GRID: dict[type[GenericIndic], list[list[int]]] = {
+    MeanPriceRatio: TREND_GRID,
+    MedianPriceRatio: TREND_GRID,
+    CentralPriceRatio: TREND_GRID,
+    MeanRateOfChange: TREND_GRID,
+    MedianRateOfChange: TREND_GRID,
+    MeanPriceMacd: ACCELERATION_GRID,
+    MedianPriceMacd: ACCELERATION_GRID,
+    CentralPriceMacd: ACCELERATION_GRID,
+    MeanRateOfChangeMacd: ACCELERATION_GRID,
+    MedianRateOfChangeMacd: ACCELERATION_GRID,
+    MeanPriceMacdTrend: ACCELERATION_TREND_GRID,
+    MedianPriceMacdTrend: ACCELERATION_TREND_GRID,
+    CentralPriceMacdTrend: ACCELERATION_TREND_GRID,
+    MeanRateOfChangeMacdTrend: ACCELERATION_TREND_GRID,
+    MedianRateOfChangeMacdTrend: ACCELERATION_TREND_GRID,
+    FixedBias: [[1]],
+    MeanPriceRatioNormalised: SMOOTHED_GRID,
+    MeanRateOfChangeNormalised: SMOOTHED_GRID,
+    MeanRateOfChangeNormalisedTrend: SMOOTHED_TREND_GRID,
+    MeanPriceRatioNormalisedTrend: SMOOTHED_TREND_GRID,
+    Skewness: SMOOTHED_GRID,
+    RelativeSkewness: NORMALIZED_SMOOTHED_GRID,
+    SkewnessOnKurtosis: SMOOTHED_GRID,
+    RelativeSkewnessOnKurtosis: NORMALIZED_SMOOTHED_GRID,
+    SkewnessTrend: SMOOTHED_TREND_GRID,
+    RelativeSkewnessTrend: NORMALIZED_SMOOTHED_TREND_GRID,
+    SkewnessOnKurtosisTrend: SMOOTHED_TREND_GRID,
+    RelativeSkewnessOnKurtosisTrend: NORMALIZED_SMOOTHED_TREND_GRID,
+    DirectionalVolatility: SMOOTHED_GRID,
+    RelativeDirectionalVolatility: VOLATILITY_GRID,
+    NormalisedDirectionalVolatility: VOLATILITY_GRID,
+    RelativeDirectionalVolatilityTrend: VOLATILITY_TREND_GRID,
+    NormalisedDirectionalVolatilityTrend: VOLATILITY_TREND_GRID,
+}
+
+
+class Scale(StrEnum):
+    SMALL = "small"
+    MEDIUM = "medium"
+    LARGE = "large"
+
+
+@dataclass(slots=True, frozen=True)
+class SyntheticConfig:
+    days: int
+    assets: int
+    seed: int = 42
+    nan_prefixes: tuple[int, ...] = (0, 30, 0, 250, 0, 0, 120, 0)
+    drift: float = 0.0003
+    volatility: float = 0.012
+    asset_names: list[str] = field(init=False, compare=False, hash=False)
+
+    def __post_init__(self) -> None:
+        object.__setattr__(
+            self, "asset_names", [f"ASSET_{i}" for i in range(self.assets)]
+        )
+
+    def get_nan_prefix(self, asset: int) -> int:
+        return min(self.nan_prefixes[asset % len(self.nan_prefixes)], self.days)
+
+
+SCALES: dict[Scale, SyntheticConfig] = {
+    Scale.SMALL: SyntheticConfig(days=1_000, assets=8),
+    Scale.MEDIUM: SyntheticConfig(days=2_500, assets=20),
+    Scale.LARGE: SyntheticConfig(days=5_000, assets=50),
+}
+
+
+def get_pct_returns(config: SyntheticConfig) -> nq.Float2D:
+    rng: np.random.Generator = np.random.default_rng(config.seed)
+    returns: nq.Float2D = rng.normal(
+        loc=config.drift, scale=config.volatility, size=(config.days, config.assets)
+    ).astype(nq.Float32)
+    for asset in range(config.assets):
+        returns[: config.get_nan_prefix(asset=asset), asset] = nq.Nan
+    return returns
+
+
+def get_returns_df(config: SyntheticConfig) -> tf.FrameDated:
+    dates = pl.Series(
+        "Date",
+        [START_DATE + timedelta(days=day) for day in range(config.days)],
+        dtype=pl.Date,
+    )
+    return tf.FrameDated.create_from_np(
+        data=get_pct_returns(config=config),
+        asset_names=config.asset_names,
+        dates=dates,
+    )
+
+
+def get_params_config() -> dict[str, dict[str, list[int]]]:
+    params_config: dict[str, dict[str, list[int]]] = {}
+    for name, cls in INDICATOR_REGISTRY.items():
+        params_config[name] = {
+            f"param_{i}": list(values) for i, values in enumerate(PARAMS_GRID[cls])
+        }
+    return params_config
+
+
+def get_indics() -> list[GenericIndic]:
+    config = IndicsConfig(
+        indics_active={name: True for name in INDICATOR_REGISTRY},
+        params_config=get_params_config(),
+    )
+    return config.get_indics_params()
@@ -0,0 +1,231 @@
+import inspect
+from collections.abc import Callable
+from dataclasses import dataclass, field
+from pathlib import Path
+from types import ModuleType
+from typing import Any
+
+import numquant as nq
+from benchmarks.data import SyntheticConfig, get_pct_returns
+from benchmarks.timing import ArgumentsBuilder, BenchmarkResult, measure
+
+MODULES: dict[str, ModuleType] = {
+    "roll": nq.metrics.roll,
+    "agg": nq.metrics.agg,
+    "arrays": nq.arrays,
+}
+
+WINDOW: int = 64
+LENGTHS: list[int] = [8, 16, 32, 64, 128, 256]
+TUPLE_LENGTH: int = 64
+GROUPS: int = 4
+
+
+@dataclass(slots=True)
+class BenchmarkInputs:
+    config: SyntheticConfig
+    directory: Path
+    pct_returns: nq.Float2D = field(init=False)
+    log_returns: nq.Float2D = field(init=False)
+    prices: nq.Float2D = field(init=False)
+    signal: nq.Float2D = field(init=False)
+
+    def __post_init__(self) -> None:
+        self.pct_returns = get_pct_returns(config=self.config)
+        self.prices = nq.arrays.get_prices(returns=self.pct_returns)
+        self.log_returns = nq.arrays.get_log_returns(prices=self.prices)
+        self.signal = nq.metrics.roll.get_mean(
+            array=self.log_returns, length=WINDOW, min_length=1
+        ) / nq.metrics.roll.get_volatility(
+            array=self.log_returns, length=WINDOW, min_length=2
+        )
+
+
+type ParameterBuilder = Callable[[BenchmarkInputs], Any]
+type OverrideBuilder = Callable[[BenchmarkInputs], dict[str, Any]]
+
+PARAMETERS: dict[str, ParameterBuilder] = {
+    "array": lambda inputs: inputs.log_returns.copy(),
+    "returns_array": lambda inputs: inputs.pct_returns.copy(),
+    "adjusted_returns": lambda inputs: inputs.pct_returns.copy(),
+    "returns": lambda inputs: inputs.pct_returns.copy(),
+    "prices": lambda inputs: inputs.prices.copy(),
+    "original": lambda inputs: inputs.log_returns.copy(),
+    "buffer": lambda inputs: inputs.prices.copy(),
+    "factor": lambda inputs: inputs.pct_returns.copy(),
+    "model": lambda inputs: inputs.pct_returns.copy(),
+    "top": lambda inputs: inputs.pct_returns.copy(),
+    "bottom": lambda inputs: inputs.pct_returns.copy(),
+    "base_array": lambda inputs: inputs.log_returns.copy(),
+    "array_filler": lambda inputs: inputs.pct_returns.copy(),
+    "nominator": lambda inputs: inputs.prices.copy(),
+    "denominator": lambda inputs: inputs.prices.copy(),
+    "metric": lambda inputs: inputs.log_returns.copy(),
+    "signal": lambda inputs: inputs.signal.copy(),
+    "signal_array": lambda inputs: inputs.signal.copy(),
+    "raw_signal": lambda inputs: inputs.signal.copy(),
+    "trend_signal": lambda inputs: inputs.signal.copy(),
+    "indicator_signal": lambda inputs: inputs.signal.copy(),
+    "length": lambda inputs: WINDOW,
+    "window_length": lambda inputs: WINDOW,
+    "lengths": lambda inputs: LENGTHS,
+    "min_length": lambda inputs: 4,
+    "frequency": lambda inputs: 20,
+    "ascending": lambda inputs: True,
+    "axis": lambda inputs: 0,
+    "fill_value": lambda inputs: nq.Float32(0.0),
+}
+
+SHAPE_PARAMETERS: dict[str, ParameterBuilder] = {
+    "length": lambda inputs: inputs.config.days,
+    "width": lambda inputs: inputs.config.assets,
+}
+
+
+def _get_tuple_1d(inputs: BenchmarkInputs) -> dict[str, Any]:
+    return {"data": tuple(float(value) for value in inputs.prices[:TUPLE_LENGTH, 0])}
+
+
+def _get_tuple_2d(inputs: BenchmarkInputs) -> dict[str, Any]:
+    return {
+        "data": tuple(
+            tuple(float(value) for value in row)
+            for row in inputs.prices[:TUPLE_LENGTH]
+        )
+    }
+
+
+def _get_convert(inputs: BenchmarkInputs) -> dict[str, Any]:
+    return {"data": inputs.pct_returns.astype(nq.Float64)}
+
+
+def _get_memmap(inputs: BenchmarkInputs) -> dict[str, Any]:
+    path: Path = inputs.directory / "memmap.bin"
+    if not path.exists():
+        nq.arrays.create_memmap(
+            path=path, length=inputs.config.days, width=inputs.config.assets
+        )
+    return {
+        "path": path,
+        "length": inputs.config.days,
+        "width": inputs.config.assets,
+    }
+
+
+def _get_buffer(inputs: BenchmarkInputs) -> dict[str, Any]:
+    return {
+        "buffer": memoryview(bytearray(inputs.pct_returns.nbytes)),
+        "length": inputs.config.days,
+        "width": inputs.config.assets,
+    }
+
+
+def _get_save_file(inputs: BenchmarkInputs) -> dict[str, Any]:
+    return {"path": inputs.directory / "array.npy", "array": inputs.pct_returns}
+
+
+def _get_load_file(inputs: BenchmarkInputs) -> dict[str, Any]:
+    path: Path = inputs.directory / "array.npy"
+    if not path.exists():
+        nq.arrays.save_file(path=path, array=inputs.pct_returns)
+    return {"path": path}
+
+
+def _get_scalar_extension(inputs: BenchmarkInputs) -> dict[str, Any]:
+    split: int = inputs.config.days // 2
+    return {
+        "raw_signal": inputs.signal[split:].copy(),
+        "state": nq.metrics.roll.get_scalar_state(raw_signal=inputs.signal[:split]),
+    }
+
+
+def _get_fill_normalized(inputs: BenchmarkInputs) -> dict[str, Any]:
+    return {
+        "raw_signal": inputs.signal.copy(),
+        "adjusted_returns": inputs.pct_returns.copy(),
+        "output": nq.arrays.create_empty_like(model=inputs.pct_returns),
+    }
+
+
+def _get_accumulation(inputs: BenchmarkInputs) -> dict[str, Any]:
+    return {
+        "block": inputs.signal,
+        "sums": nq.metrics.agg.create_accumulator(
+            length=inputs.config.days, width=GROUPS
+        ),
+        "counts": nq.metrics.agg.create_accumulator(
+            length=inputs.config.days, width=GROUPS
+        ),
+    }
+
+
+def _get_grouped(inputs: BenchmarkInputs) -> dict[str, Any]:
+    arguments: dict[str, Any] = _get_accumulation(inputs=inputs)
+    nq.metrics.agg.accumulate_groups(**arguments)
+    return {"sums": arguments["sums"], "counts": arguments["counts"]}
+
+
+OVERRIDES: dict[str, OverrideBuilder] = {
+    "arrays.create_1dim": _get_tuple_1d,
+    "arrays.create_2dim": _get_tuple_2d,
+    "arrays.convert": _get_convert,
+    "arrays.create_memmap": _get_memmap,
+    "arrays.open_memmap": _get_memmap,
+    "arrays.create_from_buffer": _get_buffer,
+    "arrays.save_file": _get_save_file,
+    "arrays.load_file": _get_load_file,
+    "roll.extend_scalar_normalisation": _get_scalar_extension,
+    "roll.fill_normalized_returns": _get_fill_normalized,
+    "agg.accumulate_groups": _get_accumulation,
+    "agg.get_grouped_mean": _get_grouped,
+}
+
+
+def get_functions() -> dict[str, Callable[..., Any]]:
+    functions: dict[str, Callable[..., Any]] = {}
+    for prefix, module in MODULES.items():
+        for name in module.__all__:
+            member: Any = getattr(module, name)
+            if inspect.isfunction(getattr(member, "py_func", member)):
+                functions[f"{prefix}.{name}"] = member
+    return functions
+
+
+def get_builder(
+    name: str, func: Callable[..., Any], inputs: BenchmarkInputs
+) -> ArgumentsBuilder:
+    if name in OVERRIDES:
+        override: OverrideBuilder = OVERRIDES[name]
+        return lambda: override(inputs)
+    parameters: list[inspect.Parameter] = list(
+        inspect.signature(func).parameters.values()
+    )
+    names: set[str] = {parameter.name for parameter in parameters}
+    builders: dict[str, ParameterBuilder] = {}
+    for parameter in parameters:
+        if "width" in names and parameter.name in SHAPE_PARAMETERS:
+            builders[parameter.name] = SHAPE_PARAMETERS[parameter.name]
+        elif parameter.name in PARAMETERS:
+            builders[parameter.name] = PARAMETERS[parameter.name]
+        elif parameter.default is inspect.Parameter.empty:
+            raise KeyError(f"No benchmark input for {name}({parameter.name})")
+    return lambda: {key: build(inputs) for key, build in builders.items()}
+
+
+def run_functions(
+    inputs: BenchmarkInputs, scale: str, repeat: int, pattern: str = ""
+) -> list[BenchmarkResult]:
+    results: list[BenchmarkResult] = []
+    for name, func in get_functions().items():
+        if pattern not in name:
+            continue
+        results.append(
+            measure(
+                name=name,
+                scale=scale,
+                func=func,
+                build=get_builder(name=name, func=func, inputs=inputs),
+                repeat=repeat,
+            )
+        )
+    return results
@@ -0,0 +1,47 @@
+import time
+from statistics import median
+
+import numquant as nq
+import outquantlab as oql
+import tradeframe as tf
+from benchmarks.data import SyntheticConfig, get_indics, get_returns_df
+from benchmarks.timing import BenchmarkResult
+
+STAGES: list[str] = ["backtest", "format_backtest", "get_portfolio", "total"]
+
+
+def run_pipeline(returns_df: tf.FrameDated) -> dict[str, float]:
+    lab = oql.OutQuantLab(indics=get_indics(), returns_df=returns_df)
+    timings: dict[str, float] = {}
+    start: float = time.perf_counter()
+    backtest: nq.Float2D = lab.backtest()
+    timings["backtest"] = time.perf_counter() - start
+    step: float = time.perf_counter()
+    data: tf.FrameCategoricalDated = lab.format_backtest(data=backtest)
+    timings["format_backtest"] = time.perf_counter() - step
+    step = time.perf_counter()
+    lab.get_portfolio(data=data)
+    timings["get_portfolio"] = time.perf_counter() - step
+    timings["total"] = time.perf_counter() - start
+    return timings
+
+
+def measure_pipeline(
+    config: SyntheticConfig, scale: str, repeat: int, warmup: int = 1
+) -> list[BenchmarkResult]:
+    returns_df: tf.FrameDated = get_returns_df(config=config)
+    for _ in range(warmup):
+        run_pipeline(returns_df=returns_df)
+    runs: list[dict[str, float]] = [
+        run_pipeline(returns_df=returns_df) for _ in range(repeat)
+    ]
+    return [
+        BenchmarkResult(
+            name=f"pipeline.{stage}",
+            scale=scale,
+            best=min(run[stage] for run in runs),
+            median=median(run[stage] for run in runs),
+            repeat=repeat,
+        )
+        for stage in STAGES
+    ]
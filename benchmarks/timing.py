@@ -0,0 +1,49 @@
+import time
+from collections.abc import Callable
+from statistics import median
+from typing import Any, NamedTuple
+
+type ArgumentsBuilder = Callable[[], dict[str, Any]]
+
+
+class BenchmarkResult(NamedTuple):
+    name: str
+    scale: str
+    best: float
+    median: float
+    repeat: int
+
+    @property
+    def key(self) -> str:
+        return f"{self.scale}/{self.name}"
+
+    def __str__(self) -> str:
+        return (
+            f"{self.key:<60} best {self.best * 1e3:>10.3f} ms "
+            f"median {self.median * 1e3:>10.3f} ms"
+        )
+
+
+def measure(
+    name: str,
+    scale: str,
+    func: Callable[..., Any],
+    build: ArgumentsBuilder,
+    repeat: int,
+    warmup: int = 1,
+) -> BenchmarkResult:
+    for _ in range(warmup):
+        func(**build())
+    timings: list[float] = []
+    for _ in range(repeat):
+        arguments: dict[str, Any] = build()
+        start: float = time.perf_counter()
+        func(**arguments)
+        timings.append(time.perf_counter() - start)
+    return BenchmarkResult(
+        name=name,
+        scale=scale,
+        best=min(timings),
+        median=median(timings),
+        repeat=repeat,
+    )
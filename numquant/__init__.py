@@ -5,6 +5,8 @@ from numquant.main import (
     Float2D,
     Float32,
     Int32,
+    Int8,
+    Sign2D,
     Nan,
     NPArray,
     Float64,
@@ -21,6 +23,8 @@ __all__: list[str] = [
     "Float2D",
     "Float32",
     "Int32",
+    "Int8",
+    "Sign2D",
     "Nan",
     "Float64",
     "arrays",
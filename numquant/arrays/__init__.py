@@ -3,14 +3,22 @@ from numquant.arrays.create import (
     create_2dim,
     create_empty,
     create_empty_like,
+    create_lagged,
     create_full,
     create_full_like,
     create_nan,
     create_nan_like,
     convert,
+    create_memmap,
+    open_memmap,
+    create_from_buffer,
+    save_file,
+    load_file,
 )
 from numquant.arrays.extract import (
     get_log_returns,
+    get_lagged_log_returns,
+    get_lagged_prices,
     get_pct_returns,
     get_prices,
     get_sorted_indices,
@@ -22,6 +30,9 @@ from numquant.arrays.transform import (
     fill_nan_with_data,
     reduce,
     shift,
+    get_lagged,
+    multiply_lagged,
+    concatenate,
     
 )
 
@@ -34,6 +45,12 @@ __all__: list[str] = [
     "create_nan_like",
     "reduce",
     "shift",
+    "create_lagged",
+    "get_lagged",
+    "multiply_lagged",
+    "get_lagged_prices",
+    "get_lagged_log_returns",
+    "concatenate",
     "create_full_like",
     "create_full",
     "create_empty_like",
@@ -45,4 +62,9 @@ __all__: list[str] = [
     "fill_nan_with_data",
     "convert",
     "get_index",
+    "create_memmap",
+    "open_memmap",
+    "create_from_buffer",
+    "save_file",
+    "load_file",
 ]
\ No newline at end of file
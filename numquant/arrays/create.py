@@ -1,3 +1,5 @@
+from pathlib import Path
+
 from numba import njit  # type: ignore
 
 from numquant.main import Float1D, Float2D, Float32, Nan, np, NPArray
@@ -18,6 +20,12 @@ def create_empty(length: int, width: int) -> Float2D:
     return np.empty(shape=(length, width), dtype=Float32)
 
 
+def create_lagged(length: int, width: int, lag: int = 1) -> Float2D:
+    buffer: Float2D = create_empty(length=length + lag, width=width)
+    buffer[:lag] = Nan
+    return buffer
+
+
 @njit
 def create_empty_like(model: Float2D) -> Float2D:
     return np.empty_like(model, dtype=Float32)
@@ -43,4 +51,30 @@ def create_nan_like(model: Float2D) -> Float2D:
     return np.full_like(model, fill_value=Nan, dtype=Float32)
 
 def convert(data: NPArray) -> Float2D:
-    return np.array(data, dtype=Float32)
\ No newline at end of file
+    return np.array(data, dtype=Float32)
+
+
+def create_memmap(path: Path, length: int, width: int) -> Float2D:
+    return np.memmap(
+        filename=path, dtype=Float32, mode="w+", shape=(length, width), order="F"
+    )
+
+
+def open_memmap(path: Path, length: int, width: int) -> Float2D:
+    return np.memmap(
+        filename=path, dtype=Float32, mode="r+", shape=(length, width), order="F"
+    )
+
+
+def create_from_buffer(buffer: memoryview, length: int, width: int) -> Float2D:
+    return np.ndarray(shape=(length, width), dtype=Float32, buffer=buffer)
+
+
+def save_file(path: Path, array: Float2D) -> None:
+    with open(path, "wb") as file:
+        np.save(file, array)
+
+
+def load_file(path: Path) -> Float2D:
+    array: Float2D = np.load(path, mmap_mode="r")
+    return array
@@ -1,4 +1,5 @@
-from numquant.arrays.create import create_empty_like
+from numquant.arrays.create import create_empty_like, create_lagged
+from numquant.arrays.transform import get_lagged
 from numquant.main import Float2D, Float32, Int2D, Nan, np, Int1D
 
 def get_index(array: Float2D) -> Int1D:
@@ -12,13 +13,25 @@ def get_sorted_indices(array: Float2D, ascending: bool) -> Int2D:
 
 
 def get_log_returns(prices: Float2D) -> Float2D:
-    ratios = prices[1:] / prices[:-1]
     log_returns: Float2D = create_empty_like(model=prices)
-    log_returns[0] = Nan
-    log_returns[1:] = np.log(ratios)
+    fill_log_returns(prices=prices, output=log_returns)
     return log_returns
 
 
+def get_lagged_log_returns(prices: Float2D, lag: int = 1) -> Float2D:
+    buffer: Float2D = create_lagged(
+        length=prices.shape[0], width=prices.shape[1], lag=lag
+    )
+    fill_log_returns(prices=prices, output=buffer[lag:])
+    return get_lagged(buffer=buffer, lag=lag)
+
+
+def fill_log_returns(prices: Float2D, output: Float2D) -> None:
+    output[0] = Nan
+    np.divide(prices[1:], prices[:-1], out=output[1:])
+    np.log(output[1:], out=output[1:])
+
+
 def get_pct_returns(prices: Float2D) -> Float2D:
     pct_returns: Float2D = create_empty_like(model=prices)
     pct_returns[0] = Nan
@@ -27,11 +40,24 @@ def get_pct_returns(prices: Float2D) -> Float2D:
 
 
 def get_prices(returns: Float2D) -> Float2D:
+    prices: Float2D = create_empty_like(model=returns)
+    fill_prices(returns=returns, output=prices)
+    return prices
+
+
+def get_lagged_prices(returns: Float2D, lag: int = 1) -> Float2D:
+    buffer: Float2D = create_lagged(
+        length=returns.shape[0], width=returns.shape[1], lag=lag
+    )
+    fill_prices(returns=returns, output=buffer[lag:])
+    return get_lagged(buffer=buffer, lag=lag)
+
+
+def fill_prices(returns: Float2D, output: Float2D) -> None:
     temp: Float2D = returns.copy()
     mask: Float2D = np.isnan(temp)
     temp[mask] = 0
-    cumulative_returns: Float2D = create_empty_like(model=temp)
-    cumulative_returns[:0] = Nan
-    cumulative_returns[0:] = np.cumprod(a=1 + temp[0:], axis=0)
-    cumulative_returns[mask] = Nan
-    return cumulative_returns * Float32(100)
+    np.add(temp, 1, out=temp)
+    np.cumprod(temp, axis=0, out=output)
+    output[mask] = Nan
+    np.multiply(output, Float32(100), out=output)
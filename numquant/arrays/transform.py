@@ -21,6 +21,17 @@ def shift(original: Float2D, step: int = 1) -> Float2D:
     return shifted
 
 
+def get_lagged(buffer: Float2D, lag: int = 1) -> Float2D:
+    return buffer[: buffer.shape[0] - lag]
+
+
+def multiply_lagged(array: Float2D, factor: Float2D, lag: int = 1) -> Float2D:
+    result: Float2D = create_empty_like(model=array)
+    result[:lag] = Nan
+    np.multiply(array[lag:], factor[:-lag], out=result[lag:])
+    return result
+
+
 def backfill(array: Float2D) -> Float2D:
     return bfill(array, axis=0)  # type: ignore
 
@@ -38,3 +49,8 @@ def fill_nan(array: Float2D) -> Float2D:
 
 def fill_nan_with_data(base_array: Float2D, array_filler: Float2D) -> Float2D:
     return np.where(np.isnan(base_array), array_filler, base_array)
+
+
+
+def concatenate(top: Float2D, bottom: Float2D) -> Float2D:
+    return np.concatenate((top, bottom), axis=0)
@@ -1,8 +1,15 @@
 from numquant.metrics.aggregate.correlation import (
     get_average_correlation,
+    get_blocked_correlation_matrix,
     get_correlation_matrix,
     get_distance_matrix,
     get_filled_correlation_matrix,
+    get_representatives,
+)
+from numquant.metrics.aggregate.grouped import (
+    accumulate_groups,
+    create_accumulator,
+    get_grouped_mean,
 )
 from numquant.metrics.aggregate.main import get_max, get_mean, get_median, get_min
 from numquant.metrics.aggregate.performance import (
@@ -16,6 +23,13 @@ from numquant.metrics.aggregate.volatility import (
     get_volatility,
     get_volatility_annualized,
 )
+from numquant.metrics.aggregate.windowed import (
+    BlockMoments,
+    get_block_moments,
+    get_selected_mean,
+    get_window_sharpe,
+    select_top_in_groups,
+)
 
 __all__: list[str] = [
     "get_mean",
@@ -33,4 +47,14 @@ __all__: list[str] = [
     "get_distance_matrix",
     "get_filled_correlation_matrix",
     "get_average_correlation",
+    "get_blocked_correlation_matrix",
+    "get_representatives",
+    "create_accumulator",
+    "accumulate_groups",
+    "get_grouped_mean",
+    "BlockMoments",
+    "get_block_moments",
+    "get_window_sharpe",
+    "select_top_in_groups",
+    "get_selected_mean",
 ]
\ No newline at end of file
@@ -1,4 +1,8 @@
-from numquant.main import Float2D, Float32, Nan, np
+from numba import njit  # type: ignore
+
+from numquant.main import Float2D, Float32, Float64, Int1D, Int32, Nan, NPArray, np
+
+BLOCK_ROWS: int = 4096
 
 
 def get_correlation_matrix(returns_array: Float2D) -> Float2D:
@@ -22,3 +26,38 @@ def get_filled_correlation_matrix(returns_array: Float2D) -> Float2D:
     corr_matrix: Float2D = get_correlation_matrix(returns_array=returns_array)
     np.fill_diagonal(a=corr_matrix, val=Nan)
     return corr_matrix
+
+
+def get_blocked_correlation_matrix(
+    returns_array: Float2D, block_rows: int = BLOCK_ROWS
+) -> Float2D:
+    length, width = returns_array.shape
+    sums: NPArray = np.zeros(shape=width, dtype=Float64)
+    products: NPArray = np.zeros(shape=(width, width), dtype=Float64)
+    for start in range(0, length, block_rows):
+        block: NPArray = np.nan_to_num(
+            returns_array[start : start + block_rows].astype(Float64), nan=0.0
+        )
+        sums += block.sum(axis=0)
+        products += block.T @ block
+    mean: NPArray = sums / max(length, 1)
+    covariance: NPArray = products / max(length, 1) - np.outer(mean, mean)
+    deviation: NPArray = np.sqrt(np.clip(np.diag(covariance), 0.0, None))
+    with np.errstate(divide="ignore", invalid="ignore"):
+        return (covariance / np.outer(deviation, deviation)).astype(Float32)
+
+
+@njit(nogil=True, cache=True)
+def get_representatives(corr_matrix: Float2D, threshold: float) -> Int1D:
+    width: int = corr_matrix.shape[0]
+    representatives: Int1D = np.empty(width, dtype=Int32)
+    for col in range(width):
+        representatives[col] = col
+        for candidate in range(col):
+            if (
+                representatives[candidate] == candidate
+                and corr_matrix[col, candidate] > threshold
+            ):
+                representatives[col] = candidate
+                break
+    return representatives
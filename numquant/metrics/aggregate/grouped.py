@@ -0,0 +1,33 @@
+from numba import njit, prange  # type: ignore
+
+from numquant.main import Float2D, Float32, Float64, Nan, NPArray, np
+
+
+@njit
+def create_accumulator(length: int, width: int) -> NPArray:
+    return np.zeros(shape=(length, width), dtype=Float64)
+
+
+@njit(parallel=True)
+def accumulate_groups(block: Float2D, sums: NPArray, counts: NPArray) -> None:
+    length, width = block.shape
+    groups: int = sums.shape[1]
+    for row in prange(length):
+        for col in range(width):
+            value: float = block[row, col]
+            if not np.isnan(value):
+                sums[row, col % groups] += value
+                counts[row, col % groups] += 1.0
+
+
+@njit
+def get_grouped_mean(sums: NPArray, counts: NPArray) -> Float2D:
+    length, width = sums.shape
+    result: Float2D = np.empty(shape=(length, width), dtype=Float32)
+    for row in range(length):
+        for col in range(width):
+            if counts[row, col] > 0.0:
+                result[row, col] = sums[row, col] / counts[row, col]
+            else:
+                result[row, col] = Nan
+    return result
@@ -3,7 +3,7 @@ from numquant.main import Float2D
 from numquant.metrics.aggregate.main import get_mean, get_min
 from numquant.metrics.aggregate.volatility import get_volatility
 from numquant.metrics.constants import ANNUALIZATION, PERCENTAGE, Period
-from numquant.metrics.rolling import get_expanding_skewness, get_rolling_drawdown
+from numquant.metrics.rolling import get_expanding_drawdown, get_expanding_skewness
 
 
 def get_sharpe_ratio(returns_array: Float2D) -> Float2D:
@@ -13,18 +13,12 @@ def get_sharpe_ratio(returns_array: Float2D) -> Float2D:
 
 
 def get_average_drawdown(returns_array: Float2D) -> Float2D:
-    rolling_dd: Float2D = get_rolling_drawdown(
-        returns_array=returns_array,
-        length=returns_array.shape[0],
-    )
-
-    return get_mean(array=rolling_dd)
+    drawdown: Float2D = get_expanding_drawdown(returns_array=returns_array)
+    return get_mean(array=drawdown)
 
 
 def get_max_drawdown(returns_array: Float2D) -> Float2D:
-    drawdown: Float2D = get_rolling_drawdown(
-        returns_array=returns_array, length=returns_array.shape[0]
-    )
+    drawdown: Float2D = get_expanding_drawdown(returns_array=returns_array)
     return get_min(array=drawdown)
 
 
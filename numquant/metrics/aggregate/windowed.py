@@ -0,0 +1,111 @@
+from typing import NamedTuple
+
+from numba import njit, prange  # type: ignore
+
+from numquant.main import Float1D, Float2D, Float32, Float64, Int1D, Int32, Nan, NPArray, np
+from numquant.metrics.constants import ANNUALIZATION
+
+
+class BlockMoments(NamedTuple):
+    sums: NPArray
+    squares: NPArray
+    counts: NPArray
+    block: int
+
+    @property
+    def blocks(self) -> int:
+        return self.sums.shape[0] - 1
+
+
+def get_block_moments(array: Float2D, block: int) -> BlockMoments:
+    sums, squares, counts = _get_cumulative_moments(array=array, block=block)
+    return BlockMoments(sums=sums, squares=squares, counts=counts, block=block)
+
+
+def get_window_sharpe(moments: BlockMoments, start: int, end: int) -> Float1D:
+    return _get_window_sharpe(
+        sums=moments.sums,
+        squares=moments.squares,
+        counts=moments.counts,
+        start=start,
+        end=end,
+    )
+
+
+@njit(parallel=True)
+def _get_cumulative_moments(
+    array: Float2D, block: int
+) -> tuple[NPArray, NPArray, NPArray]:
+    length, width = array.shape
+    blocks: int = (length + block - 1) // block
+    sums: NPArray = np.zeros(shape=(blocks + 1, width), dtype=Float64)
+    squares: NPArray = np.zeros(shape=(blocks + 1, width), dtype=Float64)
+    counts: NPArray = np.zeros(shape=(blocks + 1, width), dtype=Float64)
+    for index in prange(blocks):
+        for row in range(index * block, min((index + 1) * block, length)):
+            for col in range(width):
+                value: float = array[row, col]
+                if not np.isnan(value):
+                    sums[index + 1, col] += value
+                    squares[index + 1, col] += value * value
+                    counts[index + 1, col] += 1.0
+    for index in range(blocks):
+        for col in range(width):
+            sums[index + 1, col] += sums[index, col]
+            squares[index + 1, col] += squares[index, col]
+            counts[index + 1, col] += counts[index, col]
+    return sums, squares, counts
+
+
+@njit(nogil=True, cache=True)
+def _get_window_sharpe(
+    sums: NPArray, squares: NPArray, counts: NPArray, start: int, end: int
+) -> Float1D:
+    width: int = sums.shape[1]
+    result: Float1D = np.empty(width, dtype=Float32)
+    for col in range(width):
+        count: float = counts[end, col] - counts[start, col]
+        if count < 2.0:
+            result[col] = Nan
+            continue
+        mean: float = (sums[end, col] - sums[start, col]) / count
+        variance: float = (
+            squares[end, col] - squares[start, col] - count * mean * mean
+        ) / (count - 1.0)
+        if variance <= 0.0:
+            result[col] = Nan
+            continue
+        result[col] = mean / np.sqrt(variance) * ANNUALIZATION
+    return result
+
+
+@njit(nogil=True, cache=True)
+def select_top_in_groups(scores: Float1D, groups: Int1D, top: int) -> Int1D:
+    order: Int1D = np.argsort(-scores).astype(Int32)
+    taken: Int1D = np.zeros(groups.max() + 1 if groups.size else 0, dtype=Int32)
+    selected: Int1D = np.empty(scores.size, dtype=Int32)
+    quantity: int = 0
+    for col in order:
+        if np.isnan(scores[col]) or taken[groups[col]] >= top:
+            continue
+        taken[groups[col]] += 1
+        selected[quantity] = col
+        quantity += 1
+    return np.sort(selected[:quantity])
+
+
+@njit(nogil=True, cache=True)
+def get_selected_mean(
+    array: Float2D, columns: Int1D, start: int, end: int
+) -> Float1D:
+    result: Float1D = np.empty(end - start, dtype=Float32)
+    for row in range(start, end):
+        total: float = 0.0
+        count: int = 0
+        for col in columns:
+            value: float = array[row, col]
+            if not np.isnan(value):
+                total += value
+                count += 1
+        result[row - start] = total / count if count > 0 else Nan
+    return result
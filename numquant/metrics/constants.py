@@ -1,12 +1,13 @@
 from enum import IntEnum
 
-from numquant.main import Float32
+from numquant.main import Float32, Int8
 
 ZERO = Float32(0.0)
 ONE = Float32(1.0)
 ANNUALIZATION = Float32(16)
 PERCENTAGE = Float32(100)
 ANNUALIZED_PERCENTAGE = Float32(ANNUALIZATION * PERCENTAGE)
+SIGN_NAN = Int8(-128)
 
 
 class Period(IntEnum):
@@ -1,4 +1,10 @@
-from numquant.metrics.rolling.kurtosis import get_kurtosis
+from numquant.metrics.rolling.expanding import (
+    get_expanding_max,
+    get_expanding_mean,
+    get_expanding_skewness,
+    get_expanding_sum,
+    get_expanding_volatility,
+)
 from numquant.metrics.rolling.main import (
     get_central_point,
     get_max,
@@ -7,7 +13,22 @@ from numquant.metrics.rolling.main import (
     get_min,
     get_sum,
 )
+from numquant.metrics.rolling.moments import (
+    RollingMoments,
+    get_kurtosis,
+    get_rolling_moments,
+    get_skewness,
+)
+from numquant.metrics.rolling.multi import (
+    MultiRollingFunc,
+    get_mean_multi,
+    get_sum_multi,
+)
 from numquant.metrics.rolling.normalization import (
+    ExpandingState,
+    extend_scalar_normalisation,
+    fill_normalized_returns,
+    get_scalar_state,
     get_indicator_on_trend_signal,
     get_median_normalisation,
     invert_signal_long,
@@ -23,17 +44,21 @@ from numquant.metrics.rolling.normalization import (
 )
 from numquant.metrics.rolling.performance import (
     get_equity,
+    get_expanding_drawdown,
     get_returns_distribution,
     get_rolling_drawdown,
     get_sharpe_ratio,
 )
-from numquant.metrics.rolling.skewness import get_skewness, get_expanding_skewness
+from numquant.metrics.rolling.signs import (
+    fill_sign_returns,
+    get_compact_sign,
+    get_expanded_sign,
+)
 from numquant.metrics.rolling.volatility import (
     get_volatility,
     get_volatility_annualized,
     get_volatility_annualized_pct,
     get_composite_volatility,
-    get_expanding_volatility
 )
 
 __all__: list[str] = [
@@ -67,4 +92,20 @@ __all__: list[str] = [
     "get_equity",
     "get_expanding_volatility",
     "get_expanding_skewness",
+    "ExpandingState",
+    "get_scalar_state",
+    "extend_scalar_normalisation",
+    "fill_normalized_returns",
+    "MultiRollingFunc",
+    "get_mean_multi",
+    "get_sum_multi",
+    "RollingMoments",
+    "get_rolling_moments",
+    "get_compact_sign",
+    "get_expanded_sign",
+    "fill_sign_returns",
+    "get_expanding_sum",
+    "get_expanding_mean",
+    "get_expanding_max",
+    "get_expanding_drawdown",
 ]
@@ -0,0 +1,28 @@
+from numba import njit  # type: ignore
+
+from numquant.main import Float32, np
+
+
+@njit(nogil=True, cache=True)
+def add_compensated(
+    total: Float32, compensation: Float32, value: Float32
+) -> tuple[Float32, Float32]:
+    temp: Float32 = value - compensation
+    result: Float32 = total + temp
+    return result, (result - total) - temp
+
+
+@njit(nogil=True, cache=True)
+def compute_compensated_moment(
+    total: Float32, squares: Float32, count: int, reference: Float32, moment: int
+) -> Float32:
+    size: Float32 = Float32(count)
+    if moment == 0:
+        return total + reference * size
+    if moment == 1:
+        return total / size + reference
+    if count < 2:
+        return Float32(np.nan)
+    variance: Float32 = (squares - total * total / size) / (size - Float32(1.0))
+    return np.sqrt(max(variance, Float32(0.0)))
+
@@ -0,0 +1,161 @@
+from numba import njit  # type: ignore
+
+from numquant.arrays import create_nan
+from numquant.main import Float2D, Float32, np
+from numquant.metrics.rolling.compensated import (
+    add_compensated,
+    compute_compensated_moment,
+)
+from numquant.metrics.rolling.kurtosis import add_kurtosis_contribution
+from numquant.metrics.rolling.multi import Moment
+from numquant.metrics.rolling.skewness import compute_skewness
+
+
+def get_expanding_sum(array: Float2D, min_length: int = 1) -> Float2D:
+    return _get_expanding(array=array, min_length=min_length, moment=Moment.SUM)
+
+
+def get_expanding_mean(array: Float2D, min_length: int = 1) -> Float2D:
+    return _get_expanding(array=array, min_length=min_length, moment=Moment.MEAN)
+
+
+def get_expanding_volatility(array: Float2D, min_length: int = 1) -> Float2D:
+    return _get_expanding(
+        array=array, min_length=min_length, moment=Moment.VOLATILITY
+    )
+
+
+def get_expanding_skewness(array: Float2D, min_length: int = 4) -> Float2D:
+    return _expand_skewness(
+        array=array.reshape(array.shape[0], -1), min_length=min_length
+    ).reshape(array.shape)
+
+
+def get_expanding_max(array: Float2D, min_length: int = 1) -> Float2D:
+    return _expand_max(
+        array=array.reshape(array.shape[0], -1), min_length=min_length
+    ).reshape(array.shape)
+
+
+def _get_expanding(array: Float2D, min_length: int, moment: Moment) -> Float2D:
+    return _expand_moments(
+        array=array.reshape(array.shape[0], -1),
+        min_length=min_length,
+        moment=int(moment),
+    ).reshape(array.shape)
+
+
+@njit(nogil=True, cache=True)
+def _expand_moments(array: Float2D, min_length: int, moment: int) -> Float2D:
+    days, assets = array.shape
+    output: Float2D = create_nan(length=days, width=assets)
+    for col in range(assets):
+        reference: Float32 = Float32(0.0)
+        for row in range(days):
+            if not np.isnan(array[row, col]):
+                reference = array[row, col]
+                break
+        total: Float32 = Float32(0.0)
+        total_compensation: Float32 = Float32(0.0)
+        squares: Float32 = Float32(0.0)
+        squares_compensation: Float32 = Float32(0.0)
+        count: int = 0
+        for row in range(days):
+            value: Float32 = array[row, col]
+            if not np.isnan(value):
+                shifted: Float32 = value - reference
+                total, total_compensation = add_compensated(
+                    total=total, compensation=total_compensation, value=shifted
+                )
+                squares, squares_compensation = add_compensated(
+                    total=squares,
+                    compensation=squares_compensation,
+                    value=shifted * shifted,
+                )
+                count += 1
+            if count == 0 or count < min_length:
+                continue
+            output[row, col] = compute_compensated_moment(
+                total=total,
+                squares=squares,
+                count=count,
+                reference=reference,
+                moment=moment,
+            )
+    return output
+
+
+@njit(nogil=True, cache=True)
+def _expand_skewness(array: Float2D, min_length: int) -> Float2D:
+    days, assets = array.shape
+    output: Float2D = create_nan(length=days, width=assets)
+    for col in range(assets):
+        (
+            observation_count,
+            sum_values,
+            sum_values_squared,
+            sum_values_cubed,
+            sum_values_fourth,
+        ) = 0, 0.0, 0.0, 0.0, 0.0
+        (
+            compensation_values,
+            compensation_squared,
+            compensation_cubed,
+            compensation_fourth,
+        ) = 0.0, 0.0, 0.0, 0.0
+        previous_value = array[0, col]
+        consecutive_equal_count = 0
+        for row in range(days):
+            (
+                observation_count,
+                sum_values,
+                sum_values_squared,
+                sum_values_cubed,
+                sum_values_fourth,
+                compensation_values,
+                compensation_squared,
+                compensation_cubed,
+                compensation_fourth,
+                consecutive_equal_count,
+                previous_value,
+            ) = add_kurtosis_contribution(
+                value=array[row, col],
+                observation_count=observation_count,
+                sum_values=sum_values,
+                sum_values_squared=sum_values_squared,
+                sum_values_cubed=sum_values_cubed,
+                sum_values_fourth=sum_values_fourth,
+                compensation_values=compensation_values,
+                compensation_squared=compensation_squared,
+                compensation_cubed=compensation_cubed,
+                compensation_fourth=compensation_fourth,
+                consecutive_equal_count=consecutive_equal_count,
+                previous_value=previous_value,
+            )
+            output[row, col] = compute_skewness(
+                min_length=min_length,
+                observation_count=observation_count,
+                sum_values=sum_values,
+                sum_values_squared=sum_values_squared,
+                sum_values_cubed=sum_values_cubed,
+                consecutive_equal_count=consecutive_equal_count,
+            )
+    return output
+
+
+@njit(nogil=True, cache=True)
+def _expand_max(array: Float2D, min_length: int) -> Float2D:
+    days, assets = array.shape
+    output: Float2D = create_nan(length=days, width=assets)
+    for col in range(assets):
+        current: Float32 = Float32(-np.inf)
+        count: int = 0
+        for row in range(days):
+            value: Float32 = array[row, col]
+            if not np.isnan(value):
+                count += 1
+                if value > current:
+                    current = value
+            if count >= max(min_length, 1):
+                output[row, col] = current
+    return output
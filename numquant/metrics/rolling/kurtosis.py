@@ -1,6 +1,5 @@
-from numba import njit, prange  # type: ignore
-from numquant.main import Float2D, Float32, Nan
-from numquant.arrays import create_nan
+from numba import njit  # type: ignore
+from numquant.main import Float32, Nan
 
 @njit
 def compute_kurtosis(
@@ -155,136 +154,3 @@ def remove_kurtosis_contribution(
         compensation_fourth,
     )
 
-
-@njit
-def get_kurtosis(array: Float2D, length: int, min_length: int) -> Float2D:
-    num_rows, num_cols = array.shape
-    output = create_nan(length=num_rows, width=num_cols)
-
-    for col in prange(num_cols):
-        (
-            observation_count,
-            sum_values,
-            sum_values_squared,
-            sum_values_cubed,
-            sum_values_fourth,
-        ) = 0, 0.0, 0.0, 0.0, 0.0
-        (
-            compensation_values,
-            compensation_squared,
-            compensation_cubed,
-            compensation_fourth,
-        ) = 0.0, 0.0, 0.0, 0.0
-        previous_value = array[0, col]
-        consecutive_equal_count = 0
-
-        for row in range(num_rows):
-            start_idx: int = max(0, row - length + 1)
-            end_idx: int = row + 1
-
-            if row == 0 or start_idx >= row - 1:
-                (
-                    observation_count,
-                    sum_values,
-                    sum_values_squared,
-                    sum_values_cubed,
-                    sum_values_fourth,
-                ) = 0, 0.0, 0.0, 0.0, 0.0
-                (
-                    compensation_values,
-                    compensation_squared,
-                    compensation_cubed,
-                    compensation_fourth,
-                ) = 0.0, 0.0, 0.0, 0.0
-                previous_value = array[start_idx, col]
-                consecutive_equal_count = 0
-                for idx in range(start_idx, end_idx):
-                    (
-                        observation_count,
-                        sum_values,
-                        sum_values_squared,
-                        sum_values_cubed,
-                        sum_values_fourth,
-                        compensation_values,
-                        compensation_squared,
-                        compensation_cubed,
-                        compensation_fourth,
-                        consecutive_equal_count,
-                        previous_value,
-                    ) = add_kurtosis_contribution(
-                        value=array[idx, col],
-                        observation_count=observation_count,
-                        sum_values=sum_values,
-                        sum_values_squared=sum_values_squared,
-                        sum_values_cubed=sum_values_cubed,
-                        sum_values_fourth=sum_values_fourth,
-                        compensation_values=compensation_values,
-                        compensation_squared=compensation_squared,
-                        compensation_cubed=compensation_cubed,
-                        compensation_fourth=compensation_fourth,
-                        consecutive_equal_count=consecutive_equal_count,
-                        previous_value=previous_value,
-                    )
-            else:
-                for idx in range(max(0, row - length), start_idx):
-                    (
-                        observation_count,
-                        sum_values,
-                        sum_values_squared,
-                        sum_values_cubed,
-                        sum_values_fourth,
-                        compensation_values,
-                        compensation_squared,
-                        compensation_cubed,
-                        compensation_fourth,
-                    ) = remove_kurtosis_contribution(
-                        value=array[idx, col],
-                        observation_count=observation_count,
-                        sum_values=sum_values,
-                        sum_values_squared=sum_values_squared,
-                        sum_values_cubed=sum_values_cubed,
-                        sum_values_fourth=sum_values_fourth,
-                        compensation_values=compensation_values,
-                        compensation_squared=compensation_squared,
-                        compensation_cubed=compensation_cubed,
-                        compensation_fourth=compensation_fourth,
-                    )
-
-                (
-                    observation_count,
-                    sum_values,
-                    sum_values_squared,
-                    sum_values_cubed,
-                    sum_values_fourth,
-                    compensation_values,
-                    compensation_squared,
-                    compensation_cubed,
-                    compensation_fourth,
-                    consecutive_equal_count,
-                    previous_value,
-                ) = add_kurtosis_contribution(
-                    value=array[row, col],
-                    observation_count=observation_count,
-                    sum_values=sum_values,
-                    sum_values_squared=sum_values_squared,
-                    sum_values_cubed=sum_values_cubed,
-                    sum_values_fourth=sum_values_fourth,
-                    compensation_values=compensation_values,
-                    compensation_squared=compensation_squared,
-                    compensation_cubed=compensation_cubed,
-                    compensation_fourth=compensation_fourth,
-                    consecutive_equal_count=consecutive_equal_count,
-                    previous_value=previous_value,
-                )
-
-            output[row, col] = compute_kurtosis(
-                observation_count=observation_count,
-                sum_values=sum_values,
-                sum_values_squared=sum_values_squared,
-                sum_values_cubed=sum_values_cubed,
-                sum_values_fourth=sum_values_fourth,
-                consecutive_equal_count=consecutive_equal_count,
-                min_length=min_length,
-            )
-
-    return output
@@ -0,0 +1,215 @@
+from typing import NamedTuple
+
+from numba import njit  # type: ignore
+
+from numquant.main import Float2D, Nan, np
+from numquant.arrays import create_nan
+from numquant.metrics.rolling.kurtosis import (
+    add_kurtosis_contribution,
+    compute_kurtosis,
+    remove_kurtosis_contribution,
+)
+from numquant.metrics.rolling.skewness import compute_skewness
+
+
+class RollingMoments(NamedTuple):
+    mean: Float2D
+    variance: Float2D
+    skewness: Float2D
+    kurtosis: Float2D
+
+
+def get_rolling_moments(
+    array: Float2D, length: int, min_length: int = 4
+) -> RollingMoments:
+    mean, variance, skewness, kurtosis = _roll_higher_moments(
+        array=array, length=length, min_length=min_length
+    )
+    return RollingMoments(
+        mean=mean, variance=variance, skewness=skewness, kurtosis=kurtosis
+    )
+
+
+def get_skewness(array: Float2D, length: int, min_length: int = 4) -> Float2D:
+    return get_rolling_moments(
+        array=array, length=length, min_length=min_length
+    ).skewness
+
+
+def get_kurtosis(array: Float2D, length: int, min_length: int) -> Float2D:
+    return get_rolling_moments(
+        array=array, length=length, min_length=min_length
+    ).kurtosis
+
+
+@njit(nogil=True, cache=True)
+def compute_mean_variance(
+    min_length: int, observation_count: int, sum_values: float, sum_values_squared: float
+) -> tuple[float, float]:
+    if observation_count < max(min_length, 1):
+        return Nan, Nan
+    total_observations = float(observation_count)
+    mean: float = sum_values / total_observations
+    if observation_count < 2:
+        return mean, Nan
+    variance: float = (
+        (sum_values_squared / total_observations - mean * mean)
+        * total_observations
+        / (total_observations - 1.0)
+    )
+    return mean, max(variance, 0.0)
+
+
+@njit(nogil=True, cache=True)
+def _roll_higher_moments(
+    array: Float2D, length: int, min_length: int
+) -> tuple[Float2D, Float2D, Float2D, Float2D]:
+    num_rows, num_cols = array.shape
+    mean_output = create_nan(length=num_rows, width=num_cols)
+    variance_output = create_nan(length=num_rows, width=num_cols)
+    skewness_output = create_nan(length=num_rows, width=num_cols)
+    kurtosis_output = create_nan(length=num_rows, width=num_cols)
+
+    for col in range(num_cols):
+        (
+            observation_count,
+            sum_values,
+            sum_values_squared,
+            sum_values_cubed,
+            sum_values_fourth,
+        ) = 0, 0.0, 0.0, 0.0, 0.0
+        (
+            compensation_values,
+            compensation_squared,
+            compensation_cubed,
+            compensation_fourth,
+        ) = 0.0, 0.0, 0.0, 0.0
+        previous_value = array[0, col]
+        consecutive_equal_count = 0
+
+        for row in range(num_rows):
+            start_idx: int = max(0, row - length + 1)
+            end_idx: int = row + 1
+
+            if row == 0 or start_idx >= row - 1:
+                (
+                    observation_count,
+                    sum_values,
+                    sum_values_squared,
+                    sum_values_cubed,
+                    sum_values_fourth,
+                ) = 0, 0.0, 0.0, 0.0, 0.0
+                (
+                    compensation_values,
+                    compensation_squared,
+                    compensation_cubed,
+                    compensation_fourth,
+                ) = 0.0, 0.0, 0.0, 0.0
+                previous_value = array[start_idx, col]
+                consecutive_equal_count = 0
+                for idx in range(start_idx, end_idx):
+                    (
+                        observation_count,
+                        sum_values,
+                        sum_values_squared,
+                        sum_values_cubed,
+                        sum_values_fourth,
+                        compensation_values,
+                        compensation_squared,
+                        compensation_cubed,
+                        compensation_fourth,
+                        consecutive_equal_count,
+                        previous_value,
+                    ) = add_kurtosis_contribution(
+                        value=array[idx, col],
+                        observation_count=observation_count,
+                        sum_values=sum_values,
+                        sum_values_squared=sum_values_squared,
+                        sum_values_cubed=sum_values_cubed,
+                        sum_values_fourth=sum_values_fourth,
+                        compensation_values=compensation_values,
+                        compensation_squared=compensation_squared,
+                        compensation_cubed=compensation_cubed,
+                        compensation_fourth=compensation_fourth,
+                        consecutive_equal_count=consecutive_equal_count,
+                        previous_value=previous_value,
+                    )
+            else:
+                for idx in range(max(0, row - length), start_idx):
+                    (
+                        observation_count,
+                        sum_values,
+                        sum_values_squared,
+                        sum_values_cubed,
+                        sum_values_fourth,
+                        compensation_values,
+                        compensation_squared,
+                        compensation_cubed,
+                        compensation_fourth,
+                    ) = remove_kurtosis_contribution(
+                        value=array[idx, col],
+                        observation_count=observation_count,
+                        sum_values=sum_values,
+                        sum_values_squared=sum_values_squared,
+                        sum_values_cubed=sum_values_cubed,
+                        sum_values_fourth=sum_values_fourth,
+                        compensation_values=compensation_values,
+                        compensation_squared=compensation_squared,
+                        compensation_cubed=compensation_cubed,
+                        compensation_fourth=compensation_fourth,
+                    )
+
+                (
+                    observation_count,
+                    sum_values,
+                    sum_values_squared,
+                    sum_values_cubed,
+                    sum_values_fourth,
+                    compensation_values,
+                    compensation_squared,
+                    compensation_cubed,
+                    compensation_fourth,
+                    consecutive_equal_count,
+                    previous_value,
+                ) = add_kurtosis_contribution(
+                    value=array[row, col],
+                    observation_count=observation_count,
+                    sum_values=sum_values,
+                    sum_values_squared=sum_values_squared,
+                    sum_values_cubed=sum_values_cubed,
+                    sum_values_fourth=sum_values_fourth,
+                    compensation_values=compensation_values,
+                    compensation_squared=compensation_squared,
+                    compensation_cubed=compensation_cubed,
+                    compensation_fourth=compensation_fourth,
+                    consecutive_equal_count=consecutive_equal_count,
+                    previous_value=previous_value,
+                )
+
+            mean, variance = compute_mean_variance(
+                min_length=min_length,
+                observation_count=observation_count,
+                sum_values=sum_values,
+                sum_values_squared=sum_values_squared,
+            )
+            mean_output[row, col] = mean
+            variance_output[row, col] = variance
+            skewness_output[row, col] = compute_skewness(
+                min_length=min_length,
+                observation_count=observation_count,
+                sum_values=sum_values,
+                sum_values_squared=sum_values_squared,
+                sum_values_cubed=sum_values_cubed,
+                consecutive_equal_count=consecutive_equal_count,
+            )
+            kurtosis_output[row, col] = compute_kurtosis(
+                observation_count=observation_count,
+                sum_values=sum_values,
+                sum_values_squared=sum_values_squared,
+                sum_values_cubed=sum_values_cubed,
+                sum_values_fourth=sum_values_fourth,
+                consecutive_equal_count=consecutive_equal_count,
+                min_length=min_length,
+            )
+
+    return mean_output, variance_output, skewness_output, kurtosis_output
@@ -0,0 +1,82 @@
+from collections.abc import Callable
+from enum import IntEnum
+
+from numba import njit  # type: ignore
+
+from numquant.main import Float1D, Float2D, Float32, Float64, Int1D, Int32, Nan, np
+
+type MultiRollingFunc = Callable[[Float2D, list[int], list[int] | None], list[Float2D]]
+
+
+class Moment(IntEnum):
+    SUM = 0
+    MEAN = 1
+    VOLATILITY = 2
+
+
+def get_sum_multi(
+    array: Float2D, lengths: list[int], min_lengths: list[int] | None = None
+) -> list[Float2D]:
+    return _get_multi(
+        array=array, lengths=lengths, min_lengths=min_lengths, moment=Moment.SUM
+    )
+
+
+def get_mean_multi(
+    array: Float2D, lengths: list[int], min_lengths: list[int] | None = None
+) -> list[Float2D]:
+    return _get_multi(
+        array=array, lengths=lengths, min_lengths=min_lengths, moment=Moment.MEAN
+    )
+
+
+def _get_multi(
+    array: Float2D, lengths: list[int], min_lengths: list[int] | None, moment: Moment
+) -> list[Float2D]:
+    windows: Int1D = np.array(lengths, dtype=Int32)
+    min_counts: Int1D = np.array(min_lengths or [1] * len(lengths), dtype=Int32)
+    return list(
+        _roll_moments(
+            array=array, lengths=windows, min_lengths=min_counts, moment=int(moment)
+        )
+    )
+
+
+@njit(nogil=True, cache=True)
+def _roll_moments(
+    array: Float2D, lengths: Int1D, min_lengths: Int1D, moment: int
+) -> np.ndarray:
+    days, assets = array.shape
+    output = np.empty(shape=(lengths.shape[0], days, assets), dtype=Float32)
+    for col in range(assets):
+        sums: Float1D = np.zeros(days + 1, dtype=Float64)
+        counts: Int1D = np.zeros(days + 1, dtype=Int32)
+        reference: float = 0.0
+        for row in range(days):
+            if not np.isnan(array[row, col]):
+                reference = array[row, col]
+                break
+        for row in range(days):
+            value: float = array[row, col]
+            if np.isnan(value):
+                sums[row + 1] = sums[row]
+                counts[row + 1] = counts[row]
+            else:
+                shifted: float = value - reference
+                sums[row + 1] = sums[row] + shifted
+                counts[row + 1] = counts[row] + 1
+        for window in range(lengths.shape[0]):
+            length: int = lengths[window]
+            min_length: int = min_lengths[window]
+            for row in range(days):
+                start: int = max(row + 1 - length, 0)
+                count: int = counts[row + 1] - counts[start]
+                if count < min_length or count == 0:
+                    output[window, row, col] = Nan
+                    continue
+                total: float = sums[row + 1] - sums[start]
+                if moment == 0:
+                    output[window, row, col] = total + reference * count
+                else:
+                    output[window, row, col] = total / count + reference
+    return output
@@ -1,9 +1,12 @@
-from numquant.arrays import backfill
-from numquant.main import Float2D, Float32, np
+from typing import NamedTuple
+
+from numba import njit  # type: ignore
+
+from numquant.main import Float1D, Float2D, Float32, Nan, np
 from numquant.metrics.aggregate import get_median as get_median_agg
 from numquant.metrics.constants import ONE, ZERO, Period
+from numquant.metrics.rolling.compensated import add_compensated
 from numquant.metrics.rolling.main import (
-    get_expanding_mean,
     get_max,
     get_mean,
     get_median,
@@ -11,6 +14,17 @@ from numquant.metrics.rolling.main import (
 )
 from numquant.metrics.rolling.volatility import get_volatility
 
+
+
+class ExpandingState(NamedTuple):
+    total: float
+    compensation: float
+    observations: int
+
+    def is_ready(self, min_length: int = Period.YEAR) -> bool:
+        return self.observations >= min_length
+
+
 # TODO: virer toutes les fonctions qui sont indicateurs et pas ultra genériques
 
 
@@ -19,6 +33,8 @@ def ratio_normalization(nominator: Float2D, denominator: Float2D) -> Float2D:
 
 
 def sign_normalization(signal_array: Float2D) -> Float2D:
+    if not signal_array.flags.writeable:
+        return np.sign(signal_array)
     return np.sign(signal_array, out=signal_array)
 
 
@@ -70,7 +86,7 @@ def get_median_normalisation(signal_array: Float2D, window_length: int) -> Float
 
 
 def rolling_scalar_normalisation(raw_signal: Float2D, limit: int = 2) -> Float2D:
-    scalar: Float2D = _get_normalized_scalar(raw_signal=raw_signal)
+    scalar: Float1D = _get_normalized_scalar(raw_signal=raw_signal)
     reshaped_scalar: Float2D = scalar.reshape(-1, 1)
     normalized_signal: Float2D = reshaped_scalar * raw_signal
     return limit_normalization(signal_array=normalized_signal, limit=limit)
@@ -92,10 +108,122 @@ def invert_signal_short(
 
 def _get_normalized_scalar(
     raw_signal: Float2D, length: int = Period.YEAR, target: int = 1
-) -> Float2D:
-    median: Float2D = get_median_agg(array=np.abs(raw_signal), axis=1)
-    mean: Float2D = get_expanding_mean(array=median, min_length=length)
-    scalar: Float2D = (
-        target / mean
+) -> Float1D:
+    median: Float1D = get_median_agg(array=np.abs(raw_signal), axis=1)
+    return get_expanding_scalar(
+        medians=median, target=target, length=length
     )  # TODO: trouver une solution pour les actifs/strategies qui ont des periodes de 0
-    return backfill(array=scalar)
+
+
+def get_scalar_state(raw_signal: Float2D) -> ExpandingState:
+    median: Float1D = get_median_agg(array=np.abs(raw_signal), axis=1)
+    total, compensation, count = _accumulate_expanding_mean(
+        array=median,
+        out=np.empty_like(median),
+        total=Float32(0.0),
+        compensation=Float32(0.0),
+        count=0,
+        min_length=1,
+    )
+    return ExpandingState(
+        total=float(total), compensation=float(compensation), observations=count
+    )
+
+
+def extend_scalar_normalisation(
+    raw_signal: Float2D, state: ExpandingState, limit: int = 2, target: int = 1
+) -> tuple[Float2D, ExpandingState]:
+    median: Float1D = get_median_agg(array=np.abs(raw_signal), axis=1)
+    mean: Float1D = np.empty_like(median)
+    total, compensation, count = _accumulate_expanding_mean(
+        array=median,
+        out=mean,
+        total=Float32(state.total),
+        compensation=Float32(state.compensation),
+        count=state.observations,
+        min_length=1,
+    )
+    scalar: Float2D = (target / mean).reshape(-1, 1)
+    normalized_signal: Float2D = limit_normalization(
+        signal_array=scalar * raw_signal, limit=limit
+    )
+    return normalized_signal, ExpandingState(
+        total=float(total), compensation=float(compensation), observations=count
+    )
+
+
+@njit(nogil=True, cache=True)
+def _accumulate_expanding_mean(
+    array: Float1D,
+    out: Float1D,
+    total: Float32,
+    compensation: Float32,
+    count: int,
+    min_length: int,
+) -> tuple[Float32, Float32, int]:
+    for row in range(array.shape[0]):
+        if not np.isnan(array[row]):
+            total, compensation = add_compensated(
+                total=total, compensation=compensation, value=array[row]
+            )
+            count += 1
+        out[row] = (
+            total / Float32(count) if count > 0 and count >= min_length else Nan
+        )
+    return total, compensation, count
+
+
+@njit(nogil=True, cache=True, error_model="numpy")
+def fill_normalized_returns(
+    raw_signal: Float2D,
+    adjusted_returns: Float2D,
+    output: Float2D,
+    limit: float = 2.0,
+    target: float = 1.0,
+    length: int = Period.YEAR,
+) -> None:
+    days, assets = raw_signal.shape
+    buffer: Float1D = np.empty(assets, dtype=Float32)
+    medians: Float1D = np.empty(days, dtype=Float32)
+    for row in range(days):
+        valid: int = 0
+        for col in range(assets):
+            value: float = raw_signal[row, col]
+            if not np.isnan(value):
+                buffer[valid] = abs(value)
+                valid += 1
+        medians[row] = np.median(buffer[:valid]) if valid > 0 else Nan
+    scalar: Float1D = get_expanding_scalar(medians=medians, target=target, length=length)
+    upper: Float32 = Float32(limit)
+    lower: Float32 = Float32(-limit)
+    for row in range(days):
+        for col in range(assets):
+            normalized: Float32 = scalar[row] * raw_signal[row, col]
+            if normalized > upper:
+                normalized = upper
+            elif normalized < lower:
+                normalized = lower
+            output[row, col] = normalized * adjusted_returns[row, col]
+
+
+@njit(nogil=True, cache=True, error_model="numpy")
+def get_expanding_scalar(medians: Float1D, target: float, length: int) -> Float1D:
+    days: int = medians.shape[0]
+    scalar: Float1D = np.empty(days, dtype=Float32)
+    _accumulate_expanding_mean(
+        array=medians,
+        out=scalar,
+        total=Float32(0.0),
+        compensation=Float32(0.0),
+        count=0,
+        min_length=length,
+    )
+    first_valid: int = -1
+    for row in range(days):
+        if not np.isnan(scalar[row]):
+            scalar[row] = Float32(target) / scalar[row]
+            if first_valid < 0:
+                first_valid = row
+    if first_valid > 0:
+        scalar[:first_valid] = scalar[first_valid]
+    return scalar
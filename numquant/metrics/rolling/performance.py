@@ -2,8 +2,13 @@ from numquant.arrays.extract import get_pct_returns, get_prices
 from numquant.arrays.transform import reduce
 from numquant.main import Float2D
 from numquant.metrics.constants import ANNUALIZATION, PERCENTAGE, Period
-from numquant.metrics.rolling.main import get_expanding_mean, get_max, get_mean
-from numquant.metrics.rolling.volatility import get_expanding_volatility, get_volatility
+from numquant.metrics.rolling.expanding import (
+    get_expanding_max,
+    get_expanding_mean,
+    get_expanding_volatility,
+)
+from numquant.metrics.rolling.main import get_max, get_mean
+from numquant.metrics.rolling.volatility import get_volatility
 
 
 def get_sharpe_ratio(returns_array: Float2D, length: int) -> Float2D:
@@ -30,6 +35,12 @@ def get_rolling_drawdown(returns_array: Float2D, length: int) -> Float2D:
     return (equity_curves - period_max) / period_max * PERCENTAGE
 
 
+def get_expanding_drawdown(returns_array: Float2D) -> Float2D:
+    equity_curves: Float2D = get_prices(returns=returns_array)
+    period_max: Float2D = get_expanding_max(array=equity_curves)
+    return (equity_curves - period_max) / period_max * PERCENTAGE
+
+
 def get_equity(returns_array: Float2D, frequency: int | None = None) -> Float2D:
     equity: Float2D = get_prices(returns=returns_array)
     if frequency is None:
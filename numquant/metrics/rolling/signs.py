@@ -0,0 +1,83 @@
+from numba import njit  # type: ignore
+
+from numquant.main import Float1D, Float2D, Float32, Int8, Nan, Sign2D, np
+from numquant.metrics.constants import SIGN_NAN, Period
+from numquant.metrics.rolling.normalization import get_expanding_scalar
+
+
+@njit(nogil=True, cache=True)
+def get_compact_sign(signal_array: Float2D) -> Sign2D:
+    days, assets = signal_array.shape
+    result: Sign2D = np.empty(shape=(days, assets), dtype=Int8)
+    for row in range(days):
+        for col in range(assets):
+            value: float = signal_array[row, col]
+            if np.isnan(value):
+                result[row, col] = SIGN_NAN
+            elif value > 0.0:
+                result[row, col] = 1
+            elif value < 0.0:
+                result[row, col] = -1
+            else:
+                result[row, col] = 0
+    return result
+
+
+@njit(nogil=True, cache=True)
+def get_expanded_sign(signal: Sign2D) -> Float2D:
+    days, assets = signal.shape
+    result: Float2D = np.empty(shape=(days, assets), dtype=Float32)
+    for row in range(days):
+        for col in range(assets):
+            value: Int8 = signal[row, col]
+            result[row, col] = Nan if value == SIGN_NAN else Float32(value)
+    return result
+
+
+@njit(nogil=True, cache=True, error_model="numpy")
+def fill_sign_returns(
+    signal: Sign2D,
+    adjusted_returns: Float2D,
+    output: Float2D,
+    limit: float = 2.0,
+    target: float = 1.0,
+    length: int = Period.YEAR,
+) -> None:
+    days, assets = signal.shape
+    medians: Float1D = np.empty(days, dtype=Float32)
+    for row in range(days):
+        valid: int = 0
+        active: int = 0
+        for col in range(assets):
+            value: Int8 = signal[row, col]
+            if value != SIGN_NAN:
+                valid += 1
+                if value != 0:
+                    active += 1
+        medians[row] = _get_sign_median(valid=valid, active=active)
+    scalar: Float1D = get_expanding_scalar(medians=medians, target=target, length=length)
+    upper: Float32 = Float32(limit)
+    lower: Float32 = Float32(-limit)
+    for row in range(days):
+        for col in range(assets):
+            value = signal[row, col]
+            if value == SIGN_NAN:
+                output[row, col] = Nan
+                continue
+            normalized: Float32 = scalar[row] * Float32(value)
+            if normalized > upper:
+                normalized = upper
+            elif normalized < lower:
+                normalized = lower
+            output[row, col] = normalized * adjusted_returns[row, col]
+
+
+@njit(nogil=True, cache=True)
+def _get_sign_median(valid: int, active: int) -> Float32:
+    if valid == 0:
+        return Nan
+    if active * 2 > valid:
+        return Float32(1.0)
+    if active * 2 < valid:
+        return Float32(0.0)
+    return Float32(0.5)
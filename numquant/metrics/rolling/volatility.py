@@ -4,15 +4,13 @@ from numquant.arrays import fill_nan_with_data
 from numquant.main import Float2D
 from numquant.metrics.aggregate import get_mean
 from numquant.metrics.constants import ANNUALIZED_PERCENTAGE, ANNUALIZATION,  Period
+from numquant.metrics.rolling.expanding import get_expanding_volatility
 
 
 def get_volatility(array: Float2D, length: int, min_length: int = 1) -> Float2D:
     return bn.move_std(array, window=length, min_count=min_length, axis=0, ddof=1)  # type: ignore
 
 
-def get_expanding_volatility(array: Float2D, min_length: int = 1) -> Float2D:
-    return get_volatility(array=array, length=array.shape[0], min_length=min_length)
-
 def get_expanding_volatility_annualized(
     array: Float2D, min_length: int = 1
 ) -> Float2D:
@@ -1,4 +1,5 @@
 from outquantlab.apis.data_refresher import fetch_data
+from outquantlab.apis.jobs import BacktestRequest, Job, JobManager, JobStatus
 from outquantlab.apis.server import LabServer
 from outquantlab.apis.client import LabClient
 
@@ -6,4 +7,8 @@ __all__: list[str] = [
     "fetch_data",
     "LabServer",
     "LabClient",
+    "BacktestRequest",
+    "Job",
+    "JobManager",
+    "JobStatus",
 ]
\ No newline at end of file
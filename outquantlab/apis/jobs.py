@@ -0,0 +1,191 @@
+import hashlib
+import json
+from concurrent.futures import Future, ThreadPoolExecutor
+from dataclasses import dataclass, field
+from enum import StrEnum
+from threading import Lock
+from uuid import uuid4
+
+import polars as pl
+from pydantic import BaseModel
+
+import tradeframe as tf
+from outquantlab.backtest import BacktestCancelled, CancellationToken, ProgressUpdate
+from outquantlab.core import IndicsConfig
+from outquantlab.indicators import INDICATOR_REGISTRY
+from outquantlab.main import OutQuantLab
+from outquantlab.portfolio import AggregatedResults
+
+MAX_JOBS: int = 2
+MAX_FINISHED: int = 64
+
+type JobResults = dict[str, list[str] | list[float | None] | dict[str, list[float | None]]]
+
+
+class JobStatus(StrEnum):
+    PENDING = "pending"
+    RUNNING = "running"
+    DONE = "done"
+    FAILED = "failed"
+    CANCELLED = "cancelled"
+
+
+FINISHED: tuple[JobStatus, ...] = (JobStatus.DONE, JobStatus.FAILED, JobStatus.CANCELLED)
+
+
+class BacktestRequest(BaseModel):
+    indics_active: dict[str, bool]
+    params_config: dict[str, dict[str, list[int]]]
+    assets: list[str] = []
+
+    def get_key(self) -> str:
+        return hashlib.sha256(
+            json.dumps(
+                {
+                    "indics_active": self.indics_active,
+                    "params_config": self.params_config,
+                    "assets": sorted(self.assets),
+                },
+                sort_keys=True,
+            ).encode()
+        ).hexdigest()
+
+
+@dataclass(slots=True)
+class Job:
+    id: str
+    key: str
+    status: JobStatus = JobStatus.PENDING
+    done: int = 0
+    total: int = 0
+    elapsed: float = 0.0
+    eta: float | None = None
+    error: str | None = None
+    results: JobResults | None = None
+    token: CancellationToken = field(default_factory=CancellationToken, repr=False)
+    future: Future[None] | None = field(default=None, repr=False)
+
+    def update(self, update: ProgressUpdate) -> None:
+        self.done = update.done
+        self.total = update.total
+        self.elapsed = update.elapsed
+        self.eta = update.eta
+
+    def get_status(self) -> dict[str, str | int | float | None]:
+        return {
+            "id": self.id,
+            "status": self.status,
+            "done": self.done,
+            "total": self.total,
+            "elapsed": self.elapsed,
+            "eta": self.eta,
+            "error": self.error,
+        }
+
+
+class JobManager:
+    def __init__(
+        self,
+        returns_df: tf.FrameDated,
+        max_jobs: int = MAX_JOBS,
+        max_finished: int = MAX_FINISHED,
+    ) -> None:
+        self.returns_df: tf.FrameDated = returns_df
+        self.max_finished: int = max_finished
+        self.jobs: dict[str, Job] = {}
+        self._keys: dict[str, str] = {}
+        self._lock = Lock()
+        self._executor = ThreadPoolExecutor(max_workers=max_jobs)
+
+    def submit(self, request: BacktestRequest) -> Job:
+        key: str = request.get_key()
+        with self._lock:
+            existing: str | None = self._keys.get(key)
+            if existing is not None and self.jobs[existing].status not in (
+                JobStatus.FAILED,
+                JobStatus.CANCELLED,
+            ):
+                return self.jobs[existing]
+            job = Job(id=uuid4().hex, key=key)
+            self.jobs[job.id] = job
+            self._keys[key] = job.id
+        job.future = self._executor.submit(self._run, job, request)
+        return job
+
+    def get(self, job_id: str) -> Job:
+        return self.jobs[job_id]
+
+    def cancel(self, job_id: str) -> Job:
+        job: Job = self.jobs[job_id]
+        if job.future is not None and job.future.cancel():
+            job.status = JobStatus.CANCELLED
+        else:
+            job.token.cancel()
+        return job
+
+    def shutdown(self) -> None:
+        for job in self.jobs.values():
+            if job.status in (JobStatus.PENDING, JobStatus.RUNNING):
+                self.cancel(job_id=job.id)
+        self._executor.shutdown(wait=True)
+
+    def _run(self, job: Job, request: BacktestRequest) -> None:
+        job.status = JobStatus.RUNNING
+        try:
+            lab = OutQuantLab(
+                indics=get_indics_config(request=request).get_indics_params(),
+                returns_df=get_returns_subset(
+                    returns_df=self.returns_df, assets=request.assets
+                ),
+                callbacks=[job.update],
+                token=job.token,
+            )
+            job.results = get_job_results(results=lab.backtest_aggregated(local=False))
+            job.status = JobStatus.DONE
+        except BacktestCancelled:
+            job.status = JobStatus.CANCELLED
+        except Exception as e:
+            job.error = str(e)
+            job.status = JobStatus.FAILED
+        finally:
+            self._prune()
+
+    def _prune(self) -> None:
+        with self._lock:
+            finished: list[Job] = [
+                job for job in self.jobs.values() if job.status in FINISHED
+            ]
+            for job in finished[: max(len(finished) - self.max_finished, 0)]:
+                del self.jobs[job.id]
+                if self._keys.get(job.key) == job.id:
+                    del self._keys[job.key]
+
+
+def get_indics_config(request: BacktestRequest) -> IndicsConfig:
+    return IndicsConfig(
+        indics_active={
+            name: request.indics_active.get(name, False) for name in INDICATOR_REGISTRY
+        },
+        params_config={
+            name: request.params_config.get(name, {}) for name in INDICATOR_REGISTRY
+        },
+    )
+
+
+def get_returns_subset(returns_df: tf.FrameDated, assets: list[str]) -> tf.FrameDated:
+    if not assets:
+        return returns_df
+    missing: set[str] = set(assets) - set(returns_df.get_names())
+    if missing:
+        raise ValueError(f"Unknown assets: {sorted(missing)}")
+    return tf.FrameDated.create_from_frames(
+        data=returns_df.values.select(assets), index=returns_df.index
+    )
+
+
+def get_job_results(results: AggregatedResults) -> JobResults:
+    return {
+        "dates": results.portfolio.index.cast(pl.Utf8).to_list(),
+        "portfolio": results.portfolio.values.fill_nan(None).to_list(),
+        "assets": results.assets.values.fill_nan(None).to_dict(as_series=False),
+    }
@@ -1,12 +1,21 @@
 from enum import Enum
 import uvicorn
-from fastapi import APIRouter, FastAPI
+from fastapi import APIRouter, FastAPI, HTTPException
 
 import tradeframe as tf
+from outquantlab.apis.jobs import (
+    MAX_JOBS,
+    BacktestRequest,
+    Job,
+    JobManager,
+    JobResults,
+    JobStatus,
+)
 
 
 class Server(Enum):
     DATA = "/data"
+    JOBS = "/jobs"
     PORT = 8000
     IP = "127.0.0.1"
     URL = f"http://{IP}:{PORT}{DATA}"
@@ -14,11 +23,18 @@ class Server(Enum):
 type Frames = tf.FrameDated | tf.FrameDefault | tf.SeriesDated | tf.SeriesNamed | tf.SeriesDefault
 
 class LabServer:
-    def __init__(self) -> None:
+    def __init__(
+        self, returns_df: tf.FrameDated | None = None, max_jobs: int = MAX_JOBS
+    ) -> None:
         self.app = FastAPI()
         self.router = APIRouter()
         self._data_store: dict[int, dict[str, float]] = {}
         self._current_id: int = 0
+        self.jobs: JobManager | None = (
+            None
+            if returns_df is None
+            else JobManager(returns_df=returns_df, max_jobs=max_jobs)
+        )
         self._register_routes()
 
     def _register_routes(self) -> None:
@@ -28,8 +44,43 @@ class LabServer:
                 raise ValueError("No data available")
             return self._data_store
 
+        @self.router.post(path=Server.JOBS.value, response_model=None)
+        async def submit_job(request: BacktestRequest) -> dict[str, str | int | float | None]:
+            return self._get_jobs().submit(request=request).get_status()
+
+        @self.router.get(path=f"{Server.JOBS.value}/{{job_id}}", response_model=None)
+        async def get_job(job_id: str) -> dict[str, str | int | float | None]:
+            return self._get_job(job_id=job_id).get_status()
+
+        @self.router.get(
+            path=f"{Server.JOBS.value}/{{job_id}}/results", response_model=None
+        )
+        async def get_job_results(job_id: str) -> JobResults:
+            job: Job = self._get_job(job_id=job_id)
+            if job.status != JobStatus.DONE or job.results is None:
+                raise HTTPException(
+                    status_code=409, detail=f"Job {job_id} is {job.status}"
+                )
+            return job.results
+
+        @self.router.delete(path=f"{Server.JOBS.value}/{{job_id}}", response_model=None)
+        async def cancel_job(job_id: str) -> dict[str, str | int | float | None]:
+            self._get_job(job_id=job_id)
+            return self._get_jobs().cancel(job_id=job_id).get_status()
+
         self.app.include_router(router=self.router)
 
+    def _get_jobs(self) -> JobManager:
+        if self.jobs is None:
+            raise HTTPException(status_code=503, detail="No returns data loaded")
+        return self.jobs
+
+    def _get_job(self, job_id: str) -> Job:
+        try:
+            return self._get_jobs().get(job_id=job_id)
+        except KeyError:
+            raise HTTPException(status_code=404, detail=f"Unknown job {job_id}")
+
     def start_server(self) -> None:
         print(f"Server started at {Server.URL.value}")
         uvicorn.run(app=self.app, host=Server.IP.value, port=Server.PORT.value)
@@ -1,5 +1,55 @@
+from outquantlab.backtest.cluster import Cluster, ClusterBacktestor, run_worker
+from outquantlab.backtest.incremental import IncrementalBacktestor, IncrementalState
 from outquantlab.backtest.main import Backtestor
+from outquantlab.backtest.memory import MemoryEstimate, MemoryPlan, get_memory_plan
+from outquantlab.backtest.planner import NodeCache, NodePlan, PlanStats
+from outquantlab.backtest.profiling import (
+    ComboProfile,
+    Measure,
+    ProfileReport,
+    Profiler,
+    StageProfile,
+)
+from outquantlab.backtest.progress import (
+    BacktestCancelled,
+    CancellationToken,
+    ConsoleProgress,
+    ProgressCallback,
+    ProgressEvent,
+    ProgressUpdate,
+)
+from outquantlab.backtest.results import ResultCache
+from outquantlab.backtest.scheduler import CostKey, CostModel
+from outquantlab.backtest.specs import Executor
+from outquantlab.backtest.streaming import StreamingBacktestor
 
 __all__: list[str] = [
     "Backtestor",
+    "Executor",
+    "IncrementalBacktestor",
+    "IncrementalState",
+    "NodeCache",
+    "NodePlan",
+    "PlanStats",
+    "ResultCache",
+    "ComboProfile",
+    "Measure",
+    "ProfileReport",
+    "Profiler",
+    "StageProfile",
+    "CostKey",
+    "CostModel",
+    "MemoryEstimate",
+    "MemoryPlan",
+    "get_memory_plan",
+    "StreamingBacktestor",
+    "Cluster",
+    "ClusterBacktestor",
+    "run_worker",
+    "BacktestCancelled",
+    "CancellationToken",
+    "ConsoleProgress",
+    "ProgressCallback",
+    "ProgressEvent",
+    "ProgressUpdate",
 ]
\ No newline at end of file
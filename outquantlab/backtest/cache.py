@@ -0,0 +1,178 @@
+from collections import OrderedDict
+from concurrent.futures import Future
+from threading import Lock
+from typing import NamedTuple
+
+import numquant as nq
+from outquantlab.indicators import (
+    Node,
+    NodeParams,
+    Primitive,
+    compute_multi,
+    compute_rolling,
+)
+
+CACHE_MEMORY: int = 2 * 1024**3
+
+
+class RollingKey(NamedTuple):
+    source: int
+    primitive: Primitive
+    length: int
+    min_length: int
+
+
+class CacheStats(NamedTuple):
+    hits: int
+    misses: int
+    evictions: int
+    memory: int
+
+    def __str__(self) -> str:
+        return (
+            f"Rolling Cache Statistics:\n"
+            f"  Hits: {self.hits}\n"
+            f"  Misses: {self.misses}\n"
+            f"  Evictions: {self.evictions}\n"
+            f"  Memory: {self.memory / 1024**2:.1f} MB\n"
+        )
+
+
+class RollingCache:
+    def __init__(self, sources: list[nq.Float2D], max_memory: int = CACHE_MEMORY) -> None:
+        self.max_memory: int = max_memory
+        self._sources: dict[int, nq.Float2D] = {id(source): source for source in sources}
+        self._entries: OrderedDict[RollingKey, nq.Float2D] = OrderedDict()
+        self._pending: dict[RollingKey, Future[nq.Float2D]] = {}
+        self._lock = Lock()
+        self._memory: int = 0
+        self._hits: int = 0
+        self._misses: int = 0
+        self._evictions: int = 0
+
+    def get(
+        self, array: nq.Float2D, primitive: Primitive, length: int, min_length: int
+    ) -> nq.Float2D:
+        if id(array) not in self._sources:
+            return compute_rolling(
+                array=array, primitive=primitive, length=length, min_length=min_length
+            )
+        key = RollingKey(
+            source=id(array), primitive=primitive, length=length, min_length=min_length
+        )
+        with self._lock:
+            cached: nq.Float2D | None = self._entries.get(key)
+            if cached is not None:
+                self._entries.move_to_end(key)
+                self._hits += 1
+                return cached
+            pending: Future[nq.Float2D] | None = self._pending.get(key)
+            owner: bool = pending is None
+            if pending is None:
+                self._misses += 1
+                pending = Future()
+                self._pending[key] = pending
+            else:
+                self._hits += 1
+        if not owner:
+            return pending.result()
+        return self._compute(key=key, array=array, pending=pending)
+
+    def get_multi(
+        self,
+        array: nq.Float2D,
+        primitive: Primitive,
+        lengths: list[int],
+        min_lengths: list[int],
+    ) -> list[nq.Float2D]:
+        if id(array) not in self._sources:
+            return compute_multi(
+                array=array, primitive=primitive, lengths=lengths, min_lengths=min_lengths
+            )
+        keys: list[RollingKey] = [
+            RollingKey(
+                source=id(array), primitive=primitive, length=length, min_length=min_length
+            )
+            for length, min_length in zip(lengths, min_lengths)
+        ]
+        found: dict[RollingKey, nq.Float2D] = {}
+        waiting: dict[RollingKey, Future[nq.Float2D]] = {}
+        owned: dict[RollingKey, Future[nq.Float2D]] = {}
+        with self._lock:
+            for key in dict.fromkeys(keys):
+                cached: nq.Float2D | None = self._entries.get(key)
+                if cached is not None:
+                    self._entries.move_to_end(key)
+                    self._hits += 1
+                    found[key] = cached
+                elif key in self._pending:
+                    self._hits += 1
+                    waiting[key] = self._pending[key]
+                else:
+                    self._misses += 1
+                    owned[key] = Future()
+                    self._pending[key] = owned[key]
+        if owned:
+            found.update(self._compute_multi(array=array, pending=owned))
+        for key, pending in waiting.items():
+            found[key] = pending.result()
+        return [found[key] for key in keys]
+
+    def evaluate[P: NodeParams, R](self, node: Node[P, R], array: nq.Float2D) -> R:
+        return node.func(array, node.params, self)
+
+    def clear(self) -> None:
+        with self._lock:
+            self._entries.clear()
+            self._memory = 0
+
+    def get_stats(self) -> CacheStats:
+        return CacheStats(
+            hits=self._hits,
+            misses=self._misses,
+            evictions=self._evictions,
+            memory=self._memory,
+        )
+
+    def _compute(
+        self, key: RollingKey, array: nq.Float2D, pending: Future[nq.Float2D]
+    ) -> nq.Float2D:
+        return self._compute_multi(array=array, pending={key: pending})[key]
+
+    def _compute_multi(
+        self, array: nq.Float2D, pending: dict[RollingKey, Future[nq.Float2D]]
+    ) -> dict[RollingKey, nq.Float2D]:
+        keys: list[RollingKey] = list(pending)
+        try:
+            results: list[nq.Float2D] = compute_multi(
+                array=array,
+                primitive=keys[0].primitive,
+                lengths=[key.length for key in keys],
+                min_lengths=[key.min_length for key in keys],
+            )
+        except Exception as e:
+            with self._lock:
+                for key in keys:
+                    del self._pending[key]
+            for future in pending.values():
+                future.set_exception(e)
+            raise
+        computed: dict[RollingKey, nq.Float2D] = dict(zip(keys, results))
+        with self._lock:
+            for key, result in computed.items():
+                result.flags.writeable = False
+                self._store(key=key, result=result)
+                del self._pending[key]
+        for key, result in computed.items():
+            pending[key].set_result(result)
+        return computed
+
+    def _store(self, key: RollingKey, result: nq.Float2D) -> None:
+        if result.nbytes > self.max_memory:
+            return
+        self._entries[key] = result
+        self._memory += result.nbytes
+        while self._memory > self.max_memory:
+            _, evicted = self._entries.popitem(last=False)
+            self._memory -= evicted.nbytes
+            self._evictions += 1
@@ -0,0 +1,334 @@
+import os
+import time
+import zlib
+from enum import Enum
+from multiprocessing import get_context
+from multiprocessing.process import BaseProcess
+from multiprocessing.connection import Client, Connection, Listener, wait
+from threading import Thread
+from typing import NamedTuple
+
+import numquant as nq
+from outquantlab.backtest.cache import CACHE_MEMORY, RollingCache
+from outquantlab.backtest.data import DataArrays, get_inputs
+from outquantlab.backtest.progress import CancellationToken, ProgressCallback
+from outquantlab.backtest.scheduler import CostModel
+from outquantlab.backtest.specs import (
+    UNIT_SIZE,
+    BacktestSpecs,
+    ComboTask,
+    group_tasks,
+)
+from outquantlab.indicators import GenericIndic, Source
+
+UNITS_PER_WORKER: int = 2
+COMPRESSION_LEVEL: int = 1
+AUTHKEY_SIZE: int = 32
+ACCEPT_TIMEOUT: float = 60.0
+JOIN_TIMEOUT: float = 10.0
+
+
+class Cluster(Enum):
+    IP = "127.0.0.1"
+    PORT = 8010
+
+
+type Address = tuple[str, int]
+
+
+class ClusterSetup(NamedTuple):
+    pct_returns: nq.Float2D
+    indics: list[GenericIndic]
+    cache_memory: int
+
+
+class ClusterUnit(NamedTuple):
+    unit: int
+    tasks: list[ComboTask]
+
+
+class ClusterResult(NamedTuple):
+    unit: int
+    data: bytes
+    seconds: list[float]
+
+
+class ClusterError(NamedTuple):
+    unit: int
+    task: ComboTask
+    message: str
+
+
+class ClusterBacktestor:
+    def __init__(
+        self,
+        pct_returns: nq.Float2D,
+        indics: list[GenericIndic],
+        local: bool,
+        workers: int,
+        address: Address | None = None,
+        authkey: bytes | None = None,
+        spawn: bool = True,
+        timeout: float = ACCEPT_TIMEOUT,
+        cache_memory: int = CACHE_MEMORY,
+        costs: CostModel | None = None,
+        callbacks: list[ProgressCallback] | None = None,
+        token: CancellationToken | None = None,
+    ) -> None:
+        self.pct_returns: nq.Float2D = pct_returns
+        self.indics: list[GenericIndic] = indics
+        self.workers: int = workers
+        self.address: Address = get_address(address=address, spawn=spawn)
+        self.authkey: bytes = get_authkey(authkey=authkey, spawn=spawn)
+        self.spawn: bool = spawn
+        self.timeout: float = timeout
+        self.cache_memory: int = cache_memory
+        self.costs: CostModel = costs or CostModel()
+        self.specs = BacktestSpecs(
+            pct_returns=pct_returns,
+            indics=self.indics,
+            local=local,
+            callbacks=callbacks,
+            token=token,
+        )
+        self.units: list[ClusterUnit] = get_units(
+            tasks=self.costs.order(tasks=self.specs.tasks, indics=self.indics),
+            size=UNIT_SIZE,
+        )
+
+    def process_backtest(self) -> nq.Float2D:
+        main_array: nq.Float2D = self.specs.get_main_array()
+        with Listener(address=self.address, authkey=self.authkey) as listener:
+            processes: list[BaseProcess] = (
+                spawn_workers(
+                    count=self.workers,
+                    address=listener.address,
+                    authkey=self.authkey,
+                )
+                if self.spawn
+                else []
+            )
+            connections: list[Connection] = []
+            try:
+                connections = accept_workers(
+                    listener=listener, count=self.workers, timeout=self.timeout
+                )
+                self._process_units(connections=connections, main_array=main_array)
+            finally:
+                for connection in connections:
+                    close_worker(connection=connection)
+                for process in processes:
+                    process.join(timeout=JOIN_TIMEOUT)
+                    if process.is_alive():
+                        process.terminate()
+        return main_array
+
+    def _process_units(
+        self, connections: list[Connection], main_array: nq.Float2D
+    ) -> None:
+        setup = ClusterSetup(
+            pct_returns=self.pct_returns,
+            indics=self.indics,
+            cache_memory=self.cache_memory,
+        )
+        queue: list[ClusterUnit] = list(reversed(self.units))
+        running: dict[Connection, list[ClusterUnit]] = {}
+        for connection in connections:
+            try:
+                connection.send(setup)
+            except OSError:
+                continue
+            running[connection] = []
+        while queue or any(running.values()):
+            self.specs.check_cancelled()
+            dispatch_units(queue=queue, running=running)
+            ready: list[Connection] = [
+                connection
+                for connection in wait(
+                    [connection for connection, units in running.items() if units]
+                )
+                if isinstance(connection, Connection)
+            ]
+            for connection in ready:
+                try:
+                    message: ClusterResult | ClusterError = connection.recv()
+                except (EOFError, OSError):
+                    drop_worker(connection=connection, queue=queue, running=running)
+                    continue
+                if isinstance(message, ClusterError):
+                    raise Exception(
+                        f"Error during backtest.\n "
+                        f"Issue: {message.message} \n "
+                        f"Indicator:\n {self.indics[message.task.indic]}"
+                    )
+                self._store(result=message, main_array=main_array)
+                running[connection] = [
+                    unit for unit in running[connection] if unit.unit != message.unit
+                ]
+
+    def _store(self, result: ClusterResult, main_array: nq.Float2D) -> None:
+        unit: ClusterUnit = self.units[result.unit]
+        block: nq.Float2D = decompress_block(
+            data=result.data,
+            length=self.specs.days,
+            width=len(unit.tasks) * self.specs.assets,
+        )
+        for position, task in enumerate(unit.tasks):
+            main_array[:, task.start : task.start + self.specs.assets] = block[
+                :, position * self.specs.assets : (position + 1) * self.specs.assets
+            ]
+            self.costs.record(
+                indic=self.indics[task.indic],
+                combo=self.indics[task.indic].combos[task.combo],
+                seconds=result.seconds[position],
+            )
+            self.specs.register_result(indic=task.indic)
+
+
+class ClusterWorker:
+    def __init__(self, setup: ClusterSetup) -> None:
+        self.indics: list[GenericIndic] = setup.indics
+        self.assets: int = setup.pct_returns.shape[1]
+        self.days: int = setup.pct_returns.shape[0]
+        inputs: set[Source] = get_inputs(indics=self.indics)
+        self.data = DataArrays(pct_returns=setup.pct_returns)
+        self.data.prepare(inputs=inputs)
+        self.data.rolling = RollingCache(
+            sources=self.data.get_sources(inputs=inputs),
+            max_memory=setup.cache_memory,
+        )
+
+    def process(self, unit: ClusterUnit) -> ClusterResult | ClusterError:
+        output: nq.Float2D = nq.arrays.create_empty(
+            length=self.days, width=len(unit.tasks) * self.assets
+        )
+        seconds: list[float] = []
+        for position, task in enumerate(unit.tasks):
+            indic: GenericIndic = self.indics[task.indic]
+            start: float = time.perf_counter()
+            try:
+                indic.process_param(
+                    data_arrays=self.data,
+                    params=indic.combos[task.combo],
+                    output=output[
+                        :, position * self.assets : (position + 1) * self.assets
+                    ],
+                )
+            except Exception as e:
+                return ClusterError(unit=unit.unit, task=task, message=str(e))
+            seconds.append(time.perf_counter() - start)
+        return ClusterResult(
+            unit=unit.unit, data=compress_block(block=output), seconds=seconds
+        )
+
+
+def run_worker(
+    authkey: bytes, address: Address = (Cluster.IP.value, Cluster.PORT.value)
+) -> None:
+    with Client(address=address, authkey=authkey) as connection:
+        worker = ClusterWorker(setup=connection.recv())
+        while (unit := connection.recv()) is not None:
+            connection.send(worker.process(unit=unit))
+
+
+def spawn_workers(
+    count: int, address: Address, authkey: bytes
+) -> list[BaseProcess]:
+    processes: list[BaseProcess] = [
+        get_context("spawn").Process(
+            target=run_worker,
+            kwargs={"authkey": authkey, "address": address},
+            daemon=True,
+        )
+        for _ in range(count)
+    ]
+    for process in processes:
+        process.start()
+    return processes
+
+
+def accept_workers(listener: Listener, count: int, timeout: float) -> list[Connection]:
+    connections: list[Connection] = []
+
+    def accept() -> None:
+        try:
+            while len(connections) < count:
+                connections.append(listener.accept())
+        except OSError:
+            return
+
+    acceptor = Thread(target=accept, daemon=True)
+    acceptor.start()
+    acceptor.join(timeout=timeout)
+    if acceptor.is_alive():
+        for connection in connections:
+            connection.close()
+        raise TimeoutError(
+            f"{len(connections)} of {count} cluster workers connected "
+            f"within {timeout}s"
+        )
+    return connections
+
+
+def dispatch_units(
+    queue: list[ClusterUnit], running: dict[Connection, list[ClusterUnit]]
+) -> None:
+    for connection, units in list(running.items()):
+        while queue and len(units) < UNITS_PER_WORKER:
+            unit: ClusterUnit = queue.pop()
+            units.append(unit)
+            try:
+                connection.send(unit)
+            except OSError:
+                drop_worker(connection=connection, queue=queue, running=running)
+                break
+    if queue and not running:
+        raise ConnectionError("All cluster workers disconnected")
+
+
+def drop_worker(
+    connection: Connection,
+    queue: list[ClusterUnit],
+    running: dict[Connection, list[ClusterUnit]],
+) -> None:
+    queue.extend(reversed(running.pop(connection)))
+    connection.close()
+
+
+def close_worker(connection: Connection) -> None:
+    try:
+        connection.send(None)
+    except OSError:
+        pass
+    connection.close()
+
+
+def get_units(tasks: list[ComboTask], size: int) -> list[ClusterUnit]:
+    return [
+        ClusterUnit(unit=unit, tasks=unit_tasks)
+        for unit, unit_tasks in enumerate(group_tasks(tasks=tasks, size=size))
+    ]
+
+
+def get_address(address: Address | None, spawn: bool) -> Address:
+    if address is not None:
+        return address
+    return (Cluster.IP.value, 0 if spawn else Cluster.PORT.value)
+
+
+def get_authkey(authkey: bytes | None, spawn: bool) -> bytes:
+    if authkey is not None:
+        return authkey
+    if not spawn:
+        raise ValueError("authkey is required to connect external workers")
+    return os.urandom(AUTHKEY_SIZE)
+
+
+def compress_block(block: nq.Float2D) -> bytes:
+    return zlib.compress(block.tobytes(), level=COMPRESSION_LEVEL)
+
+
+def decompress_block(data: bytes, length: int, width: int) -> nq.Float2D:
+    return nq.arrays.create_from_buffer(
+        buffer=memoryview(zlib.decompress(data)), length=length, width=width
+    )
@@ -1,30 +1,151 @@
+from collections.abc import Callable
 from dataclasses import dataclass, field
+from threading import RLock
+from typing import NamedTuple
+
 import numquant as nq
+from outquantlab.indicators import DirectRolling, GenericIndic, RollingProvider, Source
+
+NODE_SOURCES: tuple[Source, ...] = (Source.PRICES, Source.LOG_RETURNS)
+
+
+class ArrayStore:
+    def __init__(self, compute: Callable[[Source], nq.Float2D]) -> None:
+        self._arrays: dict[Source, nq.Float2D] = {}
+        self._compute: Callable[[Source], nq.Float2D] = compute
+        self._lock = RLock()
+
+    def get(self, source: Source) -> nq.Float2D:
+        array: nq.Float2D | None = self._arrays.get(source)
+        if array is not None:
+            return array
+        with self._lock:
+            if source not in self._arrays:
+                self._arrays[source] = self._compute(source)
+            return self._arrays[source]
+
+
+class DataInputs(NamedTuple):
+    used: set[Source]
+    skipped: set[Source]
+
+    def __str__(self) -> str:
+        return (
+            f"Data Inputs:\n"
+            f"  Used: {', '.join(sorted(self.used)) or '-'}\n"
+            f"  Skipped: {', '.join(sorted(self.skipped)) or '-'}\n"
+        )
+
 
 @dataclass(slots=True)
 class DataArrays:
     pct_returns: nq.Float2D
-    prices: nq.Float2D = field(init=False)
-    log_returns: nq.Float2D = field(init=False)
-    adjusted_returns: nq.Float2D = field(init=False)
+    rolling: RollingProvider = field(init=False, default_factory=DirectRolling)
+    _store: ArrayStore = field(init=False)
 
     def __post_init__(self) -> None:
-        prices: nq.Float2D = nq.arrays.get_prices(returns=self.pct_returns)
-        log_returns: nq.Float2D = nq.arrays.get_log_returns(prices=prices)
-        hv: nq.Float2D = nq.metrics.roll.get_composite_volatility(returns_array=self.pct_returns)
-        self.prices = nq.arrays.shift(original=prices)
-        self.log_returns = nq.arrays.shift(original=log_returns)
-        self.adjusted_returns = get_volatility_adjusted_returns(
-            pct_returns_array=self.pct_returns, hv_array=hv
+        self._store = ArrayStore(compute=self._compute)
+
+    @property
+    def prices(self) -> nq.Float2D:
+        return self._store.get(source=Source.PRICES)
+
+    @property
+    def log_returns(self) -> nq.Float2D:
+        return self._store.get(source=Source.LOG_RETURNS)
+
+    @property
+    def adjusted_returns(self) -> nq.Float2D:
+        return self._store.get(source=Source.ADJUSTED_RETURNS)
+
+    def prepare(self, inputs: set[Source]) -> None:
+        for source in inputs:
+            self._store.get(source=source)
+
+    def get_sources(self, inputs: set[Source]) -> list[nq.Float2D]:
+        return [
+            self._store.get(source=source)
+            for source in NODE_SOURCES
+            if source in inputs
+        ]
+
+    def get_window(self, start: int) -> "DataWindow":
+        return DataWindow(data=self, start=start, rolling=self.rolling)
+
+    def _compute(self, source: Source) -> nq.Float2D:
+        computations: dict[Source, Callable[[], nq.Float2D]] = {
+            Source.PRICES: self._get_prices,
+            Source.LOG_RETURNS: self._get_log_returns,
+            Source.ADJUSTED_RETURNS: self._get_adjusted_returns,
+        }
+        return computations[source]()
+
+    def _get_prices(self) -> nq.Float2D:
+        return nq.arrays.get_lagged_prices(returns=self.pct_returns)
+
+    def _get_log_returns(self) -> nq.Float2D:
+        return nq.arrays.get_log_returns(prices=self.prices)
+
+    def _get_adjusted_returns(self) -> nq.Float2D:
+        return get_volatility_adjusted_returns(
+            pct_returns_array=self.pct_returns,
+            hv_array=nq.metrics.roll.get_composite_volatility(
+                returns_array=self.pct_returns
+            ),
         )
 
 
+@dataclass(slots=True)
+class DataWindow:
+    data: DataArrays
+    start: int
+    rolling: RollingProvider
+    _store: ArrayStore = field(init=False)
+
+    def __post_init__(self) -> None:
+        self._store = ArrayStore(compute=self._compute)
+
+    @property
+    def pct_returns(self) -> nq.Float2D:
+        return self.data.pct_returns[self.start :]
+
+    @property
+    def prices(self) -> nq.Float2D:
+        return self._store.get(source=Source.PRICES)
+
+    @property
+    def log_returns(self) -> nq.Float2D:
+        return self._store.get(source=Source.LOG_RETURNS)
+
+    @property
+    def adjusted_returns(self) -> nq.Float2D:
+        return self._store.get(source=Source.ADJUSTED_RETURNS)
+
+    def get_sources(self, inputs: set[Source]) -> list[nq.Float2D]:
+        return [
+            self._store.get(source=source)
+            for source in NODE_SOURCES
+            if source in inputs
+        ]
+
+    def _compute(self, source: Source) -> nq.Float2D:
+        array: nq.Float2D = getattr(self.data, source)
+        return array[self.start :]
+
+
+def get_inputs(indics: list[GenericIndic]) -> set[Source]:
+    return set[Source]().union(*(indic.get_inputs() for indic in indics))
+
+
+def get_data_inputs(inputs: set[Source]) -> DataInputs:
+    return DataInputs(used=inputs, skipped=set(Source) - inputs)
+
+
 def get_volatility_adjusted_returns(
     pct_returns_array: nq.Float2D,
     hv_array: nq.Float2D,
     target_volatility: int = 25,
 ) -> nq.Float2D:
-    vol_adj_position_size_shifted: nq.Float2D = nq.arrays.shift(
-        original=target_volatility / hv_array
+    return nq.arrays.multiply_lagged(
+        array=pct_returns_array, factor=nq.Float32(target_volatility) / hv_array
     )
-    return pct_returns_array * vol_adj_position_size_shifted
@@ -0,0 +1,253 @@
+from collections.abc import Callable
+from concurrent.futures import ThreadPoolExecutor
+from dataclasses import dataclass
+from pathlib import Path
+from typing import NamedTuple
+
+import polars as pl
+
+import numquant as nq
+from outquantlab.backtest.cache import CACHE_MEMORY, RollingCache
+from outquantlab.backtest.data import DataArrays, DataWindow, get_inputs
+from outquantlab.backtest.profiling import Profiler
+from outquantlab.backtest.progress import (
+    BacktestCancelled,
+    CancellationToken,
+    ProgressCallback,
+)
+from outquantlab.backtest.specs import BacktestSpecs
+from outquantlab.indicators import AssetsData, BaseParams, GenericIndic, Source
+
+WARMUP_FACTOR: int = 2
+
+
+class ComboResult(NamedTuple):
+    returns: nq.Float2D
+    scalar: nq.metrics.roll.ExpandingState
+
+
+type ComboProcess = Callable[
+    [GenericIndic, BaseParams, nq.metrics.roll.ExpandingState | None], ComboResult
+]
+
+
+@dataclass(slots=True)
+class IncrementalState:
+    days: int
+    columns: list[str]
+    scalars: list[nq.metrics.roll.ExpandingState]
+
+    def save(self, path: Path) -> None:
+        pl.DataFrame(
+            {
+                "columns": self.columns,
+                "total": [scalar.total for scalar in self.scalars],
+                "compensation": [scalar.compensation for scalar in self.scalars],
+                "observations": [scalar.observations for scalar in self.scalars],
+                "days": [self.days] * len(self.columns),
+            },
+            schema={
+                "columns": pl.Utf8,
+                "total": pl.Float64,
+                "compensation": pl.Float64,
+                "observations": pl.Int64,
+                "days": pl.Int64,
+            },
+        ).write_parquet(file=path)
+
+    @classmethod
+    def load(cls, path: Path) -> "IncrementalState":
+        df: pl.DataFrame = pl.read_parquet(source=path)
+        return cls(
+            days=df["days"][0],
+            columns=df["columns"].to_list(),
+            scalars=[
+                nq.metrics.roll.ExpandingState(
+                    total=total, compensation=compensation, observations=observations
+                )
+                for total, compensation, observations in zip(
+                    df["total"].to_list(),
+                    df["compensation"].to_list(),
+                    df["observations"].to_list(),
+                )
+            ],
+        )
+
+
+class IncrementalBacktestor:
+    def __init__(
+        self,
+        pct_returns: nq.Float2D,
+        indics: list[GenericIndic],
+        local: bool,
+        cache_memory: int = CACHE_MEMORY,
+        profiler: Profiler | None = None,
+        callbacks: list[ProgressCallback] | None = None,
+        token: CancellationToken | None = None,
+    ) -> None:
+        self.indics: list[GenericIndic] = indics
+        self.profiler: Profiler = profiler or Profiler(active=False)
+        with self.profiler.stage(name="data_arrays"):
+            self.inputs: set[Source] = get_inputs(indics=indics)
+            self.data: DataArrays = DataArrays(pct_returns=pct_returns)
+            self.data.prepare(inputs=self.inputs)
+        self.cache_memory: int = cache_memory
+        self.specs = BacktestSpecs(
+            pct_returns=pct_returns,
+            indics=self.indics,
+            local=local,
+            callbacks=callbacks,
+            token=token,
+        )
+
+    def process_backtest(self) -> tuple[nq.Float2D, IncrementalState]:
+        main_array: nq.Float2D = self.specs.get_main_array()
+        self.data.rolling = RollingCache(
+            sources=self.data.get_sources(inputs=self.inputs),
+            max_memory=self.cache_memory,
+        )
+        scalars: list[nq.metrics.roll.ExpandingState] = self._process_indics(
+            output=main_array,
+            process=lambda indic, combo, _: process_full(
+                indic=indic, data=self.data, combo=combo
+            ),
+            scalars=[None] * self.specs.params,
+        )
+        return main_array, IncrementalState(
+            days=self.specs.days, columns=self.get_columns(), scalars=scalars
+        )
+
+    def process_increment(self, state: IncrementalState) -> nq.Float2D:
+        self.validate(state=state)
+        new_days: int = self.specs.days - state.days
+        output: nq.Float2D = nq.arrays.create_empty(
+            length=max(new_days, 0), width=self.specs.total
+        )
+        if new_days <= 0:
+            return output
+        window: DataWindow = self.data.get_window(
+            start=max(state.days - self.get_warmup(), 0)
+        )
+        window.rolling = RollingCache(
+            sources=window.get_sources(inputs=self.inputs),
+            max_memory=self.cache_memory,
+        )
+        state.scalars = self._process_indics(
+            output=output,
+            process=lambda indic, combo, scalar: process_new(
+                indic=indic,
+                data=window,
+                combo=combo,
+                scalar=scalar,
+                new_days=new_days,
+            ),
+            scalars=list(state.scalars),
+        )
+        state.days = self.specs.days
+        return output
+
+    def get_columns(self) -> list[str]:
+        return [
+            f"{indic.name}_{combo_name}"
+            for indic in self.indics
+            for combo_name in indic.get_combo_names()
+        ]
+
+    def get_warmup(self) -> int:
+        return WARMUP_FACTOR * int(
+            max(sum(combo.values) for indic in self.indics for combo in indic.combos)
+        )
+
+    def validate(self, state: IncrementalState) -> None:
+        if state.columns != self.get_columns():
+            raise ValueError(
+                "Incremental state does not match the current indicators and params"
+            )
+        if state.days > self.specs.days:
+            raise ValueError(
+                f"Incremental state covers {state.days} days, data only has {self.specs.days}"
+            )
+        if not all(scalar.is_ready() for scalar in state.scalars):
+            raise ValueError(
+                "Incremental backtest requires at least one year of normalized history"
+            )
+
+    def _process_indics(
+        self,
+        output: nq.Float2D,
+        process: ComboProcess,
+        scalars: list[nq.metrics.roll.ExpandingState | None],
+    ) -> list[nq.metrics.roll.ExpandingState]:
+        new_scalars: list[nq.metrics.roll.ExpandingState] = []
+        offset: int = 0
+
+        def process_profiled(
+            indic: GenericIndic,
+            combo: BaseParams,
+            scalar: nq.metrics.roll.ExpandingState | None,
+        ) -> ComboResult:
+            self.specs.check_cancelled()
+            with self.profiler.combo(indic=indic.name, combo=combo.get_names()):
+                return process(indic, combo, scalar)
+
+        with ThreadPoolExecutor(max_workers=self.specs.thread_nb) as global_executor:
+            for index, indic in enumerate(self.indics):
+                try:
+                    results: list[ComboResult] = list(
+                        global_executor.map(
+                            process_profiled,
+                            [indic] * indic.quantity,
+                            indic.combos,
+                            scalars[offset : offset + indic.quantity],
+                        )
+                    )
+                    with self.profiler.stage(name="fill_main_array"):
+                        self.specs.fill_main_array(
+                            main_array=output,
+                            results_list=[result.returns for result in results],
+                            indic=index,
+                        )
+                    new_scalars.extend(result.scalar for result in results)
+                    offset += indic.quantity
+                except BacktestCancelled:
+                    raise
+                except Exception as e:
+                    raise Exception(
+                        f"Error during incremental backtest.\n "
+                        f"Issue: {e} \n "
+                        f"Indicator:\n {indic}"
+                    )
+        return new_scalars
+
+
+def process_full(indic: GenericIndic, data: AssetsData, combo: BaseParams) -> ComboResult:
+    signal: nq.Float2D = indic.execute(data=data, params=combo)
+    scalar: nq.metrics.roll.ExpandingState = nq.metrics.roll.get_scalar_state(
+        raw_signal=signal
+    )
+    return ComboResult(
+        returns=indic.normalize_signal(signal=signal, long_only=False)
+        * data.adjusted_returns,
+        scalar=scalar,
+    )
+
+
+def process_new(
+    indic: GenericIndic,
+    data: AssetsData,
+    combo: BaseParams,
+    scalar: nq.metrics.roll.ExpandingState | None,
+    new_days: int,
+) -> ComboResult:
+    signal: nq.Float2D = indic.execute(data=data, params=combo)[-new_days:]
+    normalized, new_scalar = nq.metrics.roll.extend_scalar_normalisation(
+        raw_signal=signal,
+        state=scalar
+        or nq.metrics.roll.ExpandingState(
+            total=0.0, compensation=0.0, observations=0
+        ),
+    )
+    return ComboResult(
+        returns=normalized * data.adjusted_returns[-new_days:],
+        scalar=new_scalar,
+    )
@@ -1,40 +1,308 @@
-from concurrent.futures import ThreadPoolExecutor
+import sys
+import time
+from collections.abc import Callable
+from concurrent.futures import (
+    Future,
+    ProcessPoolExecutor,
+    ThreadPoolExecutor,
+    as_completed,
+)
+from pathlib import Path
 
-from outquantlab.backtest.data import DataArrays
-from outquantlab.backtest.specs import BacktestSpecs
-from outquantlab.indicators import GenericIndic
+from outquantlab.backtest.cache import CACHE_MEMORY, RollingCache
+from outquantlab.backtest.data import DataArrays, get_data_inputs, get_inputs
+from outquantlab.backtest.memory import (
+    MemoryPlan,
+    create_temporary_storage,
+    get_memory_plan,
+)
+from outquantlab.backtest.planner import NodeCache, NodePlan, PlanStats
+from outquantlab.backtest.profiling import ComboProfile, Profiler
+from outquantlab.backtest.progress import (
+    BacktestCancelled,
+    CancellationToken,
+    ProgressCallback,
+)
+from outquantlab.backtest.results import ResultCache
+from outquantlab.backtest.scheduler import CostModel
+from outquantlab.backtest.shared import (
+    SharedArrays,
+    init_shared_worker,
+    process_shared_tasks,
+)
+from outquantlab.backtest.specs import (
+    UNIT_SIZE,
+    BacktestSpecs,
+    ComboTask,
+    Executor,
+    get_thread_count,
+    group_tasks,
+)
+from outquantlab.indicators import BaseParams, DirectRolling, GenericIndic, Source
 import numquant as nq
 
 
 class Backtestor:
-    def __init__(self, pct_returns: nq.Float2D, indics: list[GenericIndic], local: bool) -> None:
+    def __init__(
+        self,
+        pct_returns: nq.Float2D,
+        indics: list[GenericIndic],
+        local: bool,
+        cache_memory: int = CACHE_MEMORY,
+        executor: Executor = Executor.THREAD,
+        storage: Path | None = None,
+        results: ResultCache | None = None,
+        profiler: Profiler | None = None,
+        costs: CostModel | None = None,
+        max_memory: int | None = None,
+        callbacks: list[ProgressCallback] | None = None,
+        token: CancellationToken | None = None,
+    ) -> None:
         self.indics: list[GenericIndic] = indics
-        self.data: DataArrays = DataArrays(pct_returns=pct_returns)
+        self.costs: CostModel = costs or CostModel()
+        self.profiler: Profiler = profiler or Profiler(active=False)
+        with self.profiler.stage(name="data_arrays"):
+            self.inputs: set[Source] = get_inputs(indics=indics)
+            self.data: DataArrays = DataArrays(pct_returns=pct_returns)
+            self.data.prepare(inputs=self.inputs)
+        self.cache_memory: int = cache_memory
+        self.executor: Executor = executor
+        self.storage: Path | None = storage
+        self.results: ResultCache | None = results
+        self.memory: MemoryPlan = get_memory_plan(
+            indics=self.indics,
+            days=pct_returns.shape[0],
+            assets=pct_returns.shape[1],
+            threads=get_thread_count(),
+            cache_memory=cache_memory,
+            max_memory=max_memory,
+            data_arrays=len(self.inputs) + 1,
+        )
         self.specs = BacktestSpecs(
             pct_returns=pct_returns,
             indics=self.indics,
-            local=local
+            local=local,
+            callbacks=callbacks,
+            token=token,
+            threads=self.memory.threads,
         )
+        self.cache_memory = self.memory.cache_memory
+        self._temporary: Path | None = None
+        if self.storage is None and (
+            self.memory.on_disk or executor == Executor.PROCESS
+        ):
+            self._temporary = create_temporary_storage(shared=not self.memory.on_disk)
+            self.storage = self._temporary
+        if self.specs.local:
+            print(get_data_inputs(inputs=self.inputs))
+        if self.specs.local and max_memory is not None:
+            print(self.memory)
 
     def process_backtest(self) -> nq.Float2D:
-        main_array: nq.Float2D = self.specs.get_main_array()
-        with ThreadPoolExecutor(max_workers=self.specs.thread_nb) as global_executor:
-            for indic in self.indics:
-                try:
-                    results_list: list[nq.Float2D] = indic.process_params_parallel(
-                        data_arrays=self.data,
+        processes: dict[Executor, Callable[[], nq.Float2D]] = {
+            Executor.THREAD: self._process_threads,
+            Executor.PROCESS: self._process_processes,
+        }
+        try:
+            with self.profiler.stage(name="backtest"):
+                return processes[self.executor]()
+        finally:
+            self._release_storage()
+
+    def _process_threads(self) -> nq.Float2D:
+        main_array: nq.Float2D = self.specs.get_main_array(storage=self.storage)
+        rolling = RollingCache(
+            sources=self.data.get_sources(inputs=self.inputs),
+            max_memory=self.cache_memory,
+        )
+        cached: set[int] = self._load_cached(main_array=main_array)
+        stats: list[PlanStats] = []
+        try:
+            with ThreadPoolExecutor(
+                max_workers=self.specs.thread_nb
+            ) as global_executor:
+                for chunk in self.memory.chunks:
+                    pending: set[int] = {
+                        index for index in chunk if index not in cached
+                    }
+                    nodes = NodeCache(
+                        rolling=rolling,
+                        plan=NodePlan(indics=[self.indics[index] for index in pending]),
+                    )
+                    self.data.rolling = nodes
+                    self._process_chunk(
                         global_executor=global_executor,
+                        main_array=main_array,
+                        indics=pending,
                     )
+                    stats.append(nodes.get_stats())
+            if self.specs.local:
+                print(rolling.get_stats())
+                print(PlanStats(*[sum(values) for values in zip(*stats)]))
+                self._print_results_stats()
+        finally:
+            rolling.clear()
+            self.data.rolling = DirectRolling()
+        return main_array
+
+    def _process_chunk(
+        self,
+        global_executor: ThreadPoolExecutor,
+        main_array: nq.Float2D,
+        indics: set[int],
+    ) -> None:
+        remaining: dict[int, int] = {
+            index: self.indics[index].quantity for index in indics
+        }
+        futures: dict[Future[None], ComboTask] = {
+            global_executor.submit(self._process_task, task, main_array): task
+            for task in self._get_ordered_tasks(indics=indics)
+        }
+        for future in as_completed(futures):
+            task: ComboTask = futures[future]
+            try:
+                future.result()
+            except BacktestCancelled:
+                for pending in futures:
+                    pending.cancel()
+                raise
+            except Exception as e:
+                for pending in futures:
+                    pending.cancel()
+                raise Exception(
+                    f"Error during backtest.\n "
+                    f"Issue: {e} \n "
+                    f"Indicator:\n {self.indics[task.indic]}"
+                )
+            self.specs.register_result(indic=task.indic)
+            remaining[task.indic] -= 1
+            if remaining[task.indic] == 0:
+                self._save_result(
+                    indic=self.indics[task.indic],
+                    block=main_array[:, self.specs.blocks[task.indic]],
+                )
 
-                    self.specs.fill_main_array(
+    def _process_task(self, task: ComboTask, main_array: nq.Float2D) -> None:
+        self.specs.check_cancelled()
+        indic: GenericIndic = self.indics[task.indic]
+        combo: BaseParams = indic.combos[task.combo]
+        start: float = time.perf_counter()
+        with self.profiler.combo(indic=indic.name, combo=combo.get_names()):
+            indic.process_param(
+                data_arrays=self.data,
+                params=combo,
+                output=main_array[:, task.start : task.start + self.specs.assets],
+            )
+        self.costs.record(
+            indic=indic, combo=combo, seconds=time.perf_counter() - start
+        )
+
+    def _process_processes(self) -> nq.Float2D:
+        if self.storage is None:
+            raise ValueError("Process executor requires a main array storage")
+        main_array: nq.Float2D = self.specs.get_main_array(storage=self.storage)
+        cached: set[int] = self._load_cached(main_array=main_array)
+        with SharedArrays(
+            data=self.data, main_shape=main_array.shape, storage=self.storage
+        ) as shared:
+            with ProcessPoolExecutor(
+                max_workers=self.specs.thread_nb,
+                initializer=init_shared_worker,
+                initargs=(
+                    shared.specs,
+                    self.indics,
+                    self.cache_memory,
+                    self.profiler.active,
+                ),
+            ) as global_executor:
+                for chunk in self.memory.chunks:
+                    self._process_units(
+                        global_executor=global_executor,
                         main_array=main_array,
-                        results_list=results_list,
+                        indics={index for index in chunk if index not in cached},
                     )
+        if self.specs.local:
+            self._print_results_stats()
+        return main_array
 
-                except Exception as e:
-                    raise Exception(
-                        f"Error during backtest.\n "
-                        f"Issue: {e} \n "
-                        f"Indicator:\n {indic}"
+    def _process_units(
+        self,
+        global_executor: ProcessPoolExecutor,
+        main_array: nq.Float2D,
+        indics: set[int],
+    ) -> None:
+        remaining: dict[int, int] = {
+            index: self.indics[index].quantity for index in indics
+        }
+        futures: dict[Future[list[ComboProfile]], list[ComboTask]] = {
+            global_executor.submit(process_shared_tasks, unit): unit
+            for unit in group_tasks(
+                tasks=self._get_ordered_tasks(indics=indics), size=UNIT_SIZE
+            )
+        }
+        for future in as_completed(futures):
+            unit: list[ComboTask] = futures[future]
+            try:
+                self.specs.check_cancelled()
+                self.profiler.add_combos(combos=future.result())
+            except BacktestCancelled:
+                for pending in futures:
+                    pending.cancel()
+                raise
+            except Exception as e:
+                for pending in futures:
+                    pending.cancel()
+                raise Exception(
+                    f"Error during backtest.\n "
+                    f"Issue: {e} \n "
+                    f"Indicator:\n {self.indics[unit[0].indic]}"
+                )
+            for task in unit:
+                self.specs.register_result(indic=task.indic)
+                remaining[task.indic] -= 1
+                if remaining[task.indic] == 0:
+                    self._save_result(
+                        indic=self.indics[task.indic],
+                        block=main_array[:, self.specs.blocks[task.indic]],
                     )
-        return main_array
+
+    def _load_cached(self, main_array: nq.Float2D) -> set[int]:
+        cached: set[int] = self._get_cached()
+        for index in cached:
+            self._load_result(
+                indic=self.indics[index], output=main_array[:, self.specs.blocks[index]]
+            )
+            self.specs.register_results(
+                indic=index, quantity=self.indics[index].quantity
+            )
+        return cached
+
+    def _get_cached(self) -> set[int]:
+        return {
+            index
+            for index, indic in enumerate(self.indics)
+            if self.results is not None and self.results.contains(indic=indic)
+        }
+
+    def _get_ordered_tasks(self, indics: set[int]) -> list[ComboTask]:
+        return self.costs.order(
+            tasks=[task for task in self.specs.tasks if task.indic in indics],
+            indics=self.indics,
+        )
+
+    def _release_storage(self) -> None:
+        if self._temporary is not None and sys.platform != "win32":
+            self._temporary.unlink(missing_ok=True)
+
+    def _load_result(self, indic: GenericIndic, output: nq.Float2D) -> bool:
+        if self.results is None:
+            return False
+        return self.results.load_into(indic=indic, output=output)
+
+    def _save_result(self, indic: GenericIndic, block: nq.Float2D) -> None:
+        if self.results is not None:
+            self.results.save(indic=indic, block=block)
+
+    def _print_results_stats(self) -> None:
+        if self.results is not None:
+            print(self.results.get_stats())
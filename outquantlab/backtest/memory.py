@@ -0,0 +1,154 @@
+import os
+from pathlib import Path
+from tempfile import mkstemp
+from typing import NamedTuple
+
+from outquantlab.backtest.planner import NodePlan
+from outquantlab.indicators import GenericIndic
+
+FLOAT_SIZE: int = 4
+DATA_ARRAYS: int = 4
+TEMPORARIES_PER_THREAD: int = 6
+ROLLING_PER_NODE: int = 2
+CACHE_SHARE: float = 0.25
+NODES_SHARE: float = 0.25
+SHARED_DIRECTORY: Path = Path("/dev/shm")
+
+
+class MemoryEstimate(NamedTuple):
+    data_arrays: int
+    main_array: int
+    temporaries: int
+    cache: int
+    nodes: int
+    polars_copy: int
+
+    @property
+    def total(self) -> int:
+        return sum(self)
+
+    def __str__(self) -> str:
+        return (
+            f"Memory Estimate:\n"
+            f"  Data Arrays: {self.data_arrays / 1024**2:.1f} MB\n"
+            f"  Main Array: {self.main_array / 1024**2:.1f} MB\n"
+            f"  Temporaries: {self.temporaries / 1024**2:.1f} MB\n"
+            f"  Rolling Cache: {self.cache / 1024**2:.1f} MB\n"
+            f"  Shared Nodes: {self.nodes / 1024**2:.1f} MB\n"
+            f"  Polars Copy: {self.polars_copy / 1024**2:.1f} MB\n"
+            f"  Total: {self.total / 1024**2:.1f} MB\n"
+        )
+
+
+class MemoryPlan(NamedTuple):
+    threads: int
+    cache_memory: int
+    chunks: list[list[int]]
+    on_disk: bool
+    estimate: MemoryEstimate
+
+    def __str__(self) -> str:
+        return (
+            f"{self.estimate}"
+            f"Memory Plan:\n"
+            f"  Threads: {self.threads}\n"
+            f"  Cache Budget: {self.cache_memory / 1024**2:.1f} MB\n"
+            f"  Indicator Chunks: {len(self.chunks)}\n"
+            f"  Main Array On Disk: {self.on_disk}\n"
+        )
+
+
+def get_memory_estimate(
+    days: int,
+    assets: int,
+    total: int,
+    threads: int,
+    cache_memory: int,
+    unique_nodes: int,
+    data_arrays: int = DATA_ARRAYS,
+) -> MemoryEstimate:
+    frame: int = days * assets * FLOAT_SIZE
+    main_array: int = days * total * FLOAT_SIZE
+    return MemoryEstimate(
+        data_arrays=data_arrays * frame,
+        main_array=main_array,
+        temporaries=threads * TEMPORARIES_PER_THREAD * frame,
+        cache=min(cache_memory, ROLLING_PER_NODE * unique_nodes * frame),
+        nodes=unique_nodes * frame,
+        polars_copy=main_array,
+    )
+
+
+def get_memory_plan(
+    indics: list[GenericIndic],
+    days: int,
+    assets: int,
+    threads: int,
+    cache_memory: int,
+    max_memory: int | None,
+    data_arrays: int = DATA_ARRAYS,
+) -> MemoryPlan:
+    frame: int = days * assets * FLOAT_SIZE
+    total: int = sum(indic.quantity for indic in indics) * assets
+    estimate: MemoryEstimate = get_memory_estimate(
+        days=days,
+        assets=assets,
+        total=total,
+        threads=threads,
+        cache_memory=cache_memory,
+        unique_nodes=NodePlan(indics=indics).unique,
+        data_arrays=data_arrays,
+    )
+    if max_memory is None or estimate.total <= max_memory:
+        return MemoryPlan(
+            threads=threads,
+            cache_memory=cache_memory,
+            chunks=[list(range(len(indics)))],
+            on_disk=False,
+            estimate=estimate,
+        )
+    on_disk: bool = (
+        estimate.data_arrays + estimate.main_array + estimate.polars_copy
+        > max_memory // 2
+    )
+    remaining: int = max(
+        max_memory
+        - estimate.data_arrays
+        - (0 if on_disk else estimate.main_array + estimate.polars_copy),
+        frame,
+    )
+    cache_budget: int = min(estimate.cache, int(remaining * CACHE_SHARE))
+    nodes_budget: int = int(remaining * NODES_SHARE)
+    thread_budget: int = remaining - cache_budget - nodes_budget
+    planned_threads: int = max(
+        1, min(threads, thread_budget // (TEMPORARIES_PER_THREAD * frame))
+    )
+    return MemoryPlan(
+        threads=planned_threads,
+        cache_memory=cache_budget,
+        chunks=get_chunks(indics=indics, max_nodes=max(nodes_budget // frame, 1)),
+        on_disk=on_disk,
+        estimate=estimate,
+    )
+
+
+def get_chunks(indics: list[GenericIndic], max_nodes: int) -> list[list[int]]:
+    chunks: list[list[int]] = [[]]
+    for index in range(len(indics)):
+        candidate: list[int] = chunks[-1] + [index]
+        unique: int = NodePlan(indics=[indics[i] for i in candidate]).unique
+        if unique > max_nodes and chunks[-1]:
+            chunks.append([index])
+        else:
+            chunks[-1] = candidate
+    return chunks
+
+
+def create_temporary_storage(shared: bool = False) -> Path:
+    descriptor, name = mkstemp(
+        prefix="outquantlab_",
+        suffix=".dat",
+        dir=SHARED_DIRECTORY if shared and SHARED_DIRECTORY.is_dir() else None,
+    )
+    os.close(descriptor)
+    return Path(name)
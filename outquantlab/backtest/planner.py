@@ -0,0 +1,137 @@
+from concurrent.futures import Future
+from threading import Lock
+from typing import Any, NamedTuple
+
+import numquant as nq
+from outquantlab.indicators import (
+    BaseParams,
+    GenericIndic,
+    Node,
+    NodeKey,
+    NodeParams,
+    Primitive,
+    RollingProvider,
+)
+
+
+class PlanStats(NamedTuple):
+    declared: int
+    unique: int
+    hits: int
+    misses: int
+    released: int
+
+    def __str__(self) -> str:
+        return (
+            f"Node Plan Statistics:\n"
+            f"  Declared: {self.declared}\n"
+            f"  Unique: {self.unique}\n"
+            f"  Hits: {self.hits}\n"
+            f"  Misses: {self.misses}\n"
+            f"  Released: {self.released}\n"
+        )
+
+
+class NodePlan:
+    def __init__(self, indics: list[GenericIndic]) -> None:
+        self.consumers: dict[NodeKey, int] = {}
+        self.declared: int = 0
+        for indic in indics:
+            for combo in indic.combos:
+                self.add_combo(indic=indic, params=combo)
+
+    @property
+    def unique(self) -> int:
+        return len(self.consumers)
+
+    def add_combo(self, indic: GenericIndic, params: BaseParams) -> None:
+        for node in indic.get_nodes(params=params):
+            self._add(node=node)
+
+    def _add(self, node: Node[Any, Any]) -> None:
+        self.declared += 1
+        key: NodeKey = node.key
+        if key in self.consumers:
+            self.consumers[key] += 1
+            return
+        self.consumers[key] = 1
+        for child in node.inputs:
+            self._add(node=child)
+
+
+class NodeCache:
+    def __init__(self, rolling: RollingProvider, plan: NodePlan) -> None:
+        self.rolling: RollingProvider = rolling
+        self._plan: NodePlan = plan
+        self._remaining: dict[NodeKey, int] = dict(plan.consumers)
+        self._entries: dict[NodeKey, Future[Any]] = {}
+        self._lock = Lock()
+        self._hits: int = 0
+        self._misses: int = 0
+        self._released: int = 0
+
+    def get(
+        self, array: nq.Float2D, primitive: Primitive, length: int, min_length: int
+    ) -> nq.Float2D:
+        return self.rolling.get(
+            array=array, primitive=primitive, length=length, min_length=min_length
+        )
+
+    def get_multi(
+        self,
+        array: nq.Float2D,
+        primitive: Primitive,
+        lengths: list[int],
+        min_lengths: list[int],
+    ) -> list[nq.Float2D]:
+        return self.rolling.get_multi(
+            array=array, primitive=primitive, lengths=lengths, min_lengths=min_lengths
+        )
+
+    def evaluate[P: NodeParams, R](self, node: Node[P, R], array: nq.Float2D) -> R:
+        key: NodeKey = node.key
+        with self._lock:
+            if key not in self._remaining:
+                entry: Future[R] | None = None
+                owner: bool = True
+            else:
+                entry = self._entries.get(key)
+                owner = entry is None
+                if entry is None:
+                    entry = Future()
+                    self._entries[key] = entry
+                    self._misses += 1
+                else:
+                    self._hits += 1
+                self._remaining[key] -= 1
+                if self._remaining[key] == 0:
+                    del self._remaining[key]
+                    del self._entries[key]
+                    self._released += 1
+        if not owner and entry is not None:
+            return entry.result()
+        try:
+            result: R = node.func(array, node.params, self)
+        except Exception as e:
+            if entry is not None:
+                entry.set_exception(e)
+            raise
+        if entry is not None:
+            _freeze(result=result)
+            entry.set_result(result)
+        return result
+
+    def get_stats(self) -> PlanStats:
+        return PlanStats(
+            declared=self._plan.declared,
+            unique=self._plan.unique,
+            hits=self._hits,
+            misses=self._misses,
+            released=self._released,
+        )
+
+
+def _freeze(result: Any) -> None:
+    arrays: tuple[Any, ...] = result if isinstance(result, tuple) else (result,)
+    for array in arrays:
+        array.flags.writeable = False
@@ -0,0 +1,181 @@
+import json
+import sys
+import time
+import tracemalloc
+from collections.abc import Iterator
+from contextlib import contextmanager
+from dataclasses import dataclass, field
+from pathlib import Path
+from multiprocessing import current_process
+from threading import Lock, current_thread
+from typing import Any, NamedTuple
+
+if sys.platform != "win32":
+    import resource
+
+
+class Measure(NamedTuple):
+    wall: float
+    cpu: float
+    allocated: int
+    peak_rss: int
+
+
+class StageProfile(NamedTuple):
+    name: str
+    measure: Measure
+
+
+class ComboProfile(NamedTuple):
+    indic: str
+    combo: str
+    thread: str
+    start: float
+    measure: Measure
+
+
+@dataclass(slots=True)
+class ProfileReport:
+    stages: list[StageProfile] = field(default_factory=list)
+    combos: list[ComboProfile] = field(default_factory=list)
+
+    def get_indics(self) -> dict[str, Measure]:
+        totals: dict[str, Measure] = {}
+        for combo in self.combos:
+            previous: Measure = totals.get(combo.indic, Measure(0.0, 0.0, 0, 0))
+            totals[combo.indic] = Measure(
+                wall=previous.wall + combo.measure.wall,
+                cpu=previous.cpu + combo.measure.cpu,
+                allocated=previous.allocated + combo.measure.allocated,
+                peak_rss=max(previous.peak_rss, combo.measure.peak_rss),
+            )
+        return dict(sorted(totals.items(), key=lambda item: -item[1].wall))
+
+    def get_threads(self) -> dict[str, float]:
+        busy: dict[str, float] = {}
+        for combo in self.combos:
+            busy[combo.thread] = busy.get(combo.thread, 0.0) + combo.measure.wall
+        return busy
+
+    def to_dict(self) -> dict[str, Any]:
+        return {
+            "stages": [
+                {"name": stage.name, **stage.measure._asdict()} for stage in self.stages
+            ],
+            "indics": {
+                name: measure._asdict() for name, measure in self.get_indics().items()
+            },
+            "threads": self.get_threads(),
+            "combos": [
+                {
+                    "indic": combo.indic,
+                    "combo": combo.combo,
+                    "thread": combo.thread,
+                    "start": combo.start,
+                    **combo.measure._asdict(),
+                }
+                for combo in self.combos
+            ],
+        }
+
+    def to_json(self, path: Path) -> None:
+        with open(path, "w") as file:
+            json.dump(self.to_dict(), file, indent=3)
+
+    def __str__(self) -> str:
+        lines: list[str] = ["Backtest Profile:"]
+        for stage in self.stages:
+            lines.append(
+                f"  {stage.name}: {stage.measure.wall:.3f}s wall, "
+                f"{stage.measure.cpu:.3f}s cpu"
+            )
+        for name, measure in self.get_indics().items():
+            lines.append(
+                f"  {name}: {measure.wall:.3f}s wall, {measure.cpu:.3f}s cpu, "
+                f"{measure.allocated / 1024**2:.1f} MB"
+            )
+        return "\n".join(lines) + "\n"
+
+
+class Profiler:
+    def __init__(self, active: bool = True) -> None:
+        self.active: bool = active
+        self.report = ProfileReport()
+        self._lock = Lock()
+        if self.active and not tracemalloc.is_tracing():
+            tracemalloc.start()
+
+    @contextmanager
+    def stage(self, name: str) -> Iterator[None]:
+        if not self.active:
+            yield
+            return
+        tracemalloc.reset_peak()
+        memory, _ = tracemalloc.get_traced_memory()
+        wall: float = time.perf_counter()
+        cpu: float = time.process_time()
+        try:
+            yield
+        finally:
+            _, peak = tracemalloc.get_traced_memory()
+            measure = Measure(
+                wall=time.perf_counter() - wall,
+                cpu=time.process_time() - cpu,
+                allocated=max(peak - memory, 0),
+                peak_rss=get_peak_rss(),
+            )
+            with self._lock:
+                self.report.stages.append(StageProfile(name=name, measure=measure))
+
+    @contextmanager
+    def combo(self, indic: str, combo: str) -> Iterator[None]:
+        if not self.active:
+            yield
+            return
+        memory, _ = tracemalloc.get_traced_memory()
+        start: float = time.time()
+        wall: float = time.perf_counter()
+        cpu: float = time.thread_time()
+        try:
+            yield
+        finally:
+            current, _ = tracemalloc.get_traced_memory()
+            measure = Measure(
+                wall=time.perf_counter() - wall,
+                cpu=time.thread_time() - cpu,
+                allocated=max(current - memory, 0),
+                peak_rss=get_peak_rss(),
+            )
+            with self._lock:
+                self.report.combos.append(
+                    ComboProfile(
+                        indic=indic,
+                        combo=combo,
+                        thread=f"{current_process().name}/{current_thread().name}",
+                        start=start,
+                        measure=measure,
+                    )
+                )
+
+    def add_combos(self, combos: list[ComboProfile]) -> None:
+        with self._lock:
+            self.report.combos.extend(combos)
+
+    def pop_combos(self) -> list[ComboProfile]:
+        with self._lock:
+            combos: list[ComboProfile] = self.report.combos
+            self.report.combos = []
+        return combos
+
+    def stop(self) -> ProfileReport:
+        if self.active and tracemalloc.is_tracing():
+            tracemalloc.stop()
+        self.active = False
+        return self.report
+
+
+def get_peak_rss() -> int:
+    if sys.platform == "win32":
+        return 0
+    peak: int = resource.getrusage(resource.RUSAGE_SELF).ru_maxrss
+    return peak if sys.platform == "darwin" else peak * 1024
@@ -0,0 +1,130 @@
+import time
+from collections.abc import Callable
+from enum import StrEnum
+from threading import Event, Lock
+from typing import NamedTuple, Never
+
+from tqdm import tqdm
+
+
+class ProgressEvent(StrEnum):
+    STARTED = "started"
+    COMBO_DONE = "combo_done"
+    INDICATOR_DONE = "indicator_done"
+    FINISHED = "finished"
+    CANCELLED = "cancelled"
+
+
+class ProgressUpdate(NamedTuple):
+    event: ProgressEvent
+    done: int
+    total: int
+    elapsed: float
+    indic: str | None = None
+
+    @property
+    def throughput(self) -> float:
+        return self.done / self.elapsed if self.elapsed > 0 else 0.0
+
+    @property
+    def eta(self) -> float | None:
+        if self.done == 0:
+            return None
+        return (self.total - self.done) / self.throughput
+
+    @property
+    def ratio(self) -> float:
+        return self.done / self.total if self.total else 1.0
+
+
+type ProgressCallback = Callable[[ProgressUpdate], None]
+
+
+class BacktestCancelled(Exception):
+    pass
+
+
+class CancellationToken:
+    def __init__(self) -> None:
+        self._event = Event()
+
+    @property
+    def cancelled(self) -> bool:
+        return self._event.is_set()
+
+    def cancel(self) -> None:
+        self._event.set()
+
+
+class ConsoleProgress:
+    def __init__(self, stats: str, assets: int) -> None:
+        self.stats: str = stats
+        self.assets: int = assets
+        self._bar: tqdm[Never] | None = None
+
+    def __call__(self, update: ProgressUpdate) -> None:
+        if update.event == ProgressEvent.STARTED:
+            print(self.stats)
+            self._bar = tqdm(total=update.total * self.assets, desc="Backtest Progress")
+            return
+        if self._bar is None:
+            return
+        if update.event == ProgressEvent.COMBO_DONE:
+            self._bar.update(update.done * self.assets - self._bar.n)
+            self._bar.refresh()
+        elif update.event in (ProgressEvent.FINISHED, ProgressEvent.CANCELLED):
+            self._bar.close()
+
+
+class ProgressTracker:
+    def __init__(
+        self,
+        quantities: list[int],
+        names: list[str],
+        callbacks: list[ProgressCallback],
+        token: CancellationToken,
+    ) -> None:
+        self.total: int = sum(quantities)
+        self.done: int = 0
+        self.callbacks: list[ProgressCallback] = callbacks
+        self.token: CancellationToken = token
+        self._names: list[str] = names
+        self._remaining: list[int] = list(quantities)
+        self._start: float = time.perf_counter()
+        self._cancelled: bool = False
+        self._lock = Lock()
+
+    def start(self) -> None:
+        self._start = time.perf_counter()
+        self._emit(event=ProgressEvent.STARTED)
+        if self.total == 0:
+            self._emit(event=ProgressEvent.FINISHED)
+
+    def register(self, indic: int, quantity: int) -> None:
+        self.done += quantity
+        self._remaining[indic] -= quantity
+        self._emit(event=ProgressEvent.COMBO_DONE, indic=self._names[indic])
+        if self._remaining[indic] == 0:
+            self._emit(event=ProgressEvent.INDICATOR_DONE, indic=self._names[indic])
+        if self.done == self.total:
+            self._emit(event=ProgressEvent.FINISHED)
+
+    def check_cancelled(self) -> None:
+        if not self.token.cancelled:
+            return
+        with self._lock:
+            if not self._cancelled:
+                self._cancelled = True
+                self._emit(event=ProgressEvent.CANCELLED)
+        raise BacktestCancelled("Backtest cancelled")
+
+    def _emit(self, event: ProgressEvent, indic: str | None = None) -> None:
+        update = ProgressUpdate(
+            event=event,
+            done=self.done,
+            total=self.total,
+            elapsed=time.perf_counter() - self._start,
+            indic=indic,
+        )
+        for callback in self.callbacks:
+            callback(update)
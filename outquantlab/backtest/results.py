@@ -0,0 +1,102 @@
+import os
+import shutil
+from functools import cache
+from hashlib import sha256
+from pathlib import Path
+
+import numquant as nq
+from outquantlab.indicators import GenericIndic
+
+RESULTS_VERSION: int = 1
+MAX_DATA_KEYS: int = 2
+KERNEL_PACKAGES: list[Path] = [
+    Path(nq.__file__).parent,
+    Path(__file__).parents[1] / "indicators",
+    Path(__file__).parent / "data.py",
+]
+
+
+class ResultCache:
+    def __init__(
+        self, path: Path, pct_returns: nq.Float2D, asset_names: list[str]
+    ) -> None:
+        self.root: Path = path
+        self.path: Path = path / get_data_key(
+            pct_returns=pct_returns, asset_names=asset_names
+        )
+        self.path.mkdir(parents=True, exist_ok=True)
+        os.utime(self.path)
+        self.hits: int = 0
+        self.misses: int = 0
+        self._pruned: bool = False
+
+    def contains(self, indic: GenericIndic) -> bool:
+        return self.get_file(indic=indic).exists()
+
+    def load_into(self, indic: GenericIndic, output: nq.Float2D) -> bool:
+        file: Path = self.get_file(indic=indic)
+        if not file.exists():
+            self.misses += 1
+            return False
+        output[:] = nq.arrays.load_file(path=file)
+        self.hits += 1
+        return True
+
+    def save(self, indic: GenericIndic, block: nq.Float2D) -> None:
+        if not self._pruned:
+            prune_data_keys(root=self.root, current=self.path, limit=MAX_DATA_KEYS)
+            self._pruned = True
+        file: Path = self.get_file(indic=indic)
+        temporary: Path = file.with_suffix(".tmp")
+        nq.arrays.save_file(path=temporary, array=block)
+        temporary.replace(file)
+
+    def get_file(self, indic: GenericIndic) -> Path:
+        return self.path / f"{get_indic_key(indic=indic)}.npy"
+
+    def get_stats(self) -> str:
+        return (
+            f"Result Cache Statistics:\n"
+            f"  Hits: {self.hits}\n"
+            f"  Misses: {self.misses}\n"
+            f"  Path: {self.path}\n"
+        )
+
+
+def get_data_key(pct_returns: nq.Float2D, asset_names: list[str]) -> str:
+    digest = sha256(str(RESULTS_VERSION).encode())
+    digest.update(get_code_key().encode())
+    digest.update(str(pct_returns.shape).encode())
+    digest.update(pct_returns.tobytes())
+    digest.update("\x1f".join(asset_names).encode())
+    return digest.hexdigest()
+
+
+def get_indic_key(indic: GenericIndic) -> str:
+    digest = sha256(f"{type(indic).__name__}:{indic.name}".encode())
+    for combo in indic.combos:
+        digest.update(str(combo.values).encode())
+    return digest.hexdigest()
+
+
+@cache
+def get_code_key() -> str:
+    digest = sha256()
+    for package in KERNEL_PACKAGES:
+        files: list[Path] = (
+            sorted(package.rglob("*.py")) if package.is_dir() else [package]
+        )
+        for file in files:
+            digest.update(file.relative_to(package.parent).as_posix().encode())
+            digest.update(file.read_bytes())
+    return digest.hexdigest()
+
+
+def prune_data_keys(root: Path, current: Path, limit: int) -> None:
+    previous: list[Path] = sorted(
+        (path for path in root.iterdir() if path.is_dir() and path != current),
+        key=lambda path: path.stat().st_mtime,
+        reverse=True,
+    )
+    for path in previous[max(limit - 1, 0) :]:
+        shutil.rmtree(path, ignore_errors=True)
@@ -0,0 +1,122 @@
+import json
+from math import log2
+from pathlib import Path
+from threading import Lock
+from typing import NamedTuple
+
+from outquantlab.backtest.specs import ComboTask
+from outquantlab.indicators import BaseParams, GenericIndic
+
+COST_PRIORS: dict[str, float] = {
+    "Median": 4.0,
+    "Kurtosis": 3.0,
+    "Skewness": 2.5,
+    "Central": 2.0,
+    "Volatility": 1.5,
+}
+DEFAULT_PRIOR: float = 1.0
+SMOOTHING: float = 0.5
+
+
+class CostKey(NamedTuple):
+    indic: str
+    window: int
+
+
+class CostModel:
+    def __init__(self, costs: dict[CostKey, float] | None = None) -> None:
+        self.costs: dict[CostKey, float] = costs or {}
+        self._lock = Lock()
+
+    def estimate(self, indic: GenericIndic, combo: BaseParams) -> float:
+        return self._estimate(
+            key=get_cost_key(indic=indic, combo=combo), units=self._get_units()
+        )
+
+    def record(self, indic: GenericIndic, combo: BaseParams, seconds: float) -> None:
+        key: CostKey = get_cost_key(indic=indic, combo=combo)
+        with self._lock:
+            previous: float | None = self.costs.get(key)
+            self.costs[key] = (
+                seconds
+                if previous is None
+                else SMOOTHING * seconds + (1 - SMOOTHING) * previous
+            )
+
+    def order(
+        self, tasks: list[ComboTask], indics: list[GenericIndic]
+    ) -> list[ComboTask]:
+        units: dict[str, float] = self._get_units()
+        return sorted(
+            tasks,
+            key=lambda task: -self._estimate(
+                key=get_cost_key(
+                    indic=indics[task.indic],
+                    combo=indics[task.indic].combos[task.combo],
+                ),
+                units=units,
+            ),
+        )
+
+    def save(self, path: Path) -> None:
+        with self._lock:
+            data: list[dict[str, str | int | float]] = [
+                {"indic": key.indic, "window": key.window, "seconds": seconds}
+                for key, seconds in self.costs.items()
+            ]
+        with open(path, "w") as file:
+            json.dump(data, file, indent=3)
+
+    @classmethod
+    def load(cls, path: Path) -> "CostModel":
+        if not path.exists():
+            return cls()
+        with open(path, "r") as file:
+            data: list[dict[str, str | int | float]] = json.load(file)
+        return cls(
+            costs={
+                CostKey(indic=str(entry["indic"]), window=int(entry["window"])): float(
+                    entry["seconds"]
+                )
+                for entry in data
+            }
+        )
+
+    def _estimate(self, key: CostKey, units: dict[str, float]) -> float:
+        if key in self.costs:
+            return self.costs[key]
+        if key.indic in units:
+            return units[key.indic] * get_window_factor(window=key.window)
+        return (
+            get_prior(indic=key.indic)
+            * get_window_factor(window=key.window)
+            * self._get_prior_scale(units=units)
+        )
+
+    def _get_units(self) -> dict[str, float]:
+        totals: dict[str, list[float]] = {}
+        for key, seconds in self.costs.items():
+            totals.setdefault(key.indic, []).append(
+                seconds / get_window_factor(window=key.window)
+            )
+        return {indic: sum(units) / len(units) for indic, units in totals.items()}
+
+    def _get_prior_scale(self, units: dict[str, float]) -> float:
+        if not units:
+            return 1.0
+        return sum(units.values()) / sum(get_prior(indic=indic) for indic in units)
+
+
+def get_cost_key(indic: GenericIndic, combo: BaseParams) -> CostKey:
+    return CostKey(indic=type(indic).__name__, window=max(combo.values))
+
+
+def get_window_factor(window: int) -> float:
+    return 1.0 + log2(max(window, 1))
+
+
+def get_prior(indic: str) -> float:
+    return max(
+        [weight for token, weight in COST_PRIORS.items() if token in indic],
+        default=DEFAULT_PRIOR,
+    )
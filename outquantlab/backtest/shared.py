@@ -0,0 +1,174 @@
+from dataclasses import dataclass
+from multiprocessing.shared_memory import SharedMemory
+from multiprocessing.util import Finalize
+from pathlib import Path
+from types import TracebackType
+from typing import NamedTuple, Self
+
+import numquant as nq
+from outquantlab.backtest.cache import RollingCache
+from outquantlab.backtest.data import DataArrays
+from outquantlab.backtest.planner import NodeCache, NodePlan
+from outquantlab.backtest.profiling import ComboProfile, Profiler
+from outquantlab.backtest.specs import ComboTask
+from outquantlab.indicators import GenericIndic, RollingProvider
+
+
+class SharedSpec(NamedTuple):
+    name: str
+    shape: tuple[int, int]
+
+
+@dataclass(slots=True, frozen=True)
+class SharedSpecs:
+    pct_returns: SharedSpec
+    prices: SharedSpec
+    log_returns: SharedSpec
+    adjusted_returns: SharedSpec
+    main_array: SharedSpec
+    storage: Path
+
+
+@dataclass(slots=True)
+class SharedDataArrays:
+    pct_returns: nq.Float2D
+    prices: nq.Float2D
+    log_returns: nq.Float2D
+    adjusted_returns: nq.Float2D
+    rolling: RollingProvider
+
+
+class SharedArrays:
+    def __init__(
+        self, data: DataArrays, main_shape: tuple[int, int], storage: Path
+    ) -> None:
+        self._blocks: dict[str, SharedMemory] = {}
+        self.specs = SharedSpecs(
+            pct_returns=self._share(array=data.pct_returns),
+            prices=self._share(array=data.prices),
+            log_returns=self._share(array=data.log_returns),
+            adjusted_returns=self._share(array=data.adjusted_returns),
+            main_array=SharedSpec(name=str(storage), shape=main_shape),
+            storage=storage,
+        )
+
+    def __enter__(self) -> Self:
+        return self
+
+    def __exit__(
+        self,
+        exc_type: type[BaseException] | None,
+        exc_value: BaseException | None,
+        traceback: TracebackType | None,
+    ) -> None:
+        for block in self._blocks.values():
+            block.close()
+            block.unlink()
+        self._blocks.clear()
+
+    def _allocate(self, shape: tuple[int, int]) -> SharedSpec:
+        size: int = shape[0] * shape[1] * nq.Float32().itemsize
+        block = SharedMemory(create=True, size=max(size, 1))
+        self._blocks[block.name] = block
+        return SharedSpec(name=block.name, shape=shape)
+
+    def _share(self, array: nq.Float2D) -> SharedSpec:
+        spec: SharedSpec = self._allocate(shape=array.shape)
+        get_view(block=self._blocks[spec.name], spec=spec)[:] = array
+        return spec
+
+
+class SharedWorker:
+    def __init__(
+        self,
+        specs: SharedSpecs,
+        indics: list[GenericIndic],
+        cache_memory: int,
+        profile: bool,
+    ) -> None:
+        self._blocks: list[SharedMemory] = []
+        self.indics: list[GenericIndic] = indics
+        self.profiler = Profiler(active=profile)
+        prices: nq.Float2D = self._attach(spec=specs.prices)
+        log_returns: nq.Float2D = self._attach(spec=specs.log_returns)
+        self.rolling = RollingCache(
+            sources=[prices, log_returns], max_memory=cache_memory
+        )
+        self.data = SharedDataArrays(
+            pct_returns=self._attach(spec=specs.pct_returns),
+            prices=prices,
+            log_returns=log_returns,
+            adjusted_returns=self._attach(spec=specs.adjusted_returns),
+            rolling=self.rolling,
+        )
+        self.main_array: nq.Float2D = open_storage(
+            storage=specs.storage, spec=specs.main_array
+        )
+
+    def process(self, tasks: list[ComboTask]) -> list[ComboProfile]:
+        plan = NodePlan(indics=[])
+        for task in tasks:
+            indic: GenericIndic = self.indics[task.indic]
+            plan.add_combo(indic=indic, params=indic.combos[task.combo])
+        self.data.rolling = NodeCache(rolling=self.rolling, plan=plan)
+        try:
+            for task in tasks:
+                self._process_task(task=task)
+        finally:
+            self.data.rolling = self.rolling
+        return self.profiler.pop_combos()
+
+    def close(self) -> None:
+        self.rolling.clear()
+        del self.data, self.rolling, self.main_array
+        for block in self._blocks:
+            block.close()
+        self._blocks.clear()
+
+    def _process_task(self, task: ComboTask) -> None:
+        indic: GenericIndic = self.indics[task.indic]
+        end: int = task.start + self.data.pct_returns.shape[1]
+        with self.profiler.combo(
+            indic=indic.name, combo=indic.combos[task.combo].get_names()
+        ):
+            indic.process_param(
+                data_arrays=self.data,
+                params=indic.combos[task.combo],
+                output=self.main_array[:, task.start : end],
+            )
+
+    def _attach(self, spec: SharedSpec) -> nq.Float2D:
+        block = SharedMemory(name=spec.name)
+        self._blocks.append(block)
+        return get_view(block=block, spec=spec)
+
+
+_workers: list[SharedWorker] = []
+
+
+def init_shared_worker(
+    specs: SharedSpecs, indics: list[GenericIndic], cache_memory: int, profile: bool
+) -> None:
+    worker = SharedWorker(
+        specs=specs, indics=indics, cache_memory=cache_memory, profile=profile
+    )
+    _workers.append(worker)
+    Finalize(worker, worker.close, exitpriority=10)
+
+
+def process_shared_tasks(tasks: list[ComboTask]) -> list[ComboProfile]:
+    return _workers[-1].process(tasks=tasks)
+
+
+def get_view(block: SharedMemory, spec: SharedSpec) -> nq.Float2D:
+    if block.buf is None:
+        raise ValueError(f"Shared block {spec.name} is closed")
+    return nq.arrays.create_from_buffer(
+        buffer=block.buf, length=spec.shape[0], width=spec.shape[1]
+    )
+
+
+def open_storage(storage: Path, spec: SharedSpec) -> nq.Float2D:
+    return nq.arrays.open_memmap(
+        path=storage, length=spec.shape[0], width=spec.shape[1]
+    )
@@ -1,13 +1,46 @@
+from enum import Enum, auto
 from os import cpu_count
+from pathlib import Path
+from typing import NamedTuple
 
+from outquantlab.backtest.progress import (
+    CancellationToken,
+    ConsoleProgress,
+    ProgressCallback,
+    ProgressTracker,
+)
 from outquantlab.indicators import GenericIndic
 import numquant as nq
-from tqdm import tqdm
+
+UNIT_SIZE: int = 8
+
+
+class Executor(Enum):
+    THREAD = auto()
+    PROCESS = auto()
+
+
+class ComboTask(NamedTuple):
+    indic: int
+    combo: int
+    start: int
+
+
+def get_thread_count() -> int:
+    return cpu_count() or 8
 
 
 class BacktestSpecs:
-    def __init__(self, pct_returns: nq.Float2D, indics: list[GenericIndic], local: bool) -> None:
-        self.thread_nb: int = cpu_count() or 8
+    def __init__(
+        self,
+        pct_returns: nq.Float2D,
+        indics: list[GenericIndic],
+        local: bool,
+        callbacks: list[ProgressCallback] | None = None,
+        token: CancellationToken | None = None,
+        threads: int | None = None,
+    ) -> None:
+        self.thread_nb: int = threads or get_thread_count()
         self.current_index: int = 0
         self.assets: int = pct_returns.shape[1]
         self.days: int = pct_returns.shape[0]
@@ -15,28 +48,63 @@ class BacktestSpecs:
         self.params: int = sum([indic.quantity for indic in indics])
         self.total: int = self.assets * self.params
         self.local: bool = local
-        if self.local:
-            print(self.get_stats())
-            self.progress_bar = tqdm(total=self.total, desc="Backtest Progress")
+        self.tasks: list[ComboTask] = self.get_tasks(indics=indics)
+        self.blocks: list[slice] = self.get_blocks(indics=indics)
+        self.progress = ProgressTracker(
+            quantities=[indic.quantity for indic in indics],
+            names=[indic.name for indic in indics],
+            callbacks=(
+                [ConsoleProgress(stats=self.get_stats(), assets=self.assets)]
+                if self.local
+                else []
+            )
+            + (callbacks or []),
+            token=token or CancellationToken(),
+        )
+        self.progress.start()
+
+    def get_main_array(self, storage: Path | None = None) -> nq.Float2D:
+        if storage is None:
+            return nq.arrays.create_empty(length=self.days, width=self.total)
+        return nq.arrays.create_memmap(
+            path=storage, length=self.days, width=self.total
+        )
 
-    def get_main_array(self) -> nq.Float2D:
-        return nq.arrays.create_empty(length=self.days, width=self.total)
+    def get_tasks(self, indics: list[GenericIndic]) -> list[ComboTask]:
+        tasks: list[ComboTask] = []
+        start: int = 0
+        for indic_index, indic in enumerate(indics):
+            for combo_index in range(indic.quantity):
+                tasks.append(ComboTask(indic=indic_index, combo=combo_index, start=start))
+                start += self.assets
+        return tasks
+
+    def get_blocks(self, indics: list[GenericIndic]) -> list[slice]:
+        blocks: list[slice] = []
+        start: int = 0
+        for indic in indics:
+            end: int = start + indic.quantity * self.assets
+            blocks.append(slice(start, end))
+            start = end
+        return blocks
 
     def fill_main_array(
-        self, main_array: nq.Float2D, results_list: list[nq.Float2D]
+        self, main_array: nq.Float2D, results_list: list[nq.Float2D], indic: int
     ) -> None:
         for i in range(len(results_list)):
             end_index: int = self.current_index + self.assets
             main_array[:, self.current_index : end_index] = results_list[i]
-            self.current_index = end_index
-            if self.local:
-                self.update_progress(progress=self.assets)
+            self.register_result(indic=indic)
+
+    def register_result(self, indic: int) -> None:
+        self.register_results(indic=indic, quantity=1)
 
-    def update_progress(self, progress: int) -> None:
-        self.progress_bar.update(progress)
-        self.progress_bar.refresh()
-        if self.current_index >= self.total:
-            self.progress_bar.close()
+    def register_results(self, indic: int, quantity: int) -> None:
+        self.current_index += self.assets * quantity
+        self.progress.register(indic=indic, quantity=quantity)
+
+    def check_cancelled(self) -> None:
+        self.progress.check_cancelled()
 
     def get_stats(self) -> str:
         return (
@@ -47,4 +115,15 @@ class BacktestSpecs:
             f"  Indics: {self.indics}\n"
             f"  Params: {self.params}\n"
             f"  Total Nb of strategies: {self.total}\n"
-        )
\ No newline at end of file
+        )
+
+
+def group_tasks(tasks: list[ComboTask], size: int) -> list[list[ComboTask]]:
+    grouped: dict[int, list[ComboTask]] = {}
+    for task in tasks:
+        grouped.setdefault(task.indic, []).append(task)
+    return [
+        group[start : start + size]
+        for group in grouped.values()
+        for start in range(0, len(group), size)
+    ]
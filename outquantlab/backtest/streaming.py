@@ -0,0 +1,161 @@
+import time
+from concurrent.futures import FIRST_COMPLETED, Future, ThreadPoolExecutor, wait
+
+import numquant as nq
+from outquantlab.backtest.cache import CACHE_MEMORY, RollingCache
+from outquantlab.backtest.data import DataArrays, get_data_inputs, get_inputs
+from outquantlab.backtest.planner import NodeCache, NodePlan
+from outquantlab.backtest.profiling import Profiler
+from outquantlab.backtest.progress import (
+    BacktestCancelled,
+    CancellationToken,
+    ProgressCallback,
+)
+from outquantlab.backtest.results import ResultCache
+from outquantlab.backtest.scheduler import CostModel
+from outquantlab.backtest.specs import BacktestSpecs, ComboTask
+from outquantlab.indicators import BaseParams, DirectRolling, GenericIndic, Source
+
+TASKS_PER_THREAD: int = 2
+
+
+class StreamingBacktestor:
+    def __init__(
+        self,
+        pct_returns: nq.Float2D,
+        indics: list[GenericIndic],
+        local: bool,
+        cache_memory: int = CACHE_MEMORY,
+        results: ResultCache | None = None,
+        profiler: Profiler | None = None,
+        costs: CostModel | None = None,
+        callbacks: list[ProgressCallback] | None = None,
+        token: CancellationToken | None = None,
+    ) -> None:
+        self.indics: list[GenericIndic] = indics
+        self.costs: CostModel = costs or CostModel()
+        self.profiler: Profiler = profiler or Profiler(active=False)
+        with self.profiler.stage(name="data_arrays"):
+            self.inputs: set[Source] = get_inputs(indics=indics)
+            self.data: DataArrays = DataArrays(pct_returns=pct_returns)
+            self.data.prepare(inputs=self.inputs)
+        self.cache_memory: int = cache_memory
+        self.results: ResultCache | None = results
+        self.specs = BacktestSpecs(
+            pct_returns=pct_returns,
+            indics=self.indics,
+            local=local,
+            callbacks=callbacks,
+            token=token,
+        )
+        if self.specs.local:
+            print(get_data_inputs(inputs=self.inputs))
+        width: int = len(self.indics) * self.specs.assets
+        self.sums: nq.NPArray = nq.metrics.agg.create_accumulator(
+            length=self.specs.days, width=width
+        )
+        self.counts: nq.NPArray = nq.metrics.agg.create_accumulator(
+            length=self.specs.days, width=width
+        )
+
+    def process_backtest(self) -> nq.Float2D:
+        with self.profiler.stage(name="backtest"):
+            cached: set[int] = self._fold_cached()
+            rolling = RollingCache(
+                sources=self.data.get_sources(inputs=self.inputs),
+                max_memory=self.cache_memory,
+            )
+            nodes = NodeCache(
+                rolling=rolling,
+                plan=NodePlan(
+                    indics=[
+                        indic
+                        for index, indic in enumerate(self.indics)
+                        if index not in cached
+                    ]
+                ),
+            )
+            self.data.rolling = nodes
+            self._process_tasks(
+                tasks=self.costs.order(
+                    tasks=[
+                        task for task in self.specs.tasks if task.indic not in cached
+                    ],
+                    indics=self.indics,
+                )
+            )
+            if self.specs.local:
+                print(rolling.get_stats())
+                print(nodes.get_stats())
+            rolling.clear()
+            self.data.rolling = DirectRolling()
+            return nq.metrics.agg.get_grouped_mean(sums=self.sums, counts=self.counts)
+
+    def _process_tasks(self, tasks: list[ComboTask]) -> None:
+        queue: list[ComboTask] = list(reversed(tasks))
+        limit: int = self.specs.thread_nb * TASKS_PER_THREAD
+        with ThreadPoolExecutor(max_workers=self.specs.thread_nb) as global_executor:
+            running: dict[Future[nq.Float2D], ComboTask] = {}
+            while queue or running:
+                self.specs.check_cancelled()
+                while queue and len(running) < limit:
+                    task: ComboTask = queue.pop()
+                    running[global_executor.submit(self._process_task, task)] = task
+                done, _ = wait(running, return_when=FIRST_COMPLETED)
+                for future in done:
+                    task = running.pop(future)
+                    try:
+                        block: nq.Float2D = future.result()
+                    except BacktestCancelled:
+                        for pending in running:
+                            pending.cancel()
+                        raise
+                    except Exception as e:
+                        for pending in running:
+                            pending.cancel()
+                        raise Exception(
+                            f"Error during backtest.\n "
+                            f"Issue: {e} \n "
+                            f"Indicator:\n {self.indics[task.indic]}"
+                        )
+                    self._fold(index=task.indic, block=block)
+                    self.specs.register_result(indic=task.indic)
+
+    def _process_task(self, task: ComboTask) -> nq.Float2D:
+        self.specs.check_cancelled()
+        indic: GenericIndic = self.indics[task.indic]
+        combo: BaseParams = indic.combos[task.combo]
+        output: nq.Float2D = nq.arrays.create_empty(
+            length=self.specs.days, width=self.specs.assets
+        )
+        start: float = time.perf_counter()
+        with self.profiler.combo(indic=indic.name, combo=combo.get_names()):
+            indic.process_param(data_arrays=self.data, params=combo, output=output)
+        self.costs.record(
+            indic=indic, combo=combo, seconds=time.perf_counter() - start
+        )
+        return output
+
+    def _fold(self, index: int, block: nq.Float2D) -> None:
+        columns = slice(index * self.specs.assets, (index + 1) * self.specs.assets)
+        nq.metrics.agg.accumulate_groups(
+            block=block, sums=self.sums[:, columns], counts=self.counts[:, columns]
+        )
+
+    def _fold_cached(self) -> set[int]:
+        cached: set[int] = set()
+        if self.results is None:
+            return cached
+        for index, indic in enumerate(self.indics):
+            if not self.results.contains(indic=indic):
+                continue
+            block: nq.Float2D = nq.arrays.create_empty(
+                length=self.specs.days, width=indic.quantity * self.specs.assets
+            )
+            self.results.load_into(indic=indic, output=block)
+            self._fold(index=index, block=block)
+            self.specs.register_results(indic=index, quantity=indic.quantity)
+            cached.add(index)
+        if self.specs.local:
+            print(self.results.get_stats())
+        return cached
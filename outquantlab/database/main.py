@@ -1,3 +1,5 @@
+from pathlib import Path
+
 from outquantlab.core import AppConfig
 from outquantlab.database.structure import DBStructure
 import tradeframe as tf
@@ -25,6 +27,12 @@ class DataBaseProvider:
         data: tf.FrameDated = fetch_data(assets=assets)
         self._db.tickers.save(data=data)
 
+    def get_results_path(self) -> Path:
+        return self._db.results
+
+    def get_costs_path(self) -> Path:
+        return self._db.costs
+
     def get_app_config(self) -> AppConfig:
         return AppConfig(
             assets_config=self._db.assets.get(),
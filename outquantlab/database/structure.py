@@ -13,12 +13,16 @@ class DBStructure:
     assets: AssetFiles = field(init=False)
     indics: IndicFiles = field(init=False)
     tickers: TickersData = field(init=False)
+    results: Path = field(init=False)
+    costs: Path = field(init=False)
 
     def __post_init__(self) -> None:
         self.path: Path = self._get_db_path(db_name=self.name)
         self.assets = AssetFiles(db_path=self.path)
         self.indics = IndicFiles(db_path=self.path)
         self.tickers = TickersData(db_path=self.path)
+        self.results = self.path / "results"
+        self.costs = self.path / "costs.json"
 
     def _get_db_path(self, db_name: str) -> Path:
         current_file_path: Path = Path(__file__).resolve()
@@ -1,7 +1,37 @@
-from outquantlab.indicators.interfaces import GenericIndic
+from outquantlab.indicators.interfaces import (
+    AssetsData,
+    BaseParams,
+    GenericIndic,
+)
 from outquantlab.indicators.indics_normalized import INDICATOR_REGISTRY
+from outquantlab.indicators.primitives import (
+    ROLLING_MULTI,
+    ROLLING_PRIMITIVES,
+    DirectRolling,
+    compute_multi,
+    compute_rolling,
+    Node,
+    NodeKey,
+    NodeParams,
+    Primitive,
+    RollingProvider,
+    Source,
+)
 
 __all__: list[str] = [
     'INDICATOR_REGISTRY',
-    'GenericIndic'
-]
\ No newline at end of file
+    'GenericIndic',
+    'ROLLING_PRIMITIVES',
+    'ROLLING_MULTI',
+    'compute_multi',
+    'compute_rolling',
+    'DirectRolling',
+    'Primitive',
+    'RollingProvider',
+    'AssetsData',
+    'BaseParams',
+    'Node',
+    'NodeKey',
+    'NodeParams',
+    'Source',
+]
@@ -1,3 +1,5 @@
+from typing import Any
+
 import numquant as nq
 import outquantlab.indicators.indics_raw as raw
 from outquantlab.indicators.indics_types import (
@@ -11,7 +13,12 @@ from outquantlab.indicators.indics_types import (
     IndicNormalizedSmoothedSignal,
     IndicNormalizedSmoothedSignalTrend
 )
-from outquantlab.indicators.interfaces import AssetsData, BaseIndic, GenericIndic
+from outquantlab.indicators.interfaces import (
+    AssetsData,
+    BaseIndic,
+    DiscreteIndic,
+    GenericIndic,
+)
 from outquantlab.indicators.params_types import (
     Acceleration,
     AccelerationTrend,
@@ -24,6 +31,7 @@ from outquantlab.indicators.params_types import (
     NormalizedSmoothedSignal,
     NormalizedSmoothedSignalTrend,
 )
+from outquantlab.indicators.primitives import Node
 
 INDICATOR_REGISTRY: dict[str, type[GenericIndic]] = {}
 
@@ -34,122 +42,133 @@ def register_indicator(cls: type[GenericIndic]) -> type[GenericIndic]:
 
 
 @register_indicator
-class MeanPriceRatio(IndicTrend):
-    def execute(self, data: AssetsData, params: Trend) -> nq.Float2D:
-        mean_price_ratio_raw: nq.Float2D = raw.get_mean_price_ratio_raw(
-            prices_array=data.prices,
-            params=params,
-        )
-        return nq.metrics.roll.sign_normalization(signal_array=mean_price_ratio_raw)
+class MeanPriceRatio(IndicTrend, DiscreteIndic[Trend]):
+    def get_nodes(self, params: Trend) -> list[Node[Any, Any]]:
+        return [raw.mean_price_ratio_node(params=params)]
+
+    def get_raw_signal(self, data: AssetsData, params: Trend) -> nq.Float2D:
+        mean_price_ratio_raw: nq.Float2D = self.evaluate_nodes(
+            data=data, params=params
+        )[0]
+        return mean_price_ratio_raw
 
 
 @register_indicator
-class MedianPriceRatio(IndicTrend):
-    def execute(self, data: AssetsData, params: Trend) -> nq.Float2D:
-        median_price_ratio_raw: nq.Float2D = raw.get_median_price_ratio_raw(
-            prices_array=data.prices,
-            params=params,
-        )
-        return nq.metrics.roll.sign_normalization(signal_array=median_price_ratio_raw)
+class MedianPriceRatio(IndicTrend, DiscreteIndic[Trend]):
+    def get_nodes(self, params: Trend) -> list[Node[Any, Any]]:
+        return [raw.median_price_ratio_node(params=params)]
+
+    def get_raw_signal(self, data: AssetsData, params: Trend) -> nq.Float2D:
+        median_price_ratio_raw: nq.Float2D = self.evaluate_nodes(
+            data=data, params=params
+        )[0]
+        return median_price_ratio_raw
 
 
 @register_indicator
-class CentralPriceRatio(IndicTrend):
-    def execute(self, data: AssetsData, params: Trend) -> nq.Float2D:
-        central_price_ratio_raw: nq.Float2D = raw.get_central_price_ratio_raw(
-            prices_array=data.prices,
-            params=params,
-        )
-        return nq.metrics.roll.sign_normalization(signal_array=central_price_ratio_raw)
+class CentralPriceRatio(IndicTrend, DiscreteIndic[Trend]):
+    def get_nodes(self, params: Trend) -> list[Node[Any, Any]]:
+        return [raw.central_price_ratio_node(params=params)]
+
+    def get_raw_signal(self, data: AssetsData, params: Trend) -> nq.Float2D:
+        central_price_ratio_raw: nq.Float2D = self.evaluate_nodes(
+            data=data, params=params
+        )[0]
+        return central_price_ratio_raw
 
 
 @register_indicator
-class MeanRateOfChange(IndicTrend):
-    def execute(self, data: AssetsData, params: Trend) -> nq.Float2D:
-        mean_roc_raw: nq.Float2D = raw.get_mean_rate_of_change_raw(
-            log_returns_array=data.log_returns,
-            params=params,
-        )
-        return nq.metrics.roll.sign_normalization(signal_array=mean_roc_raw)
+class MeanRateOfChange(IndicTrend, DiscreteIndic[Trend]):
+    def get_nodes(self, params: Trend) -> list[Node[Any, Any]]:
+        return [raw.mean_rate_of_change_node(params=params)]
+
+    def get_raw_signal(self, data: AssetsData, params: Trend) -> nq.Float2D:
+        mean_roc_raw: nq.Float2D = self.evaluate_nodes(data=data, params=params)[0]
+        return mean_roc_raw
 
 
 @register_indicator
-class MedianRateOfChange(IndicTrend):
-    def execute(self, data: AssetsData, params: Trend) -> nq.Float2D:
-        median_roc_raw: nq.Float2D = raw.get_median_rate_of_change_raw(
-            log_returns_array=data.log_returns,
-            params=params,
-        )
-        return nq.metrics.roll.sign_normalization(signal_array=median_roc_raw)
+class MedianRateOfChange(IndicTrend, DiscreteIndic[Trend]):
+    def get_nodes(self, params: Trend) -> list[Node[Any, Any]]:
+        return [raw.median_rate_of_change_node(params=params)]
+
+    def get_raw_signal(self, data: AssetsData, params: Trend) -> nq.Float2D:
+        median_roc_raw: nq.Float2D = self.evaluate_nodes(data=data, params=params)[0]
+        return median_roc_raw
 
 
 @register_indicator
-class MeanPriceMacd(IndicAcceleration):
-    def execute(self, data: AssetsData, params: Acceleration) -> nq.Float2D:
-        mean_price_ratio_macd_raw: nq.Float2D = raw.get_mean_price_macd_raw(
-            prices_array=data.prices,
-            params=params,
-        )
-        return nq.metrics.roll.sign_normalization(
-            signal_array=mean_price_ratio_macd_raw
-        )
+class MeanPriceMacd(IndicAcceleration, DiscreteIndic[Acceleration]):
+    def get_nodes(self, params: Acceleration) -> list[Node[Any, Any]]:
+        return [raw.mean_price_macd_node(params=params)]
+
+    def get_raw_signal(self, data: AssetsData, params: Acceleration) -> nq.Float2D:
+        mean_price_ratio_macd_raw: nq.Float2D = self.evaluate_nodes(
+            data=data, params=params
+        )[0]
+        return mean_price_ratio_macd_raw
 
 
 @register_indicator
-class MedianPriceMacd(IndicAcceleration):
-    def execute(self, data: AssetsData, params: Acceleration) -> nq.Float2D:
-        median_price_ratio_macd_raw: nq.Float2D = raw.get_median_price_macd_raw(
-            prices_array=data.prices,
-            params=params,
-        )
-        return nq.metrics.roll.sign_normalization(
-            signal_array=median_price_ratio_macd_raw
-        )
+class MedianPriceMacd(IndicAcceleration, DiscreteIndic[Acceleration]):
+    def get_nodes(self, params: Acceleration) -> list[Node[Any, Any]]:
+        return [raw.median_price_macd_node(params=params)]
+
+    def get_raw_signal(self, data: AssetsData, params: Acceleration) -> nq.Float2D:
+        median_price_ratio_macd_raw: nq.Float2D = self.evaluate_nodes(
+            data=data, params=params
+        )[0]
+        return median_price_ratio_macd_raw
 
 
 @register_indicator
-class CentralPriceMacd(IndicAcceleration):
-    def execute(self, data: AssetsData, params: Acceleration) -> nq.Float2D:
-        central_price_ratio_macd_raw: nq.Float2D = raw.get_central_price_macd_raw(
-            prices_array=data.prices,
-            params=params,
-        )
-        return nq.metrics.roll.sign_normalization(
-            signal_array=central_price_ratio_macd_raw
-        )
+class CentralPriceMacd(IndicAcceleration, DiscreteIndic[Acceleration]):
+    def get_nodes(self, params: Acceleration) -> list[Node[Any, Any]]:
+        return [raw.central_price_macd_node(params=params)]
+
+    def get_raw_signal(self, data: AssetsData, params: Acceleration) -> nq.Float2D:
+        central_price_ratio_macd_raw: nq.Float2D = self.evaluate_nodes(
+            data=data, params=params
+        )[0]
+        return central_price_ratio_macd_raw
 
 
 @register_indicator
-class MeanRateOfChangeMacd(IndicAcceleration):
-    def execute(self, data: AssetsData, params: Acceleration) -> nq.Float2D:
-        mean_roc_macd_raw: nq.Float2D = raw.get_mean_rate_of_change_macd_raw(
-            returns_array=data.log_returns,
-            params=params,
-        )
-        return nq.metrics.roll.sign_normalization(signal_array=mean_roc_macd_raw)
+class MeanRateOfChangeMacd(IndicAcceleration, DiscreteIndic[Acceleration]):
+    def get_nodes(self, params: Acceleration) -> list[Node[Any, Any]]:
+        return [raw.mean_rate_of_change_macd_node(params=params)]
+
+    def get_raw_signal(self, data: AssetsData, params: Acceleration) -> nq.Float2D:
+        mean_roc_macd_raw: nq.Float2D = self.evaluate_nodes(
+            data=data, params=params
+        )[0]
+        return mean_roc_macd_raw
 
 
 @register_indicator
-class MedianRateOfChangeMacd(IndicAcceleration):
-    def execute(self, data: AssetsData, params: Acceleration) -> nq.Float2D:
-        median_roc_macd_raw: nq.Float2D = raw.get_median_rate_of_change_macd_raw(
-            returns_array=data.log_returns,
-            params=params,
-        )
-        return nq.metrics.roll.sign_normalization(signal_array=median_roc_macd_raw)
+class MedianRateOfChangeMacd(IndicAcceleration, DiscreteIndic[Acceleration]):
+    def get_nodes(self, params: Acceleration) -> list[Node[Any, Any]]:
+        return [raw.median_rate_of_change_macd_node(params=params)]
+
+    def get_raw_signal(self, data: AssetsData, params: Acceleration) -> nq.Float2D:
+        median_roc_macd_raw: nq.Float2D = self.evaluate_nodes(
+            data=data, params=params
+        )[0]
+        return median_roc_macd_raw
 
 
 @register_indicator
 class MeanPriceMacdTrend(IndicAccelerationTrend):
+    def get_nodes(self, params: AccelerationTrend) -> list[Node[Any, Any]]:
+        return [
+            raw.mean_price_ratio_node(params=params.filter),
+            raw.mean_price_macd_node(params=params.macd),
+        ]
+
     def execute(self, data: AssetsData, params: AccelerationTrend) -> nq.Float2D:
-        mean_price_ratio_signal: nq.Float2D = raw.get_mean_price_ratio_raw(
-            prices_array=data.prices,
-            params=params.filter,
-        )
-        mean_price_macd_signal: nq.Float2D = raw.get_mean_price_macd_raw(
-            prices_array=data.prices, params=params.macd
+        mean_price_ratio_signal, mean_price_macd_signal = self.evaluate_nodes(
+            data=data, params=params
         )
-
         return nq.metrics.roll.get_indicator_on_trend_signal(
             trend_signal=mean_price_ratio_signal,
             indicator_signal=mean_price_macd_signal,
@@ -158,13 +177,15 @@ class MeanPriceMacdTrend(IndicAccelerationTrend):
 
 @register_indicator
 class MedianPriceMacdTrend(IndicAccelerationTrend):
+    def get_nodes(self, params: AccelerationTrend) -> list[Node[Any, Any]]:
+        return [
+            raw.median_price_ratio_node(params=params.filter),
+            raw.median_price_macd_node(params=params.macd),
+        ]
+
     def execute(self, data: AssetsData, params: AccelerationTrend) -> nq.Float2D:
-        median_price_ratio_signal: nq.Float2D = raw.get_median_price_ratio_raw(
-            prices_array=data.prices,
-            params=params.filter,
-        )
-        median_price_macd_signal: nq.Float2D = raw.get_median_price_macd_raw(
-            prices_array=data.prices, params=params.macd
+        median_price_ratio_signal, median_price_macd_signal = self.evaluate_nodes(
+            data=data, params=params
         )
         return nq.metrics.roll.get_indicator_on_trend_signal(
             trend_signal=median_price_ratio_signal,
@@ -174,13 +195,15 @@ class MedianPriceMacdTrend(IndicAccelerationTrend):
 
 @register_indicator
 class CentralPriceMacdTrend(IndicAccelerationTrend):
+    def get_nodes(self, params: AccelerationTrend) -> list[Node[Any, Any]]:
+        return [
+            raw.central_price_ratio_node(params=params.filter),
+            raw.central_price_macd_node(params=params.macd),
+        ]
+
     def execute(self, data: AssetsData, params: AccelerationTrend) -> nq.Float2D:
-        central_price_ratio_signal: nq.Float2D = raw.get_central_price_ratio_raw(
-            prices_array=data.prices,
-            params=params.filter,
-        )
-        central_price_macd_signal: nq.Float2D = raw.get_central_price_macd_raw(
-            prices_array=data.prices, params=params.macd
+        central_price_ratio_signal, central_price_macd_signal = self.evaluate_nodes(
+            data=data, params=params
         )
         return nq.metrics.roll.get_indicator_on_trend_signal(
             trend_signal=central_price_ratio_signal,
@@ -190,13 +213,15 @@ class CentralPriceMacdTrend(IndicAccelerationTrend):
 
 @register_indicator
 class MeanRateOfChangeMacdTrend(IndicAccelerationTrend):
+    def get_nodes(self, params: AccelerationTrend) -> list[Node[Any, Any]]:
+        return [
+            raw.mean_rate_of_change_node(params=params.filter),
+            raw.mean_rate_of_change_macd_node(params=params.macd),
+        ]
+
     def execute(self, data: AssetsData, params: AccelerationTrend) -> nq.Float2D:
-        mean_roc_trend_signal: nq.Float2D = raw.get_mean_rate_of_change_raw(
-            log_returns_array=data.log_returns,
-            params=params.filter,
-        )
-        mean_roc_macd_signal: nq.Float2D = raw.get_mean_rate_of_change_macd_raw(
-            returns_array=data.log_returns, params=params.macd
+        mean_roc_trend_signal, mean_roc_macd_signal = self.evaluate_nodes(
+            data=data, params=params
         )
         return nq.metrics.roll.get_indicator_on_trend_signal(
             trend_signal=mean_roc_trend_signal,
@@ -206,13 +231,15 @@ class MeanRateOfChangeMacdTrend(IndicAccelerationTrend):
 
 @register_indicator
 class MedianRateOfChangeMacdTrend(IndicAccelerationTrend):
+    def get_nodes(self, params: AccelerationTrend) -> list[Node[Any, Any]]:
+        return [
+            raw.median_rate_of_change_node(params=params.filter),
+            raw.median_rate_of_change_macd_node(params=params.macd),
+        ]
+
     def execute(self, data: AssetsData, params: AccelerationTrend) -> nq.Float2D:
-        median_roc_trend_signal: nq.Float2D = raw.get_median_rate_of_change_raw(
-            log_returns_array=data.log_returns,
-            params=params.filter,
-        )
-        median_roc_macd_signal: nq.Float2D = raw.get_median_rate_of_change_macd_raw(
-            returns_array=data.log_returns, params=params.macd
+        median_roc_trend_signal, median_roc_macd_signal = self.evaluate_nodes(
+            data=data, params=params
         )
         return nq.metrics.roll.get_indicator_on_trend_signal(
             trend_signal=median_roc_trend_signal,
@@ -223,7 +250,7 @@ class MedianRateOfChangeMacdTrend(IndicAccelerationTrend):
 @register_indicator
 class FixedBias(BaseIndic[Bias]):
     def execute(self, data: AssetsData, params: Bias) -> nq.Float2D:
-        return nq.arrays.create_full_like(model=data.prices, fill_value=nq.Float32(1.0))
+        return nq.arrays.create_full_like(model=data.pct_returns, fill_value=nq.Float32(1.0))
 
     def _get_combo(self, combination: tuple[int, ...]) -> Bias:
         return Bias(values=combination)
@@ -231,37 +258,41 @@ class FixedBias(BaseIndic[Bias]):
 
 @register_indicator
 class MeanPriceRatioNormalised(IndicSmoothedSignal):
+    def get_nodes(self, params: SmoothedSignal) -> list[Node[Any, Any]]:
+        return [raw.normalised_mean_price_ratio_node(params=params)]
+
     def execute(self, data: AssetsData, params: SmoothedSignal) -> nq.Float2D:
-        normalised_price_ratio: nq.Float2D = raw.get_normalised_mean_price_ratio_raw(
-            prices_array=data.prices, params=params
-        )
+        normalised_price_ratio: nq.Float2D = self.evaluate_nodes(
+            data=data, params=params
+        )[0]
         return nq.metrics.roll.limit_normalization(signal_array=normalised_price_ratio)
 
 
 @register_indicator
 class MeanRateOfChangeNormalised(IndicSmoothedSignal):
+    def get_nodes(self, params: SmoothedSignal) -> list[Node[Any, Any]]:
+        return [raw.normalised_mean_rate_of_change_node(params=params)]
+
     def execute(self, data: AssetsData, params: SmoothedSignal) -> nq.Float2D:
-        normalised_roc: nq.Float2D = raw.get_normalised_mean_rate_of_change_raw(
-            log_returns_array=data.log_returns, params=params
-        )
+        normalised_roc: nq.Float2D = self.evaluate_nodes(data=data, params=params)[0]
 
         return nq.metrics.roll.limit_normalization(signal_array=normalised_roc)
 
 
 @register_indicator
 class MeanRateOfChangeNormalisedTrend(IndicSmoothedSignalTrend):
+    def get_nodes(self, params: SmoothedSignalTrend) -> list[Node[Any, Any]]:
+        return [
+            raw.normalised_mean_rate_of_change_node(params=params.smoothed_signal),
+            raw.mean_rate_of_change_node(params=params.trend),
+        ]
+
     def execute(
         self,
         data: AssetsData,
         params: SmoothedSignalTrend,
     ) -> nq.Float2D:
-        normalised_roc: nq.Float2D = raw.get_normalised_mean_rate_of_change_raw(
-            log_returns_array=data.log_returns, params=params.smoothed_signal
-        )
-        trend_signal: nq.Float2D = raw.get_mean_rate_of_change_raw(
-            log_returns_array=data.log_returns,
-            params=params.trend,
-        )
+        normalised_roc, trend_signal = self.evaluate_nodes(data=data, params=params)
         normalised_on_trend_signal: nq.Float2D = (
             nq.metrics.roll.get_indicator_on_trend_signal(
                 trend_signal=trend_signal, indicator_signal=normalised_roc
@@ -274,17 +305,18 @@ class MeanRateOfChangeNormalisedTrend(IndicSmoothedSignalTrend):
 
 @register_indicator
 class MeanPriceRatioNormalisedTrend(IndicSmoothedSignalTrend):
+    def get_nodes(self, params: SmoothedSignalTrend) -> list[Node[Any, Any]]:
+        return [
+            raw.normalised_mean_price_ratio_node(params=params.smoothed_signal),
+            raw.mean_price_ratio_node(params=params.trend),
+        ]
+
     def execute(
         self,
         data: AssetsData,
         params: SmoothedSignalTrend,
     ) -> nq.Float2D:
-        normalised_ratio: nq.Float2D = raw.get_normalised_mean_price_ratio_raw(
-            prices_array=data.prices, params=params.smoothed_signal
-        )
-        trend_signal: nq.Float2D = raw.get_mean_price_ratio_raw(
-            prices_array=data.prices, params=params.trend
-        )
+        normalised_ratio, trend_signal = self.evaluate_nodes(data=data, params=params)
         normalised_on_trend_signal: nq.Float2D = (
             nq.metrics.roll.get_indicator_on_trend_signal(
                 trend_signal=trend_signal, indicator_signal=normalised_ratio
@@ -296,78 +328,101 @@ class MeanPriceRatioNormalisedTrend(IndicSmoothedSignalTrend):
 
 
 @register_indicator
-class Skewness(IndicSmoothedSignal):
-    def execute(self, data: AssetsData, params: SmoothedSignal) -> nq.Float2D:
-        skewness_array: nq.Float2D = raw.smoothed_skewness(
-            log_returns_array=data.log_returns, params=params
-        )
-        return nq.metrics.roll.sign_normalization(signal_array=-skewness_array)
+class Skewness(IndicSmoothedSignal, DiscreteIndic[SmoothedSignal]):
+    def get_nodes(self, params: SmoothedSignal) -> list[Node[Any, Any]]:
+        return [raw.smoothed_moments_node(params=params)]
+
+    def get_raw_signal(self, data: AssetsData, params: SmoothedSignal) -> nq.Float2D:
+        moments: nq.metrics.roll.RollingMoments = self.evaluate_nodes(
+            data=data, params=params
+        )[0]
+        return -moments.skewness
 
 
 @register_indicator
-class RelativeSkewness(IndicNormalizedSmoothedSignal):
-    def execute(self, data: AssetsData, params: NormalizedSmoothedSignal) -> nq.Float2D:
+class RelativeSkewness(IndicNormalizedSmoothedSignal, DiscreteIndic[NormalizedSmoothedSignal]):
+    def get_nodes(self, params: NormalizedSmoothedSignal) -> list[Node[Any, Any]]:
+        return [raw.smoothed_moments_node(params=params.smoothed_signal)]
+
+    def get_raw_signal(self, data: AssetsData, params: NormalizedSmoothedSignal) -> nq.Float2D:
+        moments: nq.metrics.roll.RollingMoments = self.evaluate_nodes(
+            data=data, params=params
+        )[0]
         relative_skew: nq.Float2D = raw.get_relative_skewness(
-            log_returns_array=data.log_returns, params=params
+            moments=moments, normalization=params.normalization
         )
-        return nq.metrics.roll.sign_normalization(signal_array=relative_skew)
+        return relative_skew
 
 
 @register_indicator
-class SkewnessOnKurtosis(IndicSmoothedSignal):
-    def execute(self, data: AssetsData, params: SmoothedSignal) -> nq.Float2D:
+class SkewnessOnKurtosis(IndicSmoothedSignal, DiscreteIndic[SmoothedSignal]):
+    def get_nodes(self, params: SmoothedSignal) -> list[Node[Any, Any]]:
+        return [raw.smoothed_moments_node(params=params)]
+
+    def get_raw_signal(self, data: AssetsData, params: SmoothedSignal) -> nq.Float2D:
+        moments: nq.metrics.roll.RollingMoments = self.evaluate_nodes(
+            data=data, params=params
+        )[0]
         skew_on_kurt_signal: nq.Float2D = raw.get_skew_on_kurtosis(
-            log_returns_array=data.log_returns, params=params
+            moments=moments, params=params
         )
-        return nq.metrics.roll.sign_normalization(signal_array=skew_on_kurt_signal)
+        return skew_on_kurt_signal
 
 
 @register_indicator
-class RelativeSkewnessOnKurtosis(IndicNormalizedSmoothedSignal):
-    def execute(self, data: AssetsData, params: NormalizedSmoothedSignal) -> nq.Float2D:
+class RelativeSkewnessOnKurtosis(IndicNormalizedSmoothedSignal, DiscreteIndic[NormalizedSmoothedSignal]):
+    def get_nodes(self, params: NormalizedSmoothedSignal) -> list[Node[Any, Any]]:
+        return [raw.smoothed_moments_node(params=params.smoothed_signal)]
+
+    def get_raw_signal(self, data: AssetsData, params: NormalizedSmoothedSignal) -> nq.Float2D:
+        moments: nq.metrics.roll.RollingMoments = self.evaluate_nodes(
+            data=data, params=params
+        )[0]
         relative_skew_on_kurt_signal: nq.Float2D = raw.get_relative_skew_on_kurtosis(
-            log_returns_array=data.log_returns,
-            params=params,
+            moments=moments, params=params
         )
 
-        return nq.metrics.roll.sign_normalization(
-            signal_array=relative_skew_on_kurt_signal
-        )
+        return relative_skew_on_kurt_signal
 
 
 @register_indicator
-class SkewnessTrend(IndicSmoothedSignalTrend):
-    def execute(
+class SkewnessTrend(IndicSmoothedSignalTrend, DiscreteIndic[SmoothedSignalTrend]):
+    def get_nodes(self, params: SmoothedSignalTrend) -> list[Node[Any, Any]]:
+        return [
+            raw.smoothed_moments_node(params=params.smoothed_signal),
+            raw.mean_rate_of_change_node(params=params.trend),
+        ]
+
+    def get_raw_signal(
         self,
         data: AssetsData,
         params: SmoothedSignalTrend,
     ) -> nq.Float2D:
-        skewness_signal: nq.Float2D = raw.smoothed_skewness(
-            log_returns_array=data.log_returns, params=params.smoothed_signal
-        )
-        trend_signal: nq.Float2D = raw.get_mean_rate_of_change_raw(
-            log_returns_array=data.log_returns, params=params.trend
-        )
+        moments, trend_signal = self.evaluate_nodes(data=data, params=params)
         skew_on_trend_signal: nq.Float2D = (
             nq.metrics.roll.get_indicator_on_trend_signal(
-                trend_signal=trend_signal, indicator_signal=skewness_signal
+                trend_signal=trend_signal, indicator_signal=moments.skewness
             )
         )
-        return nq.metrics.roll.sign_normalization(signal_array=skew_on_trend_signal)
+        return skew_on_trend_signal
 
 
 @register_indicator
-class RelativeSkewnessTrend(IndicNormalizedSmoothedSignalTrend):
-    def execute(
+class RelativeSkewnessTrend(IndicNormalizedSmoothedSignalTrend, DiscreteIndic[NormalizedSmoothedSignalTrend]):
+    def get_nodes(self, params: NormalizedSmoothedSignalTrend) -> list[Node[Any, Any]]:
+        return [
+            raw.smoothed_moments_node(params=params.signal.smoothed_signal),
+            raw.mean_rate_of_change_node(params=params.trend),
+        ]
+
+    def get_raw_signal(
         self,
         data: AssetsData,
         params: NormalizedSmoothedSignalTrend,
     ) -> nq.Float2D:
+        moments, trend_signal = self.evaluate_nodes(data=data, params=params)
         relative_skewness_signal: nq.Float2D = raw.get_relative_skewness(
-            log_returns_array=data.log_returns, params=params.signal
-        )
-        trend_signal: nq.Float2D = raw.get_mean_rate_of_change_raw(
-            log_returns_array=data.log_returns, params=params.trend
+            moments=moments, normalization=params.signal.normalization
         )
         relative_skew_on_trend: nq.Float2D = (
             nq.metrics.roll.get_indicator_on_trend_signal(
@@ -375,22 +430,25 @@ class RelativeSkewnessTrend(IndicNormalizedSmoothedSignalTrend):
             )
         )
 
-        return nq.metrics.roll.sign_normalization(signal_array=relative_skew_on_trend)
+        return relative_skew_on_trend
 
 
 @register_indicator
 class SkewnessOnKurtosisTrend(IndicSmoothedSignalTrend):
+    def get_nodes(self, params: SmoothedSignalTrend) -> list[Node[Any, Any]]:
+        return [
+            raw.smoothed_moments_node(params=params.smoothed_signal),
+            raw.mean_rate_of_change_node(params=params.trend),
+        ]
+
     def execute(
         self,
         data: AssetsData,
         params: SmoothedSignalTrend,
     ) -> nq.Float2D:
+        moments, trend_signal = self.evaluate_nodes(data=data, params=params)
         skew_on_kurt_signal: nq.Float2D = raw.get_skew_on_kurtosis(
-            log_returns_array=data.log_returns, params=params.smoothed_signal
-        )
-        trend_signal: nq.Float2D = raw.get_mean_rate_of_change_raw(
-            log_returns_array=data.log_returns,
-            params=params.trend,
+            moments=moments, params=params.smoothed_signal
         )
         return nq.metrics.roll.get_indicator_on_trend_signal(
             trend_signal=trend_signal, indicator_signal=skew_on_kurt_signal
@@ -399,17 +457,20 @@ class SkewnessOnKurtosisTrend(IndicSmoothedSignalTrend):
 
 @register_indicator
 class RelativeSkewnessOnKurtosisTrend(IndicNormalizedSmoothedSignalTrend):
+    def get_nodes(self, params: NormalizedSmoothedSignalTrend) -> list[Node[Any, Any]]:
+        return [
+            raw.smoothed_moments_node(params=params.signal.smoothed_signal),
+            raw.mean_rate_of_change_node(params=params.trend),
+        ]
+
     def execute(
         self,
         data: AssetsData,
         params: NormalizedSmoothedSignalTrend,
     ) -> nq.Float2D:
+        moments, trend_signal = self.evaluate_nodes(data=data, params=params)
         relative_skew_on_kurt_signal: nq.Float2D = raw.get_relative_skew_on_kurtosis(
-            log_returns_array=data.log_returns, params=params.signal
-        )
-        trend_signal: nq.Float2D = raw.get_mean_rate_of_change_raw(
-            log_returns_array=data.log_returns,
-            params=params.trend,
+            moments=moments, params=params.signal
         )
         relative_skew_on_kurt_on_trend: nq.Float2D = (
             nq.metrics.roll.get_indicator_on_trend_signal(
@@ -425,36 +486,44 @@ class RelativeSkewnessOnKurtosisTrend(IndicNormalizedSmoothedSignalTrend):
 
 @register_indicator
 class DirectionalVolatility(IndicSmoothedSignal):
+    def get_nodes(self, params: SmoothedSignal) -> list[Node[Any, Any]]:
+        return [raw.directional_volatility_node(params=params)]
+
     def execute(self, data: AssetsData, params: SmoothedSignal) -> nq.Float2D:
-        return raw.smoothed_directional_volatility(
-            returns_array=data.log_returns,
-            params=params,
-        )
+        volatility: nq.Float2D = self.evaluate_nodes(data=data, params=params)[0]
+        return volatility
 
 
 @register_indicator
-class RelativeDirectionalVolatility(IndicVolatility):
-    def execute(
+class RelativeDirectionalVolatility(IndicVolatility, DiscreteIndic[Volatility]):
+    def get_nodes(self, params: Volatility) -> list[Node[Any, Any]]:
+        return [raw.directional_volatility_node(params=params.smoothed_signal)]
+
+    def get_raw_signal(
         self,
         data: AssetsData,
         params: Volatility,
     ) -> nq.Float2D:
+        directional_vol: nq.Float2D = self.evaluate_nodes(data=data, params=params)[0]
         relative_directional_vol_signal: nq.Float2D = (
             raw.relative_directional_volatility(
-                log_returns_array=data.log_returns, params=params
+                directional_volatility=directional_vol,
+                normalization=params.normalization,
             )
         )
-        return nq.metrics.roll.sign_normalization(
-            signal_array=relative_directional_vol_signal
-        )
+        return relative_directional_vol_signal
 
 
 @register_indicator
 class NormalisedDirectionalVolatility(IndicVolatility):
+    def get_nodes(self, params: Volatility) -> list[Node[Any, Any]]:
+        return [raw.directional_volatility_node(params=params.smoothed_signal)]
+
     def execute(self, data: AssetsData, params: Volatility) -> nq.Float2D:
+        directional_vol: nq.Float2D = self.evaluate_nodes(data=data, params=params)[0]
         normalised_directional_vol: nq.Float2D = raw.normalised_directional_volatility(
-            log_returns_array=data.log_returns,
-            params=params,
+            directional_volatility=directional_vol,
+            normalization=params.normalization,
         )
 
         return nq.metrics.roll.limit_normalization(
@@ -464,20 +533,24 @@ class NormalisedDirectionalVolatility(IndicVolatility):
 
 @register_indicator
 class RelativeDirectionalVolatilityTrend(IndicVolatilityTrend):
+    def get_nodes(self, params: VolatilityTrend) -> list[Node[Any, Any]]:
+        return [
+            raw.directional_volatility_node(params=params.volatility.smoothed_signal),
+            raw.mean_rate_of_change_node(params=params.filter),
+        ]
+
     def execute(
         self,
         data: AssetsData,
         params: VolatilityTrend,
     ) -> nq.Float2D:
+        directional_vol, trend_signal = self.evaluate_nodes(data=data, params=params)
         relative_directional_vol_signal: nq.Float2D = (
             raw.relative_directional_volatility(
-                log_returns_array=data.log_returns, params=params.volatility
+                directional_volatility=directional_vol,
+                normalization=params.volatility.normalization,
             )
         )
-        trend_signal: nq.Float2D = raw.get_mean_rate_of_change_raw(
-            log_returns_array=data.log_returns,
-            params=params.filter,
-        )
 
         relative_directional_vol_on_trend: nq.Float2D = (
             nq.metrics.roll.get_indicator_on_trend_signal(
@@ -492,18 +565,21 @@ class RelativeDirectionalVolatilityTrend(IndicVolatilityTrend):
 
 @register_indicator
 class NormalisedDirectionalVolatilityTrend(IndicVolatilityTrend):
+    def get_nodes(self, params: VolatilityTrend) -> list[Node[Any, Any]]:
+        return [
+            raw.directional_volatility_node(params=params.volatility.smoothed_signal),
+            raw.mean_rate_of_change_node(params=params.filter),
+        ]
+
     def execute(
         self,
         data: AssetsData,
         params: VolatilityTrend,
     ) -> nq.Float2D:
+        directional_vol, trend_signal = self.evaluate_nodes(data=data, params=params)
         normalised_directional_vol: nq.Float2D = raw.normalised_directional_volatility(
-            log_returns_array=data.log_returns,
-            params=params.volatility,
-        )
-        trend_signal: nq.Float2D = raw.get_mean_rate_of_change_raw(
-            log_returns_array=data.log_returns,
-            params=params.filter,
+            directional_volatility=directional_vol,
+            normalization=params.volatility.normalization,
         )
         normalised_directional_vol_on_trend: nq.Float2D = (
             nq.metrics.roll.get_indicator_on_trend_signal(
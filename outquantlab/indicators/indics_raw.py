@@ -2,18 +2,22 @@ from outquantlab.indicators.params_types import (
     Acceleration,
     SmoothedSignal,
     Trend,
-    Volatility,
     NormalizedSmoothedSignal
 )
+from outquantlab.indicators.primitives import Node, Primitive, RollingProvider, Source
 import numquant as nq
 
 
-def get_mean_price_ratio_raw(prices_array: nq.Float2D, params: Trend) -> nq.Float2D:
-    mean_price_ST: nq.Float2D = nq.metrics.roll.get_mean(
-        array=prices_array, length=params.short, min_length=params.short
-    )
-    mean_price_LT: nq.Float2D = nq.metrics.roll.get_mean(
-        array=prices_array, length=params.long, min_length=params.long
+def get_mean_price_ratio_raw(
+    prices_array: nq.Float2D,
+    params: Trend,
+    rolling: RollingProvider,
+) -> nq.Float2D:
+    mean_price_ST, mean_price_LT = rolling.get_multi(
+        array=prices_array,
+        primitive=Primitive.MEAN,
+        lengths=[params.short, params.long],
+        min_lengths=[params.short, params.long],
     )
 
     return nq.metrics.roll.ratio_normalization(
@@ -21,12 +25,16 @@ def get_mean_price_ratio_raw(prices_array: nq.Float2D, params: Trend) -> nq.Floa
     )
 
 
-def get_median_price_ratio_raw(prices_array: nq.Float2D, params: Trend) -> nq.Float2D:
-    median_price_ST: nq.Float2D = nq.metrics.roll.get_median(
-        array=prices_array, length=params.short, min_length=params.short
-    )
-    median_price_LT: nq.Float2D = nq.metrics.roll.get_median(
-        array=prices_array, length=params.long, min_length=params.long
+def get_median_price_ratio_raw(
+    prices_array: nq.Float2D,
+    params: Trend,
+    rolling: RollingProvider,
+) -> nq.Float2D:
+    median_price_ST, median_price_LT = rolling.get_multi(
+        array=prices_array,
+        primitive=Primitive.MEDIAN,
+        lengths=[params.short, params.long],
+        min_lengths=[params.short, params.long],
     )
 
     return nq.metrics.roll.ratio_normalization(
@@ -34,12 +42,16 @@ def get_median_price_ratio_raw(prices_array: nq.Float2D, params: Trend) -> nq.Fl
     )
 
 
-def get_central_price_ratio_raw(prices_array: nq.Float2D, params: Trend) -> nq.Float2D:
-    central_price_ST: nq.Float2D = nq.metrics.roll.get_central_point(
-        array=prices_array, length=params.short, min_length=params.short
-    )
-    central_price_LT: nq.Float2D = nq.metrics.roll.get_central_point(
-        array=prices_array, length=params.long, min_length=params.long
+def get_central_price_ratio_raw(
+    prices_array: nq.Float2D,
+    params: Trend,
+    rolling: RollingProvider,
+) -> nq.Float2D:
+    central_price_ST, central_price_LT = rolling.get_multi(
+        array=prices_array,
+        primitive=Primitive.CENTRAL,
+        lengths=[params.short, params.long],
+        min_lengths=[params.short, params.long],
     )
 
     return nq.metrics.roll.ratio_normalization(
@@ -48,10 +60,15 @@ def get_central_price_ratio_raw(prices_array: nq.Float2D, params: Trend) -> nq.F
 
 
 def get_mean_rate_of_change_raw(
-    log_returns_array: nq.Float2D, params: Trend
+    log_returns_array: nq.Float2D,
+    params: Trend,
+    rolling: RollingProvider,
 ) -> nq.Float2D:
-    mean_returns: nq.Float2D = nq.metrics.roll.get_mean(
-        array=log_returns_array, length=params.short, min_length=params.short
+    mean_returns: nq.Float2D = rolling.get(
+        array=log_returns_array,
+        primitive=Primitive.MEAN,
+        length=params.short,
+        min_length=params.short,
     )
 
     return nq.metrics.roll.get_sum(
@@ -60,10 +77,15 @@ def get_mean_rate_of_change_raw(
 
 
 def get_median_rate_of_change_raw(
-    log_returns_array: nq.Float2D, params: Trend
+    log_returns_array: nq.Float2D,
+    params: Trend,
+    rolling: RollingProvider,
 ) -> nq.Float2D:
-    median_returns: nq.Float2D = nq.metrics.roll.get_median(
-        array=log_returns_array, length=params.short, min_length=params.short
+    median_returns: nq.Float2D = rolling.get(
+        array=log_returns_array,
+        primitive=Primitive.MEDIAN,
+        length=params.short,
+        min_length=params.short,
     )
 
     return nq.metrics.roll.get_sum(
@@ -72,10 +94,12 @@ def get_median_rate_of_change_raw(
 
 
 def get_mean_price_macd_raw(
-    prices_array: nq.Float2D, params: Acceleration
+    prices_array: nq.Float2D,
+    params: Acceleration,
+    rolling: RollingProvider,
 ) -> nq.Float2D:
-    mean_price_ratio_raw: nq.Float2D = get_mean_price_ratio_raw(
-        prices_array=prices_array, params=params.trend
+    mean_price_ratio_raw: nq.Float2D = rolling.evaluate(
+        node=mean_price_ratio_node(params=params.trend), array=prices_array
     )
     mean_price_ratio_raw_sma: nq.Float2D = nq.metrics.roll.get_mean(
         array=mean_price_ratio_raw,
@@ -87,10 +111,12 @@ def get_mean_price_macd_raw(
 
 
 def get_median_price_macd_raw(
-    prices_array: nq.Float2D, params: Acceleration
+    prices_array: nq.Float2D,
+    params: Acceleration,
+    rolling: RollingProvider,
 ) -> nq.Float2D:
-    median_price_ratio_raw: nq.Float2D = get_median_price_ratio_raw(
-        prices_array=prices_array, params=params.trend
+    median_price_ratio_raw: nq.Float2D = rolling.evaluate(
+        node=median_price_ratio_node(params=params.trend), array=prices_array
     )
     median_price_ratio_raw_sma: nq.Float2D = nq.metrics.roll.get_mean(
         array=median_price_ratio_raw,
@@ -102,10 +128,12 @@ def get_median_price_macd_raw(
 
 
 def get_central_price_macd_raw(
-    prices_array: nq.Float2D, params: Acceleration
+    prices_array: nq.Float2D,
+    params: Acceleration,
+    rolling: RollingProvider,
 ) -> nq.Float2D:
-    central_price_ratio_raw: nq.Float2D = get_central_price_ratio_raw(
-        prices_array=prices_array, params=params.trend
+    central_price_ratio_raw: nq.Float2D = rolling.evaluate(
+        node=central_price_ratio_node(params=params.trend), array=prices_array
     )
     central_price_ratio_raw_sma: nq.Float2D = nq.metrics.roll.get_mean(
         array=central_price_ratio_raw,
@@ -117,10 +145,12 @@ def get_central_price_macd_raw(
 
 
 def get_mean_rate_of_change_macd_raw(
-    returns_array: nq.Float2D, params: Acceleration
+    returns_array: nq.Float2D,
+    params: Acceleration,
+    rolling: RollingProvider,
 ) -> nq.Float2D:
-    mean_roc_raw: nq.Float2D = get_mean_rate_of_change_raw(
-        log_returns_array=returns_array, params=params.trend
+    mean_roc_raw: nq.Float2D = rolling.evaluate(
+        node=mean_rate_of_change_node(params=params.trend), array=returns_array
     )
     mean_roc_raw_sma: nq.Float2D = nq.metrics.roll.get_mean(
         array=mean_roc_raw, length=params.acceleration, min_length=params.acceleration
@@ -130,10 +160,12 @@ def get_mean_rate_of_change_macd_raw(
 
 
 def get_median_rate_of_change_macd_raw(
-    returns_array: nq.Float2D, params: Acceleration
+    returns_array: nq.Float2D,
+    params: Acceleration,
+    rolling: RollingProvider,
 ) -> nq.Float2D:
-    median_roc_raw: nq.Float2D = get_median_rate_of_change_raw(
-        log_returns_array=returns_array, params=params.trend
+    median_roc_raw: nq.Float2D = rolling.evaluate(
+        node=median_rate_of_change_node(params=params.trend), array=returns_array
     )
     median_roc_raw_sma: nq.Float2D = nq.metrics.roll.get_mean(
         array=median_roc_raw, length=params.acceleration, min_length=params.acceleration
@@ -142,10 +174,15 @@ def get_median_rate_of_change_macd_raw(
 
 
 def get_normalised_mean_price_ratio_raw(
-    prices_array: nq.Float2D, params: SmoothedSignal
+    prices_array: nq.Float2D,
+    params: SmoothedSignal,
+    rolling: RollingProvider,
 ) -> nq.Float2D:
-    mean_roc: nq.Float2D = nq.metrics.roll.relative_normalization(
-        signal_array=prices_array, length=params.smoothing
+    mean_roc: nq.Float2D = prices_array - rolling.get(
+        array=prices_array,
+        primitive=Primitive.MEAN,
+        length=params.smoothing,
+        min_length=1,
     )
     return nq.metrics.roll.get_median_normalisation(
         signal_array=-mean_roc, window_length=params.signal
@@ -153,97 +190,77 @@ def get_normalised_mean_price_ratio_raw(
 
 
 def get_normalised_mean_rate_of_change_raw(
-    log_returns_array: nq.Float2D, params: SmoothedSignal
+    log_returns_array: nq.Float2D,
+    params: SmoothedSignal,
+    rolling: RollingProvider,
 ) -> nq.Float2D:
-    mean_roc: nq.Float2D = nq.metrics.roll.get_sum(
-        array=log_returns_array, length=params.smoothing
+    mean_roc: nq.Float2D = rolling.get(
+        array=log_returns_array,
+        primitive=Primitive.SUM,
+        length=params.smoothing,
+        min_length=1,
     )
     return nq.metrics.roll.get_median_normalisation(
         signal_array=-mean_roc, window_length=params.signal
     )
 
 
-def smoothed_skewness(
-    log_returns_array: nq.Float2D, params: SmoothedSignal
-) -> nq.Float2D:
-    smoothed_array: nq.Float2D = nq.metrics.roll.get_mean(
-        array=log_returns_array, length=params.smoothing, min_length=params.smoothing
-    )
-    return nq.metrics.roll.get_skewness(
-        array=smoothed_array, length=params.signal, min_length=params.signal
-    )
-
-
-def smoothed_kurtosis(
-    log_returns_array: nq.Float2D, params: SmoothedSignal
-) -> nq.Float2D:
-    smoothed_array: nq.Float2D = nq.metrics.roll.get_mean(
-        array=log_returns_array, length=params.smoothing, min_length=params.smoothing
+def smoothed_moments(
+    log_returns_array: nq.Float2D,
+    params: SmoothedSignal,
+    rolling: RollingProvider,
+) -> nq.metrics.roll.RollingMoments:
+    smoothed_array: nq.Float2D = rolling.get(
+        array=log_returns_array,
+        primitive=Primitive.MEAN,
+        length=params.smoothing,
+        min_length=params.smoothing,
     )
-
-    return nq.metrics.roll.get_kurtosis(
+    return nq.metrics.roll.get_rolling_moments(
         array=smoothed_array, length=params.signal, min_length=params.signal
     )
 
 
 def get_relative_skewness(
-    log_returns_array: nq.Float2D, params: NormalizedSmoothedSignal
+    moments: nq.metrics.roll.RollingMoments, normalization: int
 ) -> nq.Float2D:
-    skewness_array: nq.Float2D = smoothed_skewness(
-        log_returns_array=log_returns_array,
-        params=params.smoothed_signal,
-    )
     return nq.metrics.roll.relative_normalization(
-        signal_array=skewness_array, length=params.normalization
+        signal_array=moments.skewness, length=normalization
     )
 
 
 def get_relative_kurt(
-    log_returns_array: nq.Float2D, params: NormalizedSmoothedSignal
+    moments: nq.metrics.roll.RollingMoments, normalization: int
 ) -> nq.Float2D:
-    kurtosis_array: nq.Float2D = smoothed_kurtosis(
-        log_returns_array=log_returns_array,
-        params=params.smoothed_signal,
-    )
     return nq.metrics.roll.relative_normalization(
-        signal_array=kurtosis_array, length=params.normalization
+        signal_array=moments.kurtosis, length=normalization
     )
 
 
 # TODO: trouver moyen de separer ces 2 strategies conditionnelles
 def get_skew_on_kurtosis(
-    log_returns_array: nq.Float2D, params: SmoothedSignal
+    moments: nq.metrics.roll.RollingMoments, params: SmoothedSignal
 ) -> nq.Float2D:
-    skew: nq.Float2D = smoothed_skewness(
-        log_returns_array=log_returns_array,
-        params=params,
-    )
-    kurt: nq.Float2D = smoothed_kurtosis(
-        log_returns_array=log_returns_array,
-        params=params,
-    )
     if params.signal <= 64:
         skew_on_kurt_signal: nq.Float2D = nq.metrics.roll.invert_signal_long(
-            metric=kurt, signal=skew
+            metric=moments.kurtosis, signal=moments.skewness
         )
     else:
         skew_on_kurt_signal: nq.Float2D = nq.metrics.roll.invert_signal_short(
-            metric=kurt, signal=skew
+            metric=moments.kurtosis, signal=moments.skewness
         )
 
     return skew_on_kurt_signal
 
 
 def get_relative_skew_on_kurtosis(
-    log_returns_array: nq.Float2D, params: NormalizedSmoothedSignal
+    moments: nq.metrics.roll.RollingMoments, params: NormalizedSmoothedSignal
 ) -> nq.Float2D:
     relative_skew: nq.Float2D = get_relative_skewness(
-        log_returns_array=log_returns_array,
-        params=params,
+        moments=moments, normalization=params.normalization
     )
     relative_kurt: nq.Float2D = get_relative_kurt(
-        log_returns_array=log_returns_array,
-        params=params,
+        moments=moments, normalization=params.normalization
     )
     if params.smoothed_signal.signal <= 64:
         relative_skew_on_kurt_signal: nq.Float2D = nq.metrics.roll.invert_signal_short(
@@ -278,10 +295,15 @@ def separate_volatility(
 
 
 def smoothed_directional_volatility(
-    returns_array: nq.Float2D, params: SmoothedSignal
+    returns_array: nq.Float2D,
+    params: SmoothedSignal,
+    rolling: RollingProvider,
 ) -> nq.Float2D:
-    smoothed_array: nq.Float2D = nq.metrics.roll.get_mean(
-        array=returns_array, length=params.smoothing, min_length=params.smoothing
+    smoothed_array: nq.Float2D = rolling.get(
+        array=returns_array,
+        primitive=Primitive.MEAN,
+        length=params.smoothing,
+        min_length=params.smoothing,
     )
     positive_vol, negative_vol = separate_volatility(
         array=smoothed_array, len_vol=params.signal
@@ -291,23 +313,123 @@ def smoothed_directional_volatility(
 
 
 def relative_directional_volatility(
-    log_returns_array: nq.Float2D, params: Volatility
+    directional_volatility: nq.Float2D, normalization: int
 ) -> nq.Float2D:
-    directional_volatility_raw: nq.Float2D = smoothed_directional_volatility(
-        returns_array=log_returns_array, params=params.smoothed_signal
-    )
     return nq.metrics.roll.relative_normalization(
-        signal_array=directional_volatility_raw, length=params.normalization
+        signal_array=directional_volatility, length=normalization
     )
 
 
 def normalised_directional_volatility(
-    log_returns_array: nq.Float2D, params: Volatility
+    directional_volatility: nq.Float2D, normalization: int
 ) -> nq.Float2D:
-    directional_volatility_raw: nq.Float2D = smoothed_directional_volatility(
-        returns_array=log_returns_array,
-        params=params.smoothed_signal,
-    )
     return nq.metrics.roll.get_median_normalisation(
-        signal_array=directional_volatility_raw, window_length=params.normalization
+        signal_array=directional_volatility, window_length=normalization
+    )
+
+
+def mean_price_ratio_node(params: Trend) -> Node[Trend, nq.Float2D]:
+    return Node(func=get_mean_price_ratio_raw, source=Source.PRICES, params=params)
+
+
+def median_price_ratio_node(params: Trend) -> Node[Trend, nq.Float2D]:
+    return Node(func=get_median_price_ratio_raw, source=Source.PRICES, params=params)
+
+
+def central_price_ratio_node(params: Trend) -> Node[Trend, nq.Float2D]:
+    return Node(func=get_central_price_ratio_raw, source=Source.PRICES, params=params)
+
+
+def mean_rate_of_change_node(params: Trend) -> Node[Trend, nq.Float2D]:
+    return Node(
+        func=get_mean_rate_of_change_raw, source=Source.LOG_RETURNS, params=params
+    )
+
+
+def median_rate_of_change_node(params: Trend) -> Node[Trend, nq.Float2D]:
+    return Node(
+        func=get_median_rate_of_change_raw, source=Source.LOG_RETURNS, params=params
+    )
+
+
+def mean_price_macd_node(params: Acceleration) -> Node[Acceleration, nq.Float2D]:
+    return Node(
+        func=get_mean_price_macd_raw,
+        source=Source.PRICES,
+        params=params,
+        inputs=(mean_price_ratio_node(params=params.trend),),
+    )
+
+
+def median_price_macd_node(params: Acceleration) -> Node[Acceleration, nq.Float2D]:
+    return Node(
+        func=get_median_price_macd_raw,
+        source=Source.PRICES,
+        params=params,
+        inputs=(median_price_ratio_node(params=params.trend),),
+    )
+
+
+def central_price_macd_node(params: Acceleration) -> Node[Acceleration, nq.Float2D]:
+    return Node(
+        func=get_central_price_macd_raw,
+        source=Source.PRICES,
+        params=params,
+        inputs=(central_price_ratio_node(params=params.trend),),
+    )
+
+
+def mean_rate_of_change_macd_node(
+    params: Acceleration,
+) -> Node[Acceleration, nq.Float2D]:
+    return Node(
+        func=get_mean_rate_of_change_macd_raw,
+        source=Source.LOG_RETURNS,
+        params=params,
+        inputs=(mean_rate_of_change_node(params=params.trend),),
+    )
+
+
+def median_rate_of_change_macd_node(
+    params: Acceleration,
+) -> Node[Acceleration, nq.Float2D]:
+    return Node(
+        func=get_median_rate_of_change_macd_raw,
+        source=Source.LOG_RETURNS,
+        params=params,
+        inputs=(median_rate_of_change_node(params=params.trend),),
+    )
+
+
+def normalised_mean_price_ratio_node(
+    params: SmoothedSignal,
+) -> Node[SmoothedSignal, nq.Float2D]:
+    return Node(
+        func=get_normalised_mean_price_ratio_raw, source=Source.PRICES, params=params
+    )
+
+
+def normalised_mean_rate_of_change_node(
+    params: SmoothedSignal,
+) -> Node[SmoothedSignal, nq.Float2D]:
+    return Node(
+        func=get_normalised_mean_rate_of_change_raw,
+        source=Source.LOG_RETURNS,
+        params=params,
+    )
+
+
+def smoothed_moments_node(
+    params: SmoothedSignal,
+) -> Node[SmoothedSignal, nq.metrics.roll.RollingMoments]:
+    return Node(func=smoothed_moments, source=Source.LOG_RETURNS, params=params)
+
+
+def directional_volatility_node(
+    params: SmoothedSignal,
+) -> Node[SmoothedSignal, nq.Float2D]:
+    return Node(
+        func=smoothed_directional_volatility,
+        source=Source.LOG_RETURNS,
+        params=params,
     )
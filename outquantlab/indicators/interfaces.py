@@ -1,17 +1,26 @@
 from abc import ABC, abstractmethod
-from concurrent.futures import ThreadPoolExecutor
 from typing import Protocol, TypeAlias, Any
 
 import numquant as nq
 from itertools import product
 from dataclasses import dataclass
+from outquantlab.indicators.primitives import Node, RollingProvider, Source
 
 
 class AssetsData(Protocol):
-    prices: nq.Float2D
-    log_returns: nq.Float2D
-    pct_returns: nq.Float2D
-    adjusted_returns: nq.Float2D
+    rolling: RollingProvider
+
+    @property
+    def prices(self) -> nq.Float2D: ...
+
+    @property
+    def log_returns(self) -> nq.Float2D: ...
+
+    @property
+    def pct_returns(self) -> nq.Float2D: ...
+
+    @property
+    def adjusted_returns(self) -> nq.Float2D: ...
 
 
 @dataclass(slots=True)
@@ -27,6 +36,8 @@ class BaseParams(ABC):
 
 
 class BaseIndic[T: BaseParams](ABC):
+    discrete: bool = False
+
     def __init__(
         self,
         name: str,
@@ -63,25 +74,51 @@ class BaseIndic[T: BaseParams](ABC):
     def execute(self, data: AssetsData, params: T) -> nq.Float2D:
         raise NotImplementedError
 
+    def get_raw_signal(self, data: AssetsData, params: T) -> nq.Float2D:
+        return self.execute(data=data, params=params)
+
+    def get_nodes(self, params: T) -> list[Node[Any, Any]]:
+        return []
+
+    def get_inputs(self) -> set[Source]:
+        return {Source.ADJUSTED_RETURNS}.union(
+            *(
+                node.sources
+                for combo in self.combos
+                for node in self.get_nodes(params=combo)
+            )
+        )
+
+    def evaluate_nodes(self, data: AssetsData, params: T) -> list[Any]:
+        return [
+            data.rolling.evaluate(node=node, array=getattr(data, node.source))
+            for node in self.get_nodes(params=params)
+        ]
+
     @abstractmethod
     def _get_combo(self, combination: tuple[int, ...]) -> T:
         raise NotImplementedError
 
-    def process_params_parallel(
-        self,
-        data_arrays: AssetsData,
-        global_executor: ThreadPoolExecutor,
-    ) -> list[nq.Float2D]:
-        def process_single_param(param_tuple: T) -> nq.Float2D:
-            return (
-                self.normalize_signal(
-                    signal=self.execute(data=data_arrays, params=param_tuple),
-                    long_only=False,
-                )
-                * data_arrays.adjusted_returns
-            )
+    def get_compact_signal(self, data: AssetsData, params: T) -> nq.Sign2D:
+        return nq.metrics.roll.get_compact_sign(
+            signal_array=self.get_raw_signal(data=data, params=params)
+        )
 
-        return list(global_executor.map(process_single_param, self.combos))
+    def process_param(
+        self, data_arrays: AssetsData, params: T, output: nq.Float2D
+    ) -> None:
+        if self.discrete:
+            nq.metrics.roll.fill_sign_returns(
+                signal=self.get_compact_signal(data=data_arrays, params=params),
+                adjusted_returns=data_arrays.adjusted_returns,
+                output=output,
+            )
+            return
+        nq.metrics.roll.fill_normalized_returns(
+            raw_signal=self.execute(data=data_arrays, params=params),
+            adjusted_returns=data_arrays.adjusted_returns,
+            output=output,
+        )
 
     def normalize_signal(
         self, signal: nq.Float2D, long_only: bool
@@ -96,4 +133,17 @@ class BaseIndic[T: BaseParams](ABC):
         return f"name: {self.name} \n statut: {self.active} \n params:\n {self.params_values}"
 
 
+class DiscreteIndic[T: BaseParams](BaseIndic[T]):
+    discrete: bool = True
+
+    @abstractmethod
+    def get_raw_signal(self, data: AssetsData, params: T) -> nq.Float2D:
+        raise NotImplementedError
+
+    def execute(self, data: AssetsData, params: T) -> nq.Float2D:
+        return nq.metrics.roll.sign_normalization(
+            signal_array=self.get_raw_signal(data=data, params=params)
+        )
+
+
 GenericIndic: TypeAlias = BaseIndic[Any]
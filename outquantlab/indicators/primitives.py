@@ -0,0 +1,122 @@
+from collections.abc import Callable
+from enum import Enum, StrEnum, auto
+from typing import Any, NamedTuple, Protocol
+
+import numquant as nq
+
+type RollingFunc = Callable[[nq.Float2D, int, int], nq.Float2D]
+
+
+class Primitive(Enum):
+    MEAN = auto()
+    MEDIAN = auto()
+    MAX = auto()
+    MIN = auto()
+    SUM = auto()
+    CENTRAL = auto()
+
+
+class Source(StrEnum):
+    PRICES = "prices"
+    LOG_RETURNS = "log_returns"
+    ADJUSTED_RETURNS = "adjusted_returns"
+
+
+class NodeParams(Protocol):
+    values: tuple[int, ...]
+
+
+class NodeKey(NamedTuple):
+    func: Callable[..., Any]
+    source: Source
+    values: tuple[int, ...]
+
+
+class Node[P: NodeParams, R](NamedTuple):
+    func: Callable[[nq.Float2D, P, "RollingProvider"], R]
+    source: Source
+    params: P
+    inputs: tuple["Node[Any, Any]", ...] = ()
+
+    @property
+    def key(self) -> NodeKey:
+        return NodeKey(func=self.func, source=self.source, values=self.params.values)
+
+    @property
+    def sources(self) -> set[Source]:
+        return {self.source}.union(*(child.sources for child in self.inputs))
+
+
+ROLLING_MULTI: dict[Primitive, nq.metrics.roll.MultiRollingFunc] = {
+    Primitive.MEAN: nq.metrics.roll.get_mean_multi,
+    Primitive.SUM: nq.metrics.roll.get_sum_multi,
+}
+
+
+ROLLING_PRIMITIVES: dict[Primitive, RollingFunc] = {
+    Primitive.MEAN: nq.metrics.roll.get_mean,
+    Primitive.MEDIAN: nq.metrics.roll.get_median,
+    Primitive.MAX: nq.metrics.roll.get_max,
+    Primitive.MIN: nq.metrics.roll.get_min,
+    Primitive.SUM: nq.metrics.roll.get_sum,
+    Primitive.CENTRAL: nq.metrics.roll.get_central_point,
+}
+
+
+class RollingProvider(Protocol):
+    def get(
+        self, array: nq.Float2D, primitive: Primitive, length: int, min_length: int
+    ) -> nq.Float2D: ...
+
+    def get_multi(
+        self,
+        array: nq.Float2D,
+        primitive: Primitive,
+        lengths: list[int],
+        min_lengths: list[int],
+    ) -> list[nq.Float2D]: ...
+
+    def evaluate[P: NodeParams, R](self, node: Node[P, R], array: nq.Float2D) -> R: ...
+
+
+class DirectRolling:
+    def get(
+        self, array: nq.Float2D, primitive: Primitive, length: int, min_length: int
+    ) -> nq.Float2D:
+        return compute_rolling(
+            array=array, primitive=primitive, length=length, min_length=min_length
+        )
+
+    def get_multi(
+        self,
+        array: nq.Float2D,
+        primitive: Primitive,
+        lengths: list[int],
+        min_lengths: list[int],
+    ) -> list[nq.Float2D]:
+        return compute_multi(
+            array=array, primitive=primitive, lengths=lengths, min_lengths=min_lengths
+        )
+
+    def evaluate[P: NodeParams, R](self, node: Node[P, R], array: nq.Float2D) -> R:
+        return node.func(array, node.params, self)
+
+
+def compute_multi(
+    array: nq.Float2D, primitive: Primitive, lengths: list[int], min_lengths: list[int]
+) -> list[nq.Float2D]:
+    multi_func: nq.metrics.roll.MultiRollingFunc | None = ROLLING_MULTI.get(primitive)
+    if multi_func is not None:
+        return multi_func(array, lengths, min_lengths)
+    return [
+        ROLLING_PRIMITIVES[primitive](array, length, min_length)
+        for length, min_length in zip(lengths, min_lengths)
+    ]
+
+
+def compute_rolling(
+    array: nq.Float2D, primitive: Primitive, length: int, min_length: int
+) -> nq.Float2D:
+    return compute_multi(
+        array=array, primitive=primitive, lengths=[length], min_lengths=[min_length]
+    )[0]
@@ -1,37 +1,251 @@
+from pathlib import Path
+
+import polars as pl
+
 import numquant as nq
 import tradeframe as tf
-from outquantlab.backtest import Backtestor
+from outquantlab.backtest import (
+    Backtestor,
+    CancellationToken,
+    ClusterBacktestor,
+    CostModel,
+    Executor,
+    IncrementalBacktestor,
+    IncrementalState,
+    StreamingBacktestor,
+    ProfileReport,
+    Profiler,
+    ProgressCallback,
+    ResultCache,
+)
 from outquantlab.indicators import GenericIndic
 from outquantlab.portfolio import (
+    PRUNE_THRESHOLD,
+    AggregatedResults,
     BacktestResults,
+    PrunedResults,
+    WalkForward,
+    WalkForwardResults,
     get_categories_df,
     get_clusters,
+    prune_combos,
 )
 
 
 class OutQuantLab:
-    def __init__(self, indics: list[GenericIndic], returns_df: tf.FrameDated) -> None:
+    def __init__(
+        self,
+        indics: list[GenericIndic],
+        returns_df: tf.FrameDated,
+        profile: bool = False,
+        callbacks: list[ProgressCallback] | None = None,
+        token: CancellationToken | None = None,
+    ) -> None:
         self.indics: list[GenericIndic] = indics
         self.returns_df: tf.FrameDated = returns_df
+        self.profiler = Profiler(active=profile)
+        self.costs = CostModel()
+        self.callbacks: list[ProgressCallback] = callbacks or []
+        self.token: CancellationToken = token or CancellationToken()
+        self.owns_token: bool = token is None
 
-    def backtest(self, local: bool = True) -> nq.Float2D:
+    def add_callback(self, callback: ProgressCallback) -> None:
+        self.callbacks.append(callback)
+
+    def cancel(self) -> None:
+        self.token.cancel()
+
+    def backtest(
+        self,
+        local: bool = True,
+        executor: Executor = Executor.THREAD,
+        storage: Path | None = None,
+        results_path: Path | None = None,
+        costs_path: Path | None = None,
+        max_memory: int | None = None,
+    ) -> nq.Float2D:
+        pct_returns: nq.Float2D = self.returns_df.get_array()
+        if costs_path is not None and not self.costs.costs:
+            self.costs = CostModel.load(path=costs_path)
         process = Backtestor(
-            pct_returns=self.returns_df.get_array(), indics=self.indics, local=local
+            pct_returns=pct_returns,
+            indics=self.indics,
+            local=local,
+            executor=executor,
+            storage=storage,
+            results=(
+                None
+                if results_path is None
+                else ResultCache(
+                    path=results_path,
+                    pct_returns=pct_returns,
+                    asset_names=self.returns_df.get_names(),
+                )
+            ),
+            profiler=self.profiler,
+            callbacks=self.callbacks,
+            token=self._get_token(),
+            costs=self.costs,
+            max_memory=max_memory,
+        )
+        main_array: nq.Float2D = process.process_backtest()
+        if costs_path is not None:
+            self.costs.save(path=costs_path)
+        return main_array
+
+    def backtest_cluster(
+        self,
+        workers: int,
+        local: bool = True,
+        address: tuple[str, int] | None = None,
+        authkey: bytes | None = None,
+        spawn: bool = True,
+        costs_path: Path | None = None,
+    ) -> nq.Float2D:
+        if costs_path is not None and not self.costs.costs:
+            self.costs = CostModel.load(path=costs_path)
+        process = ClusterBacktestor(
+            pct_returns=self.returns_df.get_array(),
+            indics=self.indics,
+            local=local,
+            workers=workers,
+            address=address,
+            authkey=authkey,
+            spawn=spawn,
+            costs=self.costs,
+            callbacks=self.callbacks,
+            token=self._get_token(),
+        )
+        with self.profiler.stage(name="backtest"):
+            main_array: nq.Float2D = process.process_backtest()
+        if costs_path is not None:
+            self.costs.save(path=costs_path)
+        return main_array
+
+    def backtest_aggregated(
+        self, local: bool = True, results_path: Path | None = None
+    ) -> AggregatedResults:
+        pct_returns: nq.Float2D = self.returns_df.get_array()
+        process = StreamingBacktestor(
+            pct_returns=pct_returns,
+            indics=self.indics,
+            local=local,
+            results=(
+                None
+                if results_path is None
+                else ResultCache(
+                    path=results_path,
+                    pct_returns=pct_returns,
+                    asset_names=self.returns_df.get_names(),
+                )
+            ),
+            profiler=self.profiler,
+            callbacks=self.callbacks,
+            token=self._get_token(),
+            costs=self.costs,
         )
+        indics_array: nq.Float2D = process.process_backtest()
+        with self.profiler.stage(name="backtest_results"):
+            return AggregatedResults.create_from_indics(
+                data=indics_array,
+                dates=self.returns_df.index,
+                asset_names=self.returns_df.get_names(),
+                indics=self.indics,
+            )
 
+    def backtest_incremental(
+        self, local: bool = True
+    ) -> tuple[nq.Float2D, IncrementalState]:
+        process = IncrementalBacktestor(
+            pct_returns=self.returns_df.get_array(),
+            indics=self.indics,
+            local=local,
+            profiler=self.profiler,
+            callbacks=self.callbacks,
+            token=self._get_token(),
+        )
         return process.process_backtest()
 
-    def format_backtest(self, data: nq.Float2D) -> tf.FrameCategoricalDated:
-        return tf.FrameCategoricalDated.create_from_np(
+    def extend_backtest(
+        self, data: nq.Float2D, state: IncrementalState, local: bool = True
+    ) -> nq.Float2D:
+        process = IncrementalBacktestor(
+            pct_returns=self.returns_df.get_array(),
+            indics=self.indics,
+            local=local,
+            profiler=self.profiler,
+            callbacks=self.callbacks,
+            token=self._get_token(),
+        )
+        new_rows: nq.Float2D = process.process_increment(state=state)
+        return nq.arrays.concatenate(top=data, bottom=new_rows)
+
+    def format_backtest(
+        self, data: nq.Float2D, categories: pl.DataFrame | None = None
+    ) -> tf.FrameCategoricalDated:
+        with self.profiler.stage(name="format_backtest"):
+            return tf.FrameCategoricalDated.create_from_np(
+                data=data,
+                dates=self.returns_df.index,
+                categories=(
+                    get_categories_df(
+                        asset_names=self.returns_df.get_names(), indics=self.indics
+                    )
+                    if categories is None
+                    else categories
+                ),
+            )
+
+    def prune_backtest(
+        self, data: nq.Float2D, threshold: float = PRUNE_THRESHOLD
+    ) -> PrunedResults:
+        with self.profiler.stage(name="prune_backtest"):
+            return prune_combos(
+                data=data,
+                asset_names=self.returns_df.get_names(),
+                indics=self.indics,
+                threshold=threshold,
+            )
+
+    def get_portfolio(self, data: tf.FrameCategoricalDated) -> BacktestResults:
+        with self.profiler.stage(name="backtest_results"):
+            return BacktestResults(params=data)
+
+    def get_profile(self) -> ProfileReport:
+        return self.profiler.stop()
+
+    def aggregate_backtest(self, data: nq.Float2D) -> AggregatedResults:
+        return AggregatedResults.create_from_blocks(
             data=data,
             dates=self.returns_df.index,
-            categories=get_categories_df(
-                asset_names=self.returns_df.get_names(), indics=self.indics
-            ),
+            asset_names=self.returns_df.get_names(),
+            indics=self.indics,
         )
 
-    def get_portfolio(self, data: tf.FrameCategoricalDated) -> BacktestResults:
-        return BacktestResults(params=data)
+    def walk_forward(
+        self,
+        data: nq.Float2D,
+        train: int,
+        test: int,
+        top: int = 1,
+        anchored: bool = False,
+    ) -> WalkForwardResults:
+        with self.profiler.stage(name="walk_forward"):
+            return WalkForward(
+                data=data,
+                categories=get_categories_df(
+                    asset_names=self.returns_df.get_names(), indics=self.indics
+                ),
+                train=train,
+                test=test,
+                top=top,
+                anchored=anchored,
+            ).process(dates=self.returns_df.index)
+
+    def _get_token(self) -> CancellationToken:
+        if self.owns_token:
+            self.token = CancellationToken()
+        return self.token
 
     def get_clusters(self, data: tf.FrameDated) -> dict[str, list[str]]:
         clean_df: tf.FrameDated = data.clean_nans(total=True)
@@ -2,9 +2,19 @@ from outquantlab.portfolio.dynamic_clusters import get_clusters
 from outquantlab.portfolio.structures import get_categories, get_categories_df
 from outquantlab.portfolio.static_clusters import Asset
 from outquantlab.portfolio.main import BacktestResults
+from outquantlab.portfolio.blocks import AggregatedResults
+from outquantlab.portfolio.pruning import PRUNE_THRESHOLD, PrunedResults, prune_combos
+from outquantlab.portfolio.walk_forward import Fold, WalkForward, WalkForwardResults
 
 __all__: list[str] = [
     "BacktestResults",
+    "AggregatedResults",
+    "PRUNE_THRESHOLD",
+    "PrunedResults",
+    "prune_combos",
+    "Fold",
+    "WalkForward",
+    "WalkForwardResults",
     "Asset",
     "get_clusters",
     "get_categories",
@@ -0,0 +1,93 @@
+from dataclasses import dataclass
+
+import polars as pl
+
+import numquant as nq
+import tradeframe as tf
+from outquantlab.indicators import GenericIndic
+
+BLOCK_COLUMNS: int = 8192
+
+
+@dataclass(slots=True)
+class AggregatedResults:
+    indics: tf.FrameDated
+    assets: tf.FrameDated
+    portfolio: tf.SeriesDated
+
+    @classmethod
+    def create_from_blocks(
+        cls,
+        data: nq.Float2D,
+        dates: pl.Series,
+        asset_names: list[str],
+        indics: list[GenericIndic],
+        block_columns: int = BLOCK_COLUMNS,
+    ) -> "AggregatedResults":
+        assets: int = len(asset_names)
+        indics_array: nq.Float2D = nq.arrays.create_empty(
+            length=data.shape[0], width=len(indics) * assets
+        )
+        start: int = 0
+        for i, indic in enumerate(indics):
+            end: int = start + indic.quantity * assets
+            indics_array[:, i * assets : (i + 1) * assets] = get_blocks_mean(
+                data=data[:, start:end], groups=assets, block_columns=block_columns
+            )
+            start = end
+        return cls.create_from_indics(
+            data=indics_array,
+            dates=dates,
+            asset_names=asset_names,
+            indics=indics,
+            block_columns=block_columns,
+        )
+
+    @classmethod
+    def create_from_indics(
+        cls,
+        data: nq.Float2D,
+        dates: pl.Series,
+        asset_names: list[str],
+        indics: list[GenericIndic],
+        block_columns: int = BLOCK_COLUMNS,
+    ) -> "AggregatedResults":
+        assets: int = len(asset_names)
+        assets_array: nq.Float2D = get_blocks_mean(
+            data=data, groups=assets, block_columns=block_columns
+        )
+        portfolio_array: nq.Float2D = get_blocks_mean(
+            data=assets_array, groups=1, block_columns=block_columns
+        )
+        return cls(
+            indics=tf.FrameDated.create_from_np(
+                data=data,
+                asset_names=[
+                    f"{asset_name}_{indic.name}"
+                    for indic in indics
+                    for asset_name in asset_names
+                ],
+                dates=dates,
+            ),
+            assets=tf.FrameDated.create_from_np(
+                data=assets_array, asset_names=asset_names, dates=dates
+            ),
+            portfolio=tf.SeriesDated.create_from_np(
+                data=portfolio_array[:, 0], index=dates
+            ),
+        )
+
+
+def get_blocks_mean(data: nq.Float2D, groups: int, block_columns: int) -> nq.Float2D:
+    sums: nq.NPArray = nq.metrics.agg.create_accumulator(
+        length=data.shape[0], width=groups
+    )
+    counts: nq.NPArray = nq.metrics.agg.create_accumulator(
+        length=data.shape[0], width=groups
+    )
+    step: int = max(block_columns // groups, 1) * groups
+    for start in range(0, data.shape[1], step):
+        nq.metrics.agg.accumulate_groups(
+            block=data[:, start : start + step], sums=sums, counts=counts
+        )
+    return nq.metrics.agg.get_grouped_mean(sums=sums, counts=counts)
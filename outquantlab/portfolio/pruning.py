@@ -0,0 +1,72 @@
+from dataclasses import dataclass
+
+import polars as pl
+
+import numquant as nq
+from outquantlab.indicators import GenericIndic
+from outquantlab.portfolio.structures import get_categories_df
+
+PRUNE_THRESHOLD: float = 0.95
+
+
+@dataclass(slots=True)
+class PrunedResults:
+    data: nq.Float2D
+    categories: pl.DataFrame
+    merged: dict[str, list[str]]
+
+    @property
+    def removed(self) -> int:
+        return sum(len(names) for names in self.merged.values())
+
+    def __str__(self) -> str:
+        return (
+            f"Pruned Combos:\n"
+            f"  Kept: {self.data.shape[1]}\n"
+            f"  Merged: {self.removed}\n"
+        )
+
+
+def prune_combos(
+    data: nq.Float2D,
+    asset_names: list[str],
+    indics: list[GenericIndic],
+    threshold: float = PRUNE_THRESHOLD,
+) -> PrunedResults:
+    assets: int = len(asset_names)
+    kept: list[int] = []
+    merged: dict[str, list[str]] = {}
+    start: int = 0
+    for indic in indics:
+        names: list[str] = indic.get_combo_names()
+        end: int = start + indic.quantity * assets
+        for asset_index, asset_name in enumerate(asset_names):
+            representatives: nq.Int1D = nq.metrics.agg.get_representatives(
+                corr_matrix=nq.metrics.agg.get_blocked_correlation_matrix(
+                    returns_array=data[:, start + asset_index : end : assets]
+                ),
+                threshold=threshold,
+            )
+            for combo, representative in enumerate(representatives):
+                if combo == representative:
+                    kept.append(start + combo * assets + asset_index)
+                    continue
+                merged.setdefault(
+                    get_column_name(
+                        asset=asset_name, indic=indic, combo=names[representative]
+                    ),
+                    [],
+                ).append(
+                    get_column_name(asset=asset_name, indic=indic, combo=names[combo])
+                )
+        start = end
+    kept.sort()
+    return PrunedResults(
+        data=data[:, kept],
+        categories=get_categories_df(asset_names=asset_names, indics=indics)[kept],
+        merged=merged,
+    )
+
+
+def get_column_name(asset: str, indic: GenericIndic, combo: str) -> str:
+    return f"{asset}_{indic.name}_{combo}"
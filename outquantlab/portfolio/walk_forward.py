@@ -0,0 +1,122 @@
+from dataclasses import dataclass
+from typing import NamedTuple
+
+import polars as pl
+
+import numquant as nq
+import tradeframe as tf
+
+SELECTION_LEVELS: list[str] = ["assets", "indics"]
+
+
+class Fold(NamedTuple):
+    train_start: int
+    train_end: int
+    test_start: int
+    test_end: int
+    columns: nq.Int1D
+    train_sharpe: float
+
+    def __str__(self) -> str:
+        return (
+            f"Fold [{self.train_start}:{self.train_end}] -> "
+            f"[{self.test_start}:{self.test_end}]: "
+            f"{self.columns.size} selected, "
+            f"in-sample sharpe {self.train_sharpe:.2f}"
+        )
+
+
+@dataclass(slots=True)
+class WalkForwardResults:
+    portfolio: tf.SeriesDated
+    folds: list[Fold]
+
+    def get_selected_names(
+        self, categories: pl.DataFrame, fold: int
+    ) -> list[str]:
+        return (
+            categories[self.folds[fold].columns]
+            .select(pl.concat_str(pl.all(), separator="_"))
+            .to_series()
+            .to_list()
+        )
+
+
+class WalkForward:
+    def __init__(
+        self,
+        data: nq.Float2D,
+        categories: pl.DataFrame,
+        train: int,
+        test: int,
+        top: int = 1,
+        anchored: bool = False,
+        levels: list[str] = SELECTION_LEVELS,
+    ) -> None:
+        if test <= 0 or train < test or train % test != 0:
+            raise ValueError(
+                f"train ({train}) must be a positive multiple of test ({test})"
+            )
+        if top <= 0:
+            raise ValueError(f"top must be positive, got {top}")
+        self.data: nq.Float2D = data
+        self.train: int = train
+        self.test: int = test
+        self.top: int = top
+        self.anchored: bool = anchored
+        self.groups: nq.Int1D = get_groups(categories=categories, levels=levels)
+
+    def process(self, dates: pl.Series) -> WalkForwardResults:
+        moments: nq.metrics.agg.BlockMoments = nq.metrics.agg.get_block_moments(
+            array=self.data, block=self.test
+        )
+        portfolio: nq.Float1D = nq.arrays.create_nan(
+            length=self.data.shape[0], width=1
+        )[:, 0]
+        folds: list[Fold] = [
+            self._process_fold(moments=moments, index=index, portfolio=portfolio)
+            for index in range(self.train // self.test, moments.blocks)
+        ]
+        return WalkForwardResults(
+            portfolio=tf.SeriesDated.create_from_np(
+                data=portfolio.reshape(-1, 1), index=dates
+            ),
+            folds=folds,
+        )
+
+    def _process_fold(
+        self,
+        moments: nq.metrics.agg.BlockMoments,
+        index: int,
+        portfolio: nq.Float1D,
+    ) -> Fold:
+        start: int = 0 if self.anchored else index - self.train // self.test
+        scores: nq.Float1D = nq.metrics.agg.get_window_sharpe(
+            moments=moments, start=start, end=index
+        )
+        columns: nq.Int1D = nq.metrics.agg.select_top_in_groups(
+            scores=scores, groups=self.groups, top=self.top
+        )
+        test_start: int = index * self.test
+        test_end: int = min(test_start + self.test, self.data.shape[0])
+        portfolio[test_start:test_end] = nq.metrics.agg.get_selected_mean(
+            array=self.data, columns=columns, start=test_start, end=test_end
+        )
+        return Fold(
+            train_start=start * self.test,
+            train_end=test_start,
+            test_start=test_start,
+            test_end=test_end,
+            columns=columns,
+            train_sharpe=float(nq.metrics.agg.get_mean(array=scores[columns])),
+        )
+
+
+def get_groups(categories: pl.DataFrame, levels: list[str]) -> nq.Int1D:
+    return (
+        categories.select(
+            (pl.concat_str(levels, separator="_").rank("dense") - 1).cast(pl.Int32)
+        )
+        .to_series()
+        .to_numpy()
+    )
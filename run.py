@@ -8,7 +8,14 @@ def internal_use() -> None:
         indics=config.indics_config.get_indics_params(),
         returns_df=dbp.get_returns_data(app_config=config, new_data=False),
     )
-    results: oql.BacktestResults = lab.get_portfolio(data=lab.format_backtest(lab.backtest()))
+    results: oql.BacktestResults = lab.get_portfolio(
+        data=lab.format_backtest(
+            lab.backtest(
+                results_path=dbp.get_results_path(),
+                costs_path=dbp.get_costs_path(),
+            )
+        )
+    )
     stats = oql.Stats()
     stats.equity.plot(data=results.assets, frequency=1)
 
@@ -16,13 +23,21 @@ def internal_use() -> None:
 def server_use() -> None:
     dbp = oql.DataBaseProvider(db_name="data")
     config: oql.AppConfig = dbp.get_app_config()
+    returns_df = dbp.get_returns_data(app_config=config, new_data=False)
     lab = oql.OutQuantLab(
         indics=config.indics_config.get_indics_params(),
-        returns_df=dbp.get_returns_data(app_config=config, new_data=False),
+        returns_df=returns_df,
+    )
+    results: oql.BacktestResults = lab.get_portfolio(
+        data=lab.format_backtest(
+            lab.backtest(
+                results_path=dbp.get_results_path(),
+                costs_path=dbp.get_costs_path(),
+            )
+        )
     )
-    results: oql.BacktestResults = lab.get_portfolio(data=lab.format_backtest(lab.backtest()))
     stats = oql.Stats()
-    oql_server = oql.apis.LabServer()
+    oql_server = oql.apis.LabServer(returns_df=returns_df)
     oql_server.store_result(
         data=stats.equity.get_formatted_data(data=results.assets, frequency=20)
     )
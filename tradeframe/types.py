@@ -37,7 +37,7 @@ class SeriesConfig:
 
     def get_data(self, array: nq.Float2D) -> pl.Series:
         return pl.Series(
-            name=self.values_col, values=array, dtype=self.values_type
+            name=self.values_col, values=array.reshape(-1), dtype=self.values_type
         ).fill_nan(value=None)
 
     def create(self, data: pl.Series, index: pl.Series) -> pl.DataFrame: